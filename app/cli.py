@@ -3,18 +3,30 @@
 from __future__ import annotations
 
 import argparse
-from typing import List
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
 from core.config import load_config
 from core.runtime import get_env
-from domain.models import CandidateProfile, JobQuery
+from crawling.fetch_archive import FetchArchive
+from crawling.fetch_strategy import StrategyFetcher
+from crawling.html_cache import HtmlCache
+from crawling.playwright_client import PlaywrightClient
+from crawling.rate_limiter import RateLimiter
+from crawling.site_registry import detect_site
+from domain.models import CandidateProfile, JobListing, JobPosting, JobQuery
 from pipeline.job_ingest_pipeline import (
     collect_job_listings,
     fetch_job_html,
+    fetch_jobs_html,
     ingest_jobs,
     parse_job,
 )
+from pipeline.worker_pool import WorkerOptions, run_workers
 from llm.optimize_documents import optimize_documents
+from storage.crawl_frontier import DISCOVERED, FAILED, FETCHED, OPTIMIZED, PARSED, CrawlFrontier
 
 
 def parse_args() -> argparse.Namespace:
@@ -44,6 +56,95 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Fetch job pages and output optimized keywords",
     )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=1,
+        help="Number of warm browser contexts shared by all fetches",
+    )
+    parser.add_argument(
+        "--page-recycle",
+        type=int,
+        default=25,
+        help="Replace a pooled page after this many navigations",
+    )
+    parser.add_argument(
+        "--context-recycle",
+        type=int,
+        default=200,
+        help="Replace a pooled browser context after this many navigations",
+    )
+    parser.add_argument(
+        "--max-browser-rss-mb",
+        type=float,
+        default=float(get_env("MAX_BROWSER_RSS_MB") or 0) or None,
+        help="Relaunch the pooled browser when its processes exceed this RSS",
+    )
+    parser.add_argument(
+        "--block-resources",
+        action="store_true",
+        help="Skip each site's configured images, fonts, media and tracker requests",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (each with its own browser) for --optimize",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Job pages fetched in parallel with --optimize by a separate async browser (1 = sequential)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=get_env("HTML_CACHE_DIR") or ".html_cache",
+        help="Directory of the on-disk HTML cache",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=12.0,
+        help="Hours before a cached job page is refetched (search pages are never cached)",
+    )
+    cache_mode = parser.add_mutually_exclusive_group()
+    cache_mode.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the HTML cache (neither read nor write)",
+    )
+    cache_mode.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Refetch every page and overwrite cached copies",
+    )
+    parser.add_argument(
+        "--frontier",
+        default=get_env("CRAWL_FRONTIER_PATH") or None,
+        help="SQLite file recording processed job URLs; enables incremental runs",
+    )
+    parser.add_argument(
+        "--refresh-days",
+        type=float,
+        help="With --frontier, reprocess jobs last completed more than N days ago",
+    )
+    archive_mode = parser.add_mutually_exclusive_group()
+    archive_mode.add_argument(
+        "--record-archive",
+        metavar="DIR",
+        help="Record every browser response of this run into DIR (HAR files)",
+    )
+    archive_mode.add_argument(
+        "--replay-archive",
+        metavar="DIR",
+        help="Serve every page from a recorded archive; no network access",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print collection and fetch durations to stderr",
+    )
     parser.add_argument("--profile-summary", help="Candidate summary text")
     parser.add_argument("--profile-skills", help="Comma-separated skills")
     parser.add_argument("--profile-experiences", help="Comma-separated experiences")
@@ -74,7 +175,44 @@ def run() -> int:
             print(item.url)
         return 0
 
-    listings = collect_job_listings(query, limit=args.limit)
+    archive = _build_archive(args)
+    client = PlaywrightClient(
+        pool_size=args.pool_size,
+        max_page_navigations=args.page_recycle,
+        max_context_navigations=args.context_recycle,
+        max_rss_mb=args.max_browser_rss_mb,
+        block_resources=args.block_resources,
+        cache=_build_cache(args, archive),
+        # Replayed responses need no politeness delays; timings stay comparable.
+        rate_limiter=RateLimiter(enabled=not (archive and archive.mode == "replay")),
+        archive=archive,
+    )
+    frontier = CrawlFrontier(Path(args.frontier)) if args.frontier else None
+    try:
+        with client:
+            return _crawl(args, query, client, frontier)
+    finally:
+        if frontier is not None:
+            frontier.close()
+
+
+def _crawl(
+    args: argparse.Namespace,
+    query: JobQuery,
+    client: PlaywrightClient,
+    frontier: Optional[CrawlFrontier],
+) -> int:
+    started = time.perf_counter()
+    listings = collect_job_listings(
+        query,
+        limit=args.limit,
+        client=client,
+        frontier=frontier,
+        target_state=OPTIMIZED if args.optimize else DISCOVERED,
+        max_age_s=args.refresh_days * 86400 if args.refresh_days else None,
+    )
+    if args.timings:
+        print(f"collected {len(listings)} listings in {time.perf_counter() - started:.2f}s", file=sys.stderr)
     if not listings:
         print("No job listings found from search pages.")
         print("Search URLs:")
@@ -96,16 +234,130 @@ def run() -> int:
     cv_text = _read_pdf_text(args.cv_path or get_env("CV_PATH"))
     motivation_text = _read_pdf_text(args.motivation_path or get_env("MOTIVATION_LETTER_PATH"))
 
-    for item in listings:
-        html = fetch_job_html(item)
-        posting = parse_job(html, None)
-        optimized = optimize_documents(profile, posting, cv_text=cv_text, motivation_letter=motivation_text)
+    pool_metrics = client.metrics()
+    if args.workers > 1 or args.concurrency > 1:
+        # Detail pages go to worker or async-engine browsers; do not keep
+        # the search-page pool's Chromium alive next to them.
+        client.close()
+
+    started = time.perf_counter()
+    for item, posting, error in _iter_job_postings(listings, client, args, frontier):
+        if error:
+            _mark(frontier, item.url, FAILED, error)
+            print(f"Failed to process {item.url}: {error}", file=sys.stderr)
+            continue
+        _mark(frontier, item.url, PARSED)
+        try:
+            optimized = optimize_documents(profile, posting, cv_text=cv_text, motivation_letter=motivation_text)
+        except Exception as exc:
+            _mark(frontier, item.url, FAILED, f"{type(exc).__name__}: {exc}")
+            print(f"Failed to process {item.url}: {exc}", file=sys.stderr)
+            continue
+        _mark(frontier, item.url, OPTIMIZED)
         keywords = ", ".join(optimized.optimized_keywords) if optimized.optimized_keywords else ""
         print(f"{item.url}\t{keywords}")
 
+    if args.timings:
+        print(f"processed {len(listings)} job pages in {time.perf_counter() - started:.2f}s", file=sys.stderr)
+        print(f"browser pool: {client.metrics() if client.is_open else pool_metrics}", file=sys.stderr)
     return 0
 
 
+def _iter_job_postings(
+    listings: List[JobListing],
+    client: PlaywrightClient,
+    args: argparse.Namespace,
+    frontier: Optional[CrawlFrontier],
+) -> Iterator[Tuple[JobListing, Optional[JobPosting], Optional[str]]]:
+    if args.workers > 1:
+        results = run_workers(listings, workers=args.workers, options=_worker_options(args, client))
+        for result in results:
+            if result.fetched:
+                _mark(frontier, result.listing.url, FETCHED)
+            yield result.listing, result.posting, result.error
+        return
+    for item, html, error in _iter_job_pages(listings, client, args.concurrency):
+        if error:
+            yield item, None, f"fetch failed: {error}"
+            continue
+        _mark(frontier, item.url, FETCHED)
+        try:
+            posting = parse_job(html, detect_site(item.url))
+        except Exception as exc:
+            yield item, None, f"parse failed: {type(exc).__name__}: {exc}"
+            continue
+        yield item, posting, None
+
+
+def _worker_options(args: argparse.Namespace, client: PlaywrightClient) -> WorkerOptions:
+    cache, archive = client.cache, client.archive
+    return WorkerOptions(
+        headless=client.headless,
+        timeout_ms=client.timeout_ms,
+        max_page_navigations=client.max_page_navigations,
+        max_context_navigations=client.max_context_navigations,
+        max_rss_mb=client.max_rss_mb,
+        block_resources=client.block_resources,
+        cache_dir=str(cache.root) if cache is not None else None,
+        cache_ttl_s=cache.ttl_seconds if cache is not None else 12 * 3600,
+        cache_mode=cache.mode if cache is not None else "use",
+        archive_dir=str(archive.root) if archive is not None else None,
+        archive_mode=archive.mode if archive is not None else "replay",
+        rate_limiting=client.rate_limiter.enabled,
+        rate_scale=client.rate_limiter.rate_scale / args.workers,
+    )
+
+
+def _iter_job_pages(
+    listings: List[JobListing],
+    client: PlaywrightClient,
+    concurrency: int,
+) -> Iterator[Tuple[JobListing, str, Optional[str]]]:
+    if concurrency <= 1:
+        fetcher = StrategyFetcher(client=client)
+        try:
+            for item in listings:
+                try:
+                    yield item, fetch_job_html(item, fetcher=fetcher), None
+                except Exception as exc:
+                    yield item, "", f"{type(exc).__name__}: {exc}"
+        finally:
+            fetcher.close()
+        return
+    results = fetch_jobs_html(
+        listings,
+        max_concurrency=concurrency,
+        cache=client.cache,
+        rate_limiter=client.rate_limiter,
+        archive=client.archive,
+        readiness=client.readiness,
+        block_resources=client.block_resources,
+    )
+    for result in results:
+        yield result.listing, result.html, result.error
+
+
+def _mark(frontier: Optional[CrawlFrontier], url: str, state: str, error: Optional[str] = None) -> None:
+    if frontier is not None:
+        frontier.mark(url, state, error)
+
+
+def _build_cache(args: argparse.Namespace, archive: Optional[FetchArchive] = None) -> HtmlCache:
+    # Cache hits would skip the browser, leaving holes in a recording and
+    # hiding fetch cost from a replay, so archives always bypass the cache.
+    bypass = args.no_cache or archive is not None
+    mode = "bypass" if bypass else "refresh" if args.refresh_cache else "use"
+    return HtmlCache(root=Path(args.cache_dir), ttl_seconds=args.cache_ttl * 3600, mode=mode)
+
+
+def _build_archive(args: argparse.Namespace) -> Optional[FetchArchive]:
+    if args.record_archive:
+        return FetchArchive(root=Path(args.record_archive), mode="record")
+    if args.replay_archive:
+        return FetchArchive(root=Path(args.replay_archive), mode="replay")
+    return None
+
+
 def _split_list(value: str) -> List[str]:
     return [part.strip() for part in value.split(",") if part and part.strip()]
 
@@ -0,0 +1,84 @@
+"""Benchmark keyword block scoring against per-node text extraction.
+
+Usage:
+  python bench_keyword_extraction.py
+  python bench_keyword_extraction.py saved_page.html --keywords python,sql --repeat 5
+
+Without an input file, a deeply nested SPA-style page is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from parsing.backends import available_backends, parse_html
+from parsing.keyword_matcher import compile_keywords
+from parsing.parsed_page import ParsedPage
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark extract_description_by_keywords scoring.")
+    parser.add_argument("input", nargs="?", help="Saved HTML file (default: generated nested page)")
+    parser.add_argument("--keywords", default="python,sql,aufgaben,profil", help="Comma-separated keywords")
+    parser.add_argument("--depth", type=int, default=200, help="Nesting depth of the generated page")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    return parser.parse_args()
+
+
+def nested_page(depth: int, paragraphs: int = 20) -> str:
+    """A SPA-like page: content wrapped in `depth` nested divs, each with some text."""
+
+    opening = "".join(f'<div class="l{i}"><span>Layer {i} python</span>' for i in range(depth))
+    content = "".join(f"<p>Aufgaben {i}: Python, SQL und Cloud. Ihr Profil passt.</p>" for i in range(paragraphs))
+    return f"<html><body>{opening}{content}{'</div>' * depth}</body></html>"
+
+
+def per_node_scoring(html: str, keywords: List[str], backend: str) -> str:
+    """The previous implementation: extract and lower-case the text of every block."""
+
+    best_text = ""
+    best_score = 0
+    for node in parse_html(html, backend).select("main, section, article, div"):
+        text = " ".join(node.text(" ").split())
+        if not text:
+            continue
+        lowered = text.lower()
+        score = sum(1 for kw in keywords if kw in lowered)
+        if score > best_score:
+            best_score = score
+            best_text = text
+    return best_text
+
+
+def single_pass_scoring(html: str, keywords: List[str], backend: str) -> str:
+    return ParsedPage(html, backend).block_index.best_block(compile_keywords(tuple(keywords)))
+
+
+def _time(func: Callable[[], str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> int:
+    args = parse_args()
+    html = Path(args.input).read_text(encoding="utf-8", errors="ignore") if args.input else nested_page(args.depth)
+    keywords = [kw.strip().lower() for kw in args.keywords.split(",") if kw.strip()]
+    print(f"page: {len(html)} chars, keywords: {len(keywords)}")
+    for backend in available_backends():
+        expected = per_node_scoring(html, keywords, backend)
+        if single_pass_scoring(html, keywords, backend) != expected:
+            print(f"{backend}: results differ")
+            return 1
+        before = _time(lambda: per_node_scoring(html, keywords, backend), args.repeat)
+        after = _time(lambda: single_pass_scoring(html, keywords, backend), args.repeat)
+        print(f"{backend:12} per-node {before * 1000:9.1f} ms  single-pass {after * 1000:8.1f} ms  x{before / after:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
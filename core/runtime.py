@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Awaitable, TypeVar
+from typing import AsyncIterator, Awaitable, Callable, Iterator, TypeVar
 
 import asyncio
 import os
+import queue
+import threading
 
 
 T = TypeVar("T")
@@ -30,3 +32,45 @@ def run_async(coro: Awaitable[T]) -> T:
         raise RuntimeError("Async execution requires a non-running event loop.")
 
     return asyncio.run(coro)
+
+
+def iter_async(factory: Callable[[], AsyncIterator[T]]) -> Iterator[T]:
+    """Consume an async iterator from sync code, yielding items as they arrive.
+
+    The iterator runs on its own event loop in a background thread so callers
+    can process early results while later ones are still in flight. Closing
+    the generator early stops the producer after its next item.
+    """
+
+    items: "queue.Queue[tuple]" = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    async def _pump() -> None:
+        source = factory()
+        try:
+            async for item in source:
+                items.put((True, item))
+                if stop.is_set():
+                    break
+        except BaseException as exc:  # propagate to the consuming thread
+            items.put((False, exc))
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            items.put((True, done))
+
+    worker = threading.Thread(target=lambda: asyncio.run(_pump()), daemon=True)
+    worker.start()
+    try:
+        while True:
+            ok, item = items.get()
+            if item is done:
+                break
+            if not ok:
+                raise item
+            yield item
+    finally:
+        stop.set()
+        worker.join()
@@ -0,0 +1,238 @@
+"""Concurrent HTML fetching on top of `playwright.async_api`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional
+from urllib.parse import urljoin
+
+from .fetch_archive import FetchArchive
+from .fetch_strategy import STRATEGY_BROWSER, STRATEGY_HTTP_FIRST, FetchStrategyStats, fetch_static_html
+from .http_fetcher import HttpFetcher
+from .html_cache import HtmlCache
+from .playwright_client import iframe_cache_options, page_cache_options, scrape_linkedin_job
+from .rate_limiter import RateLimiter
+from .readiness import ReadinessTracker, wait_for_jobposting_async
+from .resource_blocking import BlockingStats, make_async_route_handler, policy_for_site
+from .site_registry import EXTRACT_LINKEDIN, SiteConfig, detect_site
+
+if TYPE_CHECKING:
+    from domain.models import JobListing
+
+
+@dataclass(frozen=True)
+class FetchResult:
+    """Outcome of fetching one listing."""
+
+    listing: "JobListing"
+    html: str = ""
+    error: Optional[str] = None
+    elapsed_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class AsyncFetchEngine:
+    """Fetch many listings concurrently with global and per-site caps.
+
+    Per-site caps come from `SiteConfig.max_concurrency`; listings for unknown
+    sites share `default_site_concurrency` slots. `http-first` sites try a
+    plain GET in a worker thread before opening a page. Every network
+    request waits on the shared per-host `rate_limiter`. With an `archive`,
+    every page (LinkedIn included) is rendered in the recording or
+    replaying browser context. `block_resources` applies each site's
+    `ResourcePolicy`, as in `PlaywrightClient`.
+    """
+
+    max_concurrency: int = 4
+    default_site_concurrency: int = 2
+    timeout_ms: int = 20000
+    headless: bool = True
+    block_resources: bool = False
+    blocking_stats: BlockingStats = field(default_factory=BlockingStats)
+    http: HttpFetcher = field(default_factory=HttpFetcher)
+    strategy_stats: FetchStrategyStats = field(default_factory=FetchStrategyStats)
+    cache: Optional[HtmlCache] = None
+    rate_limiter: RateLimiter = field(default_factory=RateLimiter)
+    archive: Optional[FetchArchive] = None
+    readiness: ReadinessTracker = field(default_factory=ReadinessTracker)
+    _site_limits: Dict[str, asyncio.Semaphore] = field(default_factory=dict, init=False, repr=False)
+
+    async def fetch_many(self, listings: Iterable["JobListing"]) -> AsyncIterator[FetchResult]:
+        """Fetch listings concurrently and yield results as they complete.
+
+        Args:
+            listings: JobListing objects to fetch.
+
+        Yields:
+            FetchResult: One result per listing, in completion order. Failures
+            are reported on the result instead of being raised.
+        """
+
+        batch = list(listings)
+        if not batch:
+            return
+        if self.max_concurrency < 1:
+            raise ValueError("AsyncFetchEngine.max_concurrency must be at least 1.")
+
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        self._site_limits = {}
+        try:
+            async with self._browser_context() as context:
+                tasks = [
+                    asyncio.create_task(self._fetch_limited(context, listing, global_limit))
+                    for listing in batch
+                ]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        yield await next_done
+                finally:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self.http.close()
+
+    async def _fetch_limited(
+        self,
+        context,
+        listing: "JobListing",
+        global_limit: asyncio.Semaphore,
+    ) -> FetchResult:
+        site = detect_site(listing.url)
+        started = time.perf_counter()
+        # Take the site slot first so a blocked site never holds a global slot.
+        async with self._site_limit(site):
+            async with global_limit:
+                try:
+                    html = await self._fetch_one(context, listing.url, site)
+                except Exception as exc:
+                    return FetchResult(
+                        listing=listing,
+                        error=f"{type(exc).__name__}: {exc}",
+                        elapsed_s=time.perf_counter() - started,
+                    )
+        return FetchResult(listing=listing, html=html, elapsed_s=time.perf_counter() - started)
+
+    async def _fetch_one(self, context, url: str, site: Optional[SiteConfig]) -> str:
+        if site and site.fetch_strategy == STRATEGY_HTTP_FIRST and self.archive is None:
+            html = await asyncio.to_thread(
+                fetch_static_html,
+                self.http,
+                url,
+                site,
+                self.strategy_stats,
+                self.cache,
+                self.rate_limiter,
+            )
+            if html is not None:
+                return html
+
+        if site and site.follow_iframe:
+            options = iframe_cache_options(site.iframe_selector)
+        else:
+            options = page_cache_options(None, site.wait_jobposting if site else False)
+        if self.cache is not None:
+            cached = self.cache.get(url, options)
+            if cached is not None:
+                return cached
+
+        self.strategy_stats.record(site.name if site else "unknown", STRATEGY_BROWSER)
+        if site and site.extraction == EXTRACT_LINKEDIN and self.archive is None:
+            await self.rate_limiter.acquire_async(url)
+            try:
+                html = await scrape_linkedin_job(url, headless=self.headless)
+            except Exception as exc:
+                self.rate_limiter.record_failure(url, exc)
+                raise
+            self.rate_limiter.record_success(url)
+        else:
+            html = await self._render(context, url, site)
+        if self.cache is not None:
+            self.cache.put(url, options, html)
+        return html
+
+    async def _render(self, context, url: str, site: Optional[SiteConfig]) -> str:
+        page = await context.new_page()
+        try:
+            policy = policy_for_site(site) if self.block_resources else None
+            if policy is not None:
+                await page.route("**/*", make_async_route_handler(policy, self.blocking_stats))
+                page.on("response", self.blocking_stats.record_response)
+            page.set_default_timeout(self.timeout_ms)
+            await self._navigate(page, url)
+            if site and site.wait_jobposting:
+                await wait_for_jobposting_async(page, self.readiness, site.name, self.timeout_ms)
+            if site and site.follow_iframe:
+                return await self._read_iframe(page, site.iframe_selector)
+            return await page.content()
+        finally:
+            await page.close()
+
+    async def _navigate(self, page, url: str) -> None:
+        await self.rate_limiter.acquire_async(url)
+        try:
+            response = await page.goto(url, wait_until="domcontentloaded")
+        except Exception as exc:
+            self.rate_limiter.record_failure(url, exc)
+            raise
+        self.rate_limiter.record_response(url, response.status if response else None)
+
+    async def _read_iframe(self, page, selector: str) -> str:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        try:
+            element = await page.wait_for_selector(selector, state="attached")
+        except PlaywrightTimeoutError:
+            element = None
+        if element is None:
+            raise ValueError(f"No iframe found for selector: {selector}")
+
+        frame = await element.content_frame()
+        if frame is not None and frame.url not in ("", "about:blank"):
+            try:
+                await frame.wait_for_load_state("domcontentloaded")
+            except PlaywrightTimeoutError:
+                pass
+            return await frame.content()
+
+        src = await element.get_attribute("src")
+        if not src:
+            raise ValueError(f"No iframe found for selector: {selector}")
+        await self._navigate(page, urljoin(page.url, src))
+        return await page.content()
+
+    def _site_limit(self, site: Optional[SiteConfig]) -> asyncio.Semaphore:
+        key = site.name if site else "unknown"
+        limit = self._site_limits.get(key)
+        if limit is None:
+            cap = site.max_concurrency if site else self.default_site_concurrency
+            limit = asyncio.Semaphore(max(1, cap))
+            self._site_limits[key] = limit
+        return limit
+
+    @asynccontextmanager
+    async def _browser_context(self):
+        try:
+            from playwright.async_api import async_playwright
+        except Exception as exc:
+            raise RuntimeError("Playwright is required for concurrent fetching.") from exc
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=self.headless)
+            if self.archive is None:
+                context = await browser.new_context()
+            else:
+                context = await browser.new_context(**self.archive.context_options())
+                await self.archive.install_async(context)
+            try:
+                yield context
+            finally:
+                await context.close()
+                await browser.close()
@@ -0,0 +1,257 @@
+"""Long-lived Playwright browser pool with warm contexts."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from .fetch_archive import FetchArchive
+from .process_memory import child_pids, child_tree_rss_bytes
+
+
+@dataclass
+class _ContextSlot:
+    """One warm browser context and the page it currently lends out."""
+
+    context: Any = None
+    page: Any = None
+    navigations: int = 0
+    context_navigations: int = 0
+
+
+@dataclass
+class BrowserPool:
+    """Keep one Chromium instance and N warm contexts alive across fetches.
+
+    Pages are handed out round-robin over the contexts and replaced after
+    `max_page_navigations` uses so long crawls do not accumulate page state.
+    Contexts (with their cache and cookies) are replaced after
+    `max_context_navigations` uses. With `max_rss_mb` set, the RSS of the
+    browser processes is sampled every `memory_check_interval` navigations
+    and, once it exceeds the ceiling, the whole browser is relaunched before
+    the next page is lent. By default only the processes started by the
+    pool's own Playwright driver are measured, not other browsers of the
+    process (LinkedIn session, async engine). With an `archive`, every
+    context records to or replays from it.
+    """
+
+    headless: bool = True
+    size: int = 1
+    max_page_navigations: int = 25
+    archive: Optional[FetchArchive] = None
+    max_context_navigations: int = 200
+    max_rss_mb: Optional[float] = None
+    memory_check_interval: int = 10
+    rss_probe: Optional[Callable[[], Optional[int]]] = None
+    _playwright: Any = field(default=None, init=False, repr=False)
+    _browser: Any = field(default=None, init=False, repr=False)
+    _slots: List[_ContextSlot] = field(default_factory=list, init=False, repr=False)
+    _next_slot: int = field(default=0, init=False, repr=False)
+    _stats: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _last_rss: Optional[int] = field(default=None, init=False, repr=False)
+    _driver_pids: Set[int] = field(default_factory=set, init=False, repr=False)
+    _recycle_due: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self._browser is not None
+
+    def open(self) -> "BrowserPool":
+        """Launch the browser and warm up `size` contexts.
+
+        Returns:
+            BrowserPool: The pool itself, for chaining.
+
+        Raises:
+            ValueError: If size or a navigation limit is not positive.
+            RuntimeError: If Playwright is not installed.
+        """
+
+        if self.is_open:
+            return self
+        if self.size < 1:
+            raise ValueError("BrowserPool.size must be at least 1.")
+        if self.max_page_navigations < 1:
+            raise ValueError("BrowserPool.max_page_navigations must be at least 1.")
+        if self.max_context_navigations < 1:
+            raise ValueError("BrowserPool.max_context_navigations must be at least 1.")
+
+        self._stats = {
+            "browser_launches": 0,
+            "browser_recycles": 0,
+            "contexts_created": 0,
+            "context_recycles": 0,
+            "pages_created": 0,
+            "navigations": 0,
+            "peak_rss_bytes": 0,
+        }
+        self._last_rss = None
+        self._recycle_due = False
+        before = child_pids()
+        self._playwright = self._start_playwright()
+        after = child_pids()
+        # The driver is the child process that appeared with Playwright.
+        self._driver_pids = after - before if before is not None and after is not None else set()
+        self._launch()
+        return self
+
+    def close(self) -> None:
+        """Close every context, the browser, and the Playwright driver."""
+
+        self._close_browser()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+        self._playwright = None
+
+    def __enter__(self) -> "BrowserPool":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def page(self) -> Iterator[Any]:
+        """Lend a warm page from the next context in round-robin order.
+
+        Yields:
+            Playwright Page ready for navigation.
+
+        Raises:
+            RuntimeError: If the pool has not been opened.
+        """
+
+        if not self.is_open:
+            raise RuntimeError("BrowserPool is not open.")
+        if self._recycle_due:
+            self._recycle_due = False
+            self._recycle_browser()
+
+        slot = self._slots[self._next_slot % len(self._slots)]
+        self._next_slot += 1
+        if slot.context is None:
+            slot.context = self._new_context()
+        if slot.page is None or slot.page.is_closed():
+            self._new_page(slot)
+
+        failed = False
+        try:
+            yield slot.page
+        except Exception:
+            failed = True
+            raise
+        finally:
+            slot.navigations += 1
+            slot.context_navigations += 1
+            self._stats["navigations"] += 1
+            if slot.context_navigations >= self.max_context_navigations:
+                self._recycle_context(slot)
+            elif failed or slot.navigations >= self.max_page_navigations:
+                _quiet_close(slot.page)
+                slot.page = None
+            if self._memory_check_due() and self._over_memory_ceiling():
+                # Relaunched by the next lend, so a failing relaunch cannot
+                # replace the caller's exception here.
+                self._recycle_due = True
+
+    def stats(self) -> Dict[str, int]:
+        """Return launch, recycle, page creation, and navigation counters."""
+
+        return dict(self._stats)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return `stats()` plus per-context navigation counts and the last RSS.
+
+        `rss_bytes` is the most recent sample (None before the first one or
+        when the platform offers no process memory information).
+        """
+
+        metrics: Dict[str, Any] = self.stats()
+        metrics["context_navigations"] = [slot.context_navigations for slot in self._slots]
+        metrics["rss_bytes"] = self._last_rss
+        return metrics
+
+    def sample_rss(self) -> Optional[int]:
+        """Measure the browser processes' RSS now and record it."""
+
+        rss = self.rss_probe() if self.rss_probe is not None else self._browser_rss()
+        if rss is not None:
+            self._last_rss = rss
+            self._stats["peak_rss_bytes"] = max(self._stats.get("peak_rss_bytes", 0), rss)
+        return rss
+
+    def _browser_rss(self) -> Optional[int]:
+        sizes = [child_tree_rss_bytes(pid) for pid in self._driver_pids]
+        sizes = [size for size in sizes if size is not None]
+        return sum(sizes) if sizes else None
+
+    def _launch(self) -> None:
+        self._browser = self._playwright.chromium.launch(headless=self.headless)
+        self._stats["browser_launches"] += 1
+        self._slots = [_ContextSlot() for _ in range(self.size)]
+        for slot in self._slots:
+            slot.context = self._new_context()
+            self._new_page(slot)
+        self._next_slot = 0
+
+    def _close_browser(self) -> None:
+        for slot in self._slots:
+            _quiet_close(slot.context)
+        self._slots = []
+        _quiet_close(self._browser)
+        self._browser = None
+
+    def _recycle_context(self, slot: _ContextSlot) -> None:
+        # Closing the context closes its page; the next lend opens fresh ones.
+        _quiet_close(slot.context)
+        slot.context = None
+        slot.page = None
+        slot.context_navigations = 0
+        self._stats["context_recycles"] += 1
+
+    def _recycle_browser(self) -> None:
+        self._close_browser()
+        self._launch()
+        self._stats["browser_recycles"] += 1
+        self.sample_rss()
+
+    def _memory_check_due(self) -> bool:
+        if self.max_rss_mb is None:
+            return False
+        return self._stats["navigations"] % max(1, self.memory_check_interval) == 0
+
+    def _over_memory_ceiling(self) -> bool:
+        rss = self.sample_rss()
+        return rss is not None and rss > self.max_rss_mb * 1024 * 1024
+
+    def _new_context(self):
+        self._stats["contexts_created"] += 1
+        if self.archive is None:
+            return self._browser.new_context()
+        context = self._browser.new_context(**self.archive.context_options())
+        self.archive.install(context)
+        return context
+
+    def _new_page(self, slot: _ContextSlot) -> None:
+        slot.page = slot.context.new_page()
+        slot.navigations = 0
+        self._stats["pages_created"] += 1
+
+    def _start_playwright(self):
+        try:
+            from playwright.sync_api import sync_playwright
+        except Exception as exc:
+            raise RuntimeError("Playwright is required to run a browser pool.") from exc
+        return sync_playwright().start()
+
+
+def _quiet_close(resource) -> None:
+    if resource is None:
+        return
+    try:
+        resource.close()
+    except Exception:
+        pass
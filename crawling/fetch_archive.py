@@ -0,0 +1,79 @@
+"""Record/replay of browser traffic through Playwright HAR archives."""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+ARCHIVE_MODES = ("record", "replay")
+_HAR_PATTERN = "context-*.har.zip"
+
+
+@dataclass
+class FetchArchive:
+    """Archive every browser response of a run, or serve a run back offline.
+
+    In "record" mode each browser context writes its own
+    `context-<pid>-<n>.har.zip` into `root` when it closes, so several
+    worker processes can record into the same run. In "replay" mode every
+    archive in `root` is routed into new contexts and requests missing from
+    the archives are aborted, so no traffic leaves the machine.
+
+    Plain HTTP fetches and the LinkedIn session do not use browser contexts
+    created here, so callers should disable them while an archive is active.
+    """
+
+    root: Path
+    mode: str = "replay"
+    _counter: Any = field(default_factory=lambda: itertools.count(1), init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+        if self.mode not in ARCHIVE_MODES:
+            raise ValueError(f"Unsupported archive mode: {self.mode}")
+        if self.mode == "record":
+            self.root.mkdir(parents=True, exist_ok=True)
+        elif not self.har_files():
+            raise FileNotFoundError(f"No HAR archives found in {self.root}")
+
+    def har_files(self) -> List[Path]:
+        return sorted(self.root.glob(_HAR_PATTERN))
+
+    def context_options(self) -> Dict[str, Any]:
+        """Keyword arguments for `browser.new_context()`."""
+
+        if self.mode != "record":
+            return {}
+        with self._lock:
+            path = self.root / f"context-{os.getpid()}-{next(self._counter)}.har.zip"
+            while path.exists():
+                path = self.root / f"context-{os.getpid()}-{next(self._counter)}.har.zip"
+        return {"record_har_path": str(path), "record_har_content": "attach"}
+
+    def install(self, context) -> None:
+        """Route a sync context from the archives (replay mode only)."""
+
+        if self.mode != "replay":
+            return
+        context.route("**/*", lambda route: route.abort())
+        for path in self.har_files():
+            context.route_from_har(str(path), not_found="fallback")
+
+    async def install_async(self, context) -> None:
+        """Route an async context from the archives (replay mode only)."""
+
+        if self.mode != "replay":
+            return
+
+        async def _abort(route) -> None:
+            await route.abort()
+
+        await context.route("**/*", _abort)
+        for path in self.har_files():
+            await context.route_from_har(str(path), not_found="fallback")
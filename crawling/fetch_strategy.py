@@ -0,0 +1,162 @@
+"""HTTP-first fetching with Playwright fallback when rendering is required."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from parsing.html_extractors import extract_json_ld_jobposting
+from parsing.parsed_page import ParsedPage
+
+from .html_cache import HtmlCache
+from .http_fetcher import HttpFetcher
+from .playwright_client import PlaywrightClient
+from .rate_limiter import RateLimiter
+from .site_registry import SiteConfig, detect_site, site_profile
+
+
+STRATEGY_BROWSER = "browser"
+STRATEGY_HTTP_FIRST = "http-first"
+
+HTTP_CACHE_OPTIONS = {"kind": "http"}
+
+
+@dataclass
+class FetchStrategyStats:
+    """Per-site counters of how each page was obtained.
+
+    Outcomes: `http_hit` (static HTML was enough), `http_insufficient` and
+    `http_error` (both escalated to the browser), and `browser` (pages
+    fetched with Playwright, including escalations).
+    """
+
+    _counts: Dict[str, Dict[str, int]] = field(default_factory=dict, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record(self, site_name: str, outcome: str) -> None:
+        with self._lock:
+            per_site = self._counts.setdefault(site_name, {})
+            per_site[outcome] = per_site.get(outcome, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+
+def static_html_is_sufficient(html: str, site: Optional[SiteConfig]) -> bool:
+    """Return True if server-rendered HTML already holds what we parse.
+
+    JobPosting sites need the JSON-LD block the parser will use (found with
+    the DOM-free script scanner); sites with a `ready_selector` need that
+    element present.
+    """
+
+    if not html or site is None:
+        return False
+    if site.wait_jobposting and not extract_json_ld_jobposting(ParsedPage(html)):
+        return False
+    if site.ready_selector:
+        ready = site_profile(site).ready_selector
+        return ready.select_one(BeautifulSoup(html, "html.parser")) is not None
+    return site.wait_jobposting
+
+
+def fetch_static_html(
+    http: HttpFetcher,
+    url: str,
+    site: SiteConfig,
+    stats: FetchStrategyStats,
+    cache: Optional[HtmlCache] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[str]:
+    """GET a page over plain HTTP and keep it only if it is sufficient.
+
+    Args:
+        http: Pooled HTTP fetcher.
+        url: Page URL.
+        site: SiteConfig used for the sufficiency check.
+        stats: Counters updated with the outcome.
+        cache: Optional HtmlCache; only sufficient pages are stored.
+        limiter: Optional RateLimiter the request waits on and reports to.
+
+    Returns:
+        Optional[str]: Static HTML, or None when the browser is needed.
+    """
+
+    if cache is not None:
+        cached = cache.get(url, HTTP_CACHE_OPTIONS)
+        if cached is not None:
+            return cached
+    if limiter is not None:
+        limiter.acquire(url)
+    try:
+        response = http.get(url)
+    except Exception as exc:
+        if limiter is not None:
+            limiter.record_failure(url, exc)
+        stats.record(site.name, "http_error")
+        return None
+    if limiter is not None:
+        limiter.record_response(url, response.status)
+    if not response.ok:
+        stats.record(site.name, "http_error")
+        return None
+    if not static_html_is_sufficient(response.text, site):
+        stats.record(site.name, "http_insufficient")
+        return None
+    stats.record(site.name, "http_hit")
+    if cache is not None:
+        cache.put(url, HTTP_CACHE_OPTIONS, response.text)
+    return response.text
+
+
+@dataclass
+class StrategyFetcher:
+    """Fetch job pages using each site's `fetch_strategy`.
+
+    `http-first` sites get a pooled plain GET; the browser is used only when
+    the static HTML fails `static_html_is_sufficient`. While the client has
+    a `FetchArchive`, every page goes through the browser so the run can be
+    recorded or replayed.
+    """
+
+    client: PlaywrightClient
+    http: HttpFetcher = field(default_factory=HttpFetcher)
+    stats: FetchStrategyStats = field(default_factory=FetchStrategyStats)
+
+    def fetch(self, url: str, site: Optional[SiteConfig] = None) -> str:
+        """Return HTML for a job page, escalating to Playwright if needed."""
+
+        site = site or detect_site(url)
+        site_name = site.name if site else "unknown"
+        if site and site.fetch_strategy == STRATEGY_HTTP_FIRST and self.client.archive is None:
+            html = self.try_http(url, site)
+            if html is not None:
+                return html
+
+        self.stats.record(site_name, STRATEGY_BROWSER)
+        if site and site.follow_iframe:
+            return self.client.fetch_iframe(url, site.iframe_selector)
+        return self.client.fetch(
+            url,
+            wait_for=None,
+            wait_jobposting=site.wait_jobposting if site else False,
+        )
+
+    def try_http(self, url: str, site: SiteConfig) -> Optional[str]:
+        """Return static HTML if it is sufficient, else None."""
+
+        return fetch_static_html(
+            self.http,
+            url,
+            site,
+            self.stats,
+            cache=self.client.cache,
+            limiter=self.client.rate_limiter,
+        )
+
+    def close(self) -> None:
+        self.http.close()
@@ -0,0 +1,176 @@
+"""Content-addressed, size-bounded on-disk cache for fetched HTML."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL for cache keys.
+
+    Lowercases scheme and host, drops default ports and fragments, and sorts
+    query parameters so equivalent URLs share one entry.
+    """
+
+    parts = urlsplit((url or "").strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, parts.path or "/", query, ""))
+
+
+def cache_key(url: str, options: Optional[Dict[str, object]] = None) -> str:
+    """Return the content address for a URL plus fetch options."""
+
+    material = normalize_url(url) + "\n" + json.dumps(options or {}, sort_keys=True, default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for an HtmlCache."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+@dataclass
+class HtmlCache:
+    """Store gzip-compressed HTML on disk with TTL and LRU eviction.
+
+    Entries live at `root/<key[:2]>/<key>.html.gz`. The file mtime records
+    when the page was fetched (for TTL) and the atime is bumped on every hit
+    (for LRU). `mode` is "use" (read and write), "refresh" (write only), or
+    "bypass" (neither).
+    """
+
+    root: Path
+    ttl_seconds: float = 12 * 3600
+    max_bytes: int = 256 * 1024 * 1024
+    mode: str = "use"
+    stats: CacheStats = field(default_factory=CacheStats)
+    _total_bytes: Optional[int] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root = Path(self.root)
+        if self.mode not in CACHE_MODES:
+            raise ValueError(f"Unsupported cache mode: {self.mode}")
+
+    def get(self, url: str, options: Optional[Dict[str, object]] = None) -> Optional[str]:
+        """Return cached HTML, or None on miss, expiry, or non-"use" mode."""
+
+        if self.mode != "use":
+            return None
+        path = self._path(cache_key(url, options))
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        now = time.time()
+        if now - stat.st_mtime > self.ttl_seconds:
+            self.stats.expired += 1
+            self.stats.misses += 1
+            return None
+        try:
+            html = gzip.decompress(path.read_bytes()).decode("utf-8")
+        except (OSError, EOFError, UnicodeDecodeError):
+            self.stats.misses += 1
+            return None
+        os.utime(path, (now, stat.st_mtime))
+        self.stats.hits += 1
+        return html
+
+    def put(self, url: str, options: Optional[Dict[str, object]], html: str) -> None:
+        """Store HTML for a URL plus options, evicting old entries if needed."""
+
+        if self.mode == "bypass":
+            return
+        path = self._path(cache_key(url, options))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = gzip.compress(html.encode("utf-8"), compresslevel=6)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(payload)
+        with self._lock:
+            previous = path.stat().st_size if path.exists() else 0
+            os.replace(tmp, path)
+            self.stats.stores += 1
+            if self._total_bytes is not None:
+                self._total_bytes += len(payload) - previous
+            self._evict_if_needed()
+
+    def get_or_fetch(
+        self,
+        url: str,
+        options: Optional[Dict[str, object]],
+        fetch: Callable[[], str],
+    ) -> str:
+        """Return cached HTML or call `fetch` and store its result."""
+
+        cached = self.get(url, options)
+        if cached is not None:
+            return cached
+        html = fetch()
+        self.put(url, options, html)
+        return html
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+
+        with self._lock:
+            for path, _, _ in self._entries():
+                path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.html.gz"
+
+    def _entries(self) -> List[Tuple[Path, float, int]]:
+        entries = []
+        for path in self.root.glob("*/*.html.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_atime, stat.st_size))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, _, size in self._entries())
+        if self._total_bytes <= self.max_bytes:
+            return
+        for path, _, size in sorted(self._entries(), key=lambda entry: entry[1]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total_bytes -= size
+            self.stats.evictions += 1
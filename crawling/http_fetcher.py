@@ -0,0 +1,178 @@
+"""Plain HTTP fetching with per-host keep-alive connection pooling."""
+
+from __future__ import annotations
+
+import gzip
+import threading
+import zlib
+from dataclasses import dataclass, field
+from http.client import HTTPConnection, HTTPException, HTTPResponse as _RawResponse, HTTPSConnection
+from typing import Dict, List, Tuple
+from urllib.parse import urljoin, urlsplit
+
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+_PoolKey = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    """Decoded response of a plain HTTP GET."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    text: str
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+@dataclass
+class HttpFetcher:
+    """GET pages over reusable keep-alive connections.
+
+    Idle connections are pooled per (scheme, host, port) and handed out under
+    a lock, so one fetcher can be shared across threads.
+    """
+
+    timeout_s: float = 15.0
+    user_agent: str = DEFAULT_USER_AGENT
+    max_redirects: int = 5
+    max_idle_per_host: int = 4
+    _idle: Dict[_PoolKey, List[HTTPConnection]] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self, url: str) -> HttpResponse:
+        """Fetch a URL, following redirects.
+
+        Args:
+            url: Absolute http(s) URL.
+
+        Returns:
+            HttpResponse: Final response with body decoded to text.
+
+        Raises:
+            ValueError: If the URL scheme is unsupported or redirects loop.
+            OSError: On network failures.
+        """
+
+        current = url
+        for _ in range(self.max_redirects + 1):
+            status, headers, body = self._request(current)
+            location = headers.get("location")
+            if status in _REDIRECT_CODES and location:
+                current = urljoin(current, location)
+                continue
+            return HttpResponse(url=current, status=status, headers=headers, text=_decode(headers, body))
+        raise ValueError(f"Too many redirects for URL: {url}")
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        with self._lock:
+            pooled = [conn for conns in self._idle.values() for conn in conns]
+            self._idle = {}
+        for conn in pooled:
+            conn.close()
+
+    def __enter__(self) -> "HttpFetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _request(self, url: str) -> Tuple[int, Dict[str, str], bytes]:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"}:
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        default_port = 443 if parts.scheme == "https" else 80
+        key: _PoolKey = (parts.scheme, (parts.hostname or "").lower(), parts.port or default_port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+            "Connection": "keep-alive",
+        }
+
+        conn, reused = self._checkout(key)
+        try:
+            response, body = _exchange(conn, target, request_headers)
+        except (HTTPException, OSError):
+            if not reused:
+                raise
+            # A pooled connection may have been closed by the server; retry fresh.
+            conn = self._new_connection(key)
+            response, body = _exchange(conn, target, request_headers)
+
+        headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(key, conn)
+        return response.status, headers, body
+
+    def _checkout(self, key: _PoolKey) -> Tuple[HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def _checkin(self, key: _PoolKey, conn: HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(self, key: _PoolKey) -> HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return HTTPSConnection(host, port, timeout=self.timeout_s)
+        return HTTPConnection(host, port, timeout=self.timeout_s)
+
+
+def _exchange(conn: HTTPConnection, target: str, headers: Dict[str, str]) -> Tuple[_RawResponse, bytes]:
+    """Send a GET and read the whole body; the connection is closed on any error."""
+
+    try:
+        conn.request("GET", target, headers=headers)
+        response = conn.getresponse()
+        return response, response.read()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _decode(headers: Dict[str, str], body: bytes) -> str:
+    encoding = headers.get("content-encoding", "").lower()
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        try:
+            body = zlib.decompress(body)
+        except zlib.error:
+            body = zlib.decompress(body, -zlib.MAX_WBITS)
+
+    charset = "utf-8"
+    content_type = headers.get("content-type", "")
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.strip().partition("=")
+        if name.lower() == "charset" and value:
+            charset = value.strip("\"'")
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
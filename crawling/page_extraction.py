@@ -0,0 +1,127 @@
+"""In-page extraction of compact payloads instead of full HTML snapshots."""
+
+from __future__ import annotations
+
+import re
+from typing import Any, List, Optional, Union
+from urllib.parse import urljoin
+
+from parsing.parsed_page import ParsedPage, as_parsed_page
+
+from .site_registry import SiteConfig, is_job_detail_url
+
+
+EXTRACT_JSON_LD = "json-ld"
+EXTRACT_LINKS = "links"
+EXTRACT_IFRAME_SRC = "iframe-src"
+EXTRACT_TEXT = "text"
+
+EXTRACT_MODES = (EXTRACT_JSON_LD, EXTRACT_LINKS, EXTRACT_IFRAME_SRC, EXTRACT_TEXT)
+SELECTOR_MODES = (EXTRACT_IFRAME_SRC, EXTRACT_TEXT)
+
+_JSON_LD_JS = """() => Array.from(
+    document.querySelectorAll('script[type="application/ld+json"]'),
+    (script) => script.textContent || ""
+)"""
+
+# Mirrors `is_job_detail_url`: host substring, lower-cased path substring.
+_LINKS_JS = """([jobHost, jobPath]) => {
+    const seen = new Set();
+    const urls = [];
+    for (const anchor of document.querySelectorAll("a[href]")) {
+        if (!anchor.getAttribute("href").trim()) continue;
+        let parsed;
+        try {
+            parsed = new URL(anchor.href);
+        } catch (err) {
+            continue;
+        }
+        if (!parsed.host.toLowerCase().includes(jobHost)) continue;
+        if (!parsed.pathname.toLowerCase().includes(jobPath)) continue;
+        if (!seen.has(anchor.href)) {
+            seen.add(anchor.href);
+            urls.push(anchor.href);
+        }
+    }
+    return urls;
+}"""
+
+_IFRAME_SRC_JS = """(selector) => {
+    const element = document.querySelector(selector);
+    const src = element && element.getAttribute("src");
+    return src ? new URL(src, document.baseURI).href : null;
+}"""
+
+_TEXT_JS = """(selector) => {
+    const element = document.querySelector(selector);
+    return element ? (element.textContent || "").replace(/\\s+/g, " ").trim() : null;
+}"""
+
+
+def validate_mode(mode: str, selector: Optional[str]) -> None:
+    """Raise ValueError for an unknown mode or a missing selector."""
+
+    if mode not in EXTRACT_MODES:
+        raise ValueError(f"Unsupported extraction mode: {mode}")
+    if mode in SELECTOR_MODES and not selector:
+        raise ValueError(f"Extraction mode {mode!r} requires a selector.")
+
+
+def extract_in_page(target, mode: str, site: Optional[SiteConfig], selector: Optional[str] = None) -> Any:
+    """Run an extraction inside a Playwright page or frame.
+
+    Returns:
+        list[str] of script texts or job URLs, the iframe src (or None), or
+        the selector's normalized text.
+
+    Raises:
+        ValueError: If text mode finds no element.
+    """
+
+    validate_mode(mode, selector)
+    if mode == EXTRACT_JSON_LD:
+        return target.evaluate(_JSON_LD_JS)
+    if mode == EXTRACT_LINKS:
+        job_host, job_path = _job_url_rule(site)
+        return target.evaluate(_LINKS_JS, [job_host, job_path])
+    if mode == EXTRACT_IFRAME_SRC:
+        return target.evaluate(_IFRAME_SRC_JS, selector)
+    text = target.evaluate(_TEXT_JS, selector)
+    if text is None:
+        raise ValueError(f"No element found for selector: {selector}")
+    return text
+
+
+def extract_from_html(
+    html: Union[str, ParsedPage],
+    mode: str,
+    base_url: str,
+    site: Optional[SiteConfig],
+    selector: Optional[str] = None,
+) -> Any:
+    """Python equivalent of `extract_in_page` for already fetched (or parsed) HTML."""
+
+    validate_mode(mode, selector)
+    page = as_parsed_page(html)
+    if mode == EXTRACT_JSON_LD:
+        return list(page.json_ld_texts)
+    if mode == EXTRACT_LINKS:
+        urls: List[str] = []
+        for href in page.anchors:
+            full = urljoin(base_url, href)
+            if is_job_detail_url(full, site) and full not in urls:
+                urls.append(full)
+        return urls
+    node = page.document.select_one(selector)
+    if mode == EXTRACT_IFRAME_SRC:
+        src = node.attr("src") if node else None
+        return urljoin(base_url, src) if src else None
+    if node is None:
+        raise ValueError(f"No element found for selector: {selector}")
+    return re.sub(r"\s+", " ", node.text(" ")).strip()
+
+
+def _job_url_rule(site: Optional[SiteConfig]):
+    if site is None:
+        return "", "/jobs/"
+    return site.job_url_host, site.job_url_path
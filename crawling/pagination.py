@@ -0,0 +1,33 @@
+"""Search-result pagination schemes per site."""
+
+from __future__ import annotations
+
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .site_registry import SiteConfig
+
+
+def page_url(url: str, site: Optional[SiteConfig], page_index: int) -> Optional[str]:
+    """Return the URL of a result page.
+
+    Args:
+        url: First search results page, as built by `build_search_urls`.
+        site: SiteConfig describing the pagination scheme.
+        page_index: Zero-based page number.
+
+    Returns:
+        Optional[str]: Page URL, or None if the site has no such page
+        (no pagination scheme, or beyond `max_pages`).
+    """
+
+    if page_index == 0:
+        return url
+    if site is None or not site.page_param or page_index >= site.max_pages:
+        return None
+
+    value = site.page_start + page_index * site.page_step
+    parts = urlsplit(url)
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != site.page_param]
+    params.append((site.page_param, str(value)))
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(params), parts.fragment))
@@ -1,55 +1,183 @@
 ﻿"""Playwright-based HTML fetching with LinkedIn scraper fallback."""
 
-from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
-
-from bs4 import BeautifulSoup
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Union
 from urllib.parse import urljoin
 
-from core.runtime import get_env, run_async
+from parsing.parsed_page import ParsedPage, as_parsed_page
+
+from .browser_pool import BrowserPool
+from .fetch_archive import FetchArchive
+from .html_cache import HtmlCache
+from .page_extraction import extract_from_html, extract_in_page, validate_mode
+from .rate_limiter import RateLimiter
+from .readiness import ReadinessTracker, wait_for_jobposting
+from .resource_blocking import BlockingStats, make_route_handler, policy_for_site
+from .site_registry import EXTRACT_LINKEDIN, detect_site
+
+if TYPE_CHECKING:
+    from integrations.linkedin_session import LinkedInSession
 
 
 @dataclass
 class PlaywrightClient:
-    """Encapsulate Playwright usage to fetch rendered HTML."""
+    """Encapsulate Playwright usage to fetch rendered HTML.
+
+    Used directly, every fetch launches and tears down its own browser. After
+    `open()` (or inside a `with` block) fetches share a long-lived
+    `BrowserPool` with `pool_size` warm contexts instead; its contexts are
+    recycled every `max_context_navigations` navigations and the browser is
+    relaunched when its processes exceed `max_rss_mb`. An optional
+    `HtmlCache` short-circuits fetches of recently seen pages; every network
+    fetch waits on the per-host `rate_limiter`.
+
+    With `block_resources` enabled (off by default), each site's
+    `ResourcePolicy` is applied through route interception and tallied in
+    `blocking_stats`.
+    `wait_jobposting` waits are event-driven and bounded by per-site
+    deadlines learned in `readiness`.
+
+    With an `archive`, every browser context records its traffic to it or
+    replays from it, and LinkedIn pages are rendered in that browser too
+    instead of through the LinkedIn session.
+    """
 
     timeout_ms: int = 20000
     headless: bool = True
+    pool_size: int = 1
+    max_page_navigations: int = 25
+    max_context_navigations: int = 200
+    max_rss_mb: Optional[float] = None
+    block_resources: bool = False
+    blocking_stats: BlockingStats = field(default_factory=BlockingStats)
+    cache: Optional[HtmlCache] = None
+    linkedin_session: Optional["LinkedInSession"] = None
+    rate_limiter: RateLimiter = field(default_factory=RateLimiter)
+    archive: Optional[FetchArchive] = None
+    readiness: ReadinessTracker = field(default_factory=ReadinessTracker)
+    _pool: Optional[BrowserPool] = field(default=None, init=False, repr=False)
+
+    @property
+    def is_open(self) -> bool:
+        return self._pool is not None and self._pool.is_open
+
+    def open(self) -> "PlaywrightClient":
+        """Start the shared browser pool used by subsequent fetches."""
+
+        if not self.is_open:
+            self._pool = BrowserPool(
+                headless=self.headless,
+                size=self.pool_size,
+                max_page_navigations=self.max_page_navigations,
+                archive=self.archive,
+                max_context_navigations=self.max_context_navigations,
+                max_rss_mb=self.max_rss_mb,
+            ).open()
+        return self
+
+    def close(self) -> None:
+        """Shut down the shared browser pool, if any."""
+
+        if self._pool is not None:
+            self._pool.close()
+        self._pool = None
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return the pool's recycling and memory metrics (empty when not open)."""
+
+        return self._pool.metrics() if self.is_open else {}
+
+    def __enter__(self) -> "PlaywrightClient":
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def fetch(self, url: str, wait_for: Optional[str] = None, wait_jobposting: bool = False) -> str:
         """Return rendered HTML for a URL.
 
         Uses Playwright for most sites. For LinkedIn URLs, uses the
-        joeyism/linkedin_scraper package (Playwright-based).
+        joeyism/linkedin_scraper package (Playwright-based). Served from
+        `cache` when one is configured.
         """
-        if "linkedin.com" in (url or "").lower():
-            return self._fetch_linkedin_scraper(url)
-        return self._fetch_playwright(url, wait_for=wait_for, wait_jobposting=wait_jobposting)
+
+        def _fetch() -> str:
+            if _is_linkedin(url) and self.archive is None:
+                return self._fetch_linkedin_scraper(url)
+            return self._fetch_playwright(url, wait_for=wait_for, wait_jobposting=wait_jobposting)
+
+        if self.cache is None:
+            return _fetch()
+        return self.cache.get_or_fetch(url, page_cache_options(wait_for, wait_jobposting), _fetch)
 
     def fetch_iframe(self, url: str, selector: str) -> str:
-        """Follow iframe source and return iframe HTML."""
+        """Return the HTML of the iframe matching `selector` on a page.
 
-        html = self.fetch(url)
-        iframe_url = extract_iframe_src(html, selector, url)
-        if not iframe_url:
-            raise ValueError(f"No iframe found for selector: {selector}")
-        return self.fetch(iframe_url)
+        The parent page is navigated once and the iframe is read from the
+        same page session. LinkedIn URLs keep the fetch-then-follow path.
+        """
+
+        def _fetch() -> str:
+            if _is_linkedin(url) and self.archive is None:
+                html = self.fetch(url)
+                iframe_url = extract_iframe_src(html, selector, url)
+                if not iframe_url:
+                    raise ValueError(f"No iframe found for selector: {selector}")
+                return self.fetch(iframe_url)
+            return self._fetch_playwright_iframe(url, selector)
+
+        if self.cache is None:
+            return _fetch()
+        return self.cache.get_or_fetch(url, iframe_cache_options(selector), _fetch)
+
+    def extract(
+        self,
+        url: str,
+        mode: str,
+        selector: Optional[str] = None,
+        frame_selector: Optional[str] = None,
+        wait_jobposting: bool = False,
+        use_cache: bool = True,
+    ) -> Any:
+        """Run an extraction inside the rendered page and return only its result.
+
+        Modes (see `crawling.page_extraction`): "json-ld" returns the
+        JSON-LD script texts, "links" the job detail URLs matching the
+        site's job-URL rule, "iframe-src" the absolute src of `selector`,
+        and "text" the normalized text of `selector`. With `frame_selector`
+        the extraction runs inside that iframe. LinkedIn URLs are fetched
+        through the LinkedIn session and extracted in Python. Pass
+        `use_cache=False` for pages that change between runs (search
+        results), so they are neither read from nor written to `cache`.
+
+        Raises:
+            ValueError: For an unknown mode, a missing selector, or a
+                missing iframe or text element.
+        """
+
+        validate_mode(mode, selector)
+
+        def _extract() -> Any:
+            if _is_linkedin(url) and self.archive is None:
+                return extract_from_html(self._fetch_linkedin_scraper(url), mode, url, detect_site(url), selector)
+            return self._extract_playwright(url, mode, selector, frame_selector, wait_jobposting)
+
+        if self.cache is None or not use_cache:
+            return _extract()
+        options = extract_cache_options(mode, selector, frame_selector, wait_jobposting)
+        return json.loads(self.cache.get_or_fetch(url, options, lambda: json.dumps(_extract())))
 
     def _fetch_playwright(self, url: str, wait_for: Optional[str], wait_jobposting: bool) -> str:
         try:
             from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-            from playwright.sync_api import sync_playwright
         except Exception as exc:
             raise RuntimeError("Playwright is required to fetch non-LinkedIn pages.") from exc
 
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(headless=self.headless)
-            context = browser.new_context()
-            page = context.new_page()
-
+        with self._page() as page, self._blocking(page, url):
             page.set_default_timeout(self.timeout_ms)
-            page.goto(url, wait_until="domcontentloaded")
+            self._navigate(page, url)
 
             if wait_for:
                 try:
@@ -58,90 +186,200 @@ class PlaywrightClient:
                     pass
 
             if wait_jobposting:
-                try:
-                    page.wait_for_function(
-                        """() => {
-                            const script = document.querySelector(
-                                'script[type="application/ld+json"]'
-                            );
-                            return script && script.textContent.includes('"@type":"JobPosting"');
-                        }"""
-                    )
-                except PlaywrightTimeoutError:
-                    pass
+                site = detect_site(url)
+                wait_for_jobposting(page, self.readiness, site.name if site else "unknown", self.timeout_ms)
 
             html = page.content()
-            context.close()
-            browser.close()
 
         return html
 
-    def _fetch_linkedin_scraper(self, url: str) -> str:
-        """Fetch LinkedIn pages using joeyism/linkedin_scraper (Playwright).
-
-        Requires:
-        - pip install linkedin_scraper
-        - playwright installed (linkedin_scraper depends on it)
-        Optional login via env vars:
-        - LINKEDIN_EMAIL
-        - LINKEDIN_PASSWORD
-        - LINKEDIN_COOKIE
-        Optional session reuse:
-        - LINKEDIN_SESSION_PATH (default: session.json)
-        - LINKEDIN_SAVE_SESSION=1 to persist after login
+    def _fetch_playwright_iframe(self, url: str, selector: str) -> str:
+        with self._page() as page, self._blocking(page, url):
+            page.set_default_timeout(self.timeout_ms)
+            self._navigate(page, url)
+            return self._resolve_iframe(page, selector).content()
+
+    def _extract_playwright(
+        self,
+        url: str,
+        mode: str,
+        selector: Optional[str],
+        frame_selector: Optional[str],
+        wait_jobposting: bool,
+    ) -> Any:
+        site = detect_site(url)
+        with self._page() as page, self._blocking(page, url):
+            page.set_default_timeout(self.timeout_ms)
+            self._navigate(page, url)
+            if wait_jobposting:
+                wait_for_jobposting(page, self.readiness, site.name if site else "unknown", self.timeout_ms)
+            target = self._resolve_iframe(page, frame_selector) if frame_selector else page
+            return extract_in_page(target, mode, site, selector)
+
+    def _resolve_iframe(self, page, selector: str):
+        """Return the loaded frame matching `selector`, reusing the parent page.
+
+        If the frame is not attached yet, the same page is navigated to the
+        iframe src and returned instead.
         """
 
         try:
-            from linkedin_scraper import (
-                BrowserManager,
-                JobScraper,
-                load_credentials_from_env,
-                login_with_cookie,
-                login_with_credentials,
-            )
+            from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
         except Exception as exc:
-            raise RuntimeError(
-                "LinkedIn crawling requires linkedin_scraper and playwright."
-            ) from exc
+            raise RuntimeError("Playwright is required to fetch non-LinkedIn pages.") from exc
+
+        try:
+            element = page.wait_for_selector(selector, state="attached")
+        except PlaywrightTimeoutError:
+            element = None
+        if element is None:
+            raise ValueError(f"No iframe found for selector: {selector}")
+
+        frame = element.content_frame()
+        if frame is not None and frame.url not in ("", "about:blank"):
+            try:
+                frame.wait_for_load_state("domcontentloaded")
+            except PlaywrightTimeoutError:
+                pass
+            return frame
+
+        src = element.get_attribute("src")
+        if not src:
+            raise ValueError(f"No iframe found for selector: {selector}")
+        self._navigate(page, urljoin(page.url, src))
+        return page
+
+    def _navigate(self, page, url: str) -> None:
+        """Navigate through the rate limiter and report the outcome to it."""
+
+        self.rate_limiter.acquire(url)
+        try:
+            response = page.goto(url, wait_until="domcontentloaded")
+        except Exception as exc:
+            self.rate_limiter.record_failure(url, exc)
+            raise
+        self.rate_limiter.record_response(url, response.status if response else None)
+
+    @contextmanager
+    def _blocking(self, page, url: str) -> Iterator[None]:
+        """Apply the site's resource policy to `page` for one navigation."""
+
+        policy = policy_for_site(detect_site(url)) if self.block_resources else None
+        if policy is None:
+            yield
+            return
+
+        handler = make_route_handler(policy, self.blocking_stats)
+        page.route("**/*", handler)
+        page.on("response", self.blocking_stats.record_response)
+        try:
+            yield
+        finally:
+            try:
+                page.remove_listener("response", self.blocking_stats.record_response)
+                page.unroute("**/*", handler)
+            except Exception:
+                pass
+
+    @contextmanager
+    def _page(self) -> Iterator[object]:
+        """Yield a page from the shared pool, or from a one-off browser."""
+
+        if self.is_open:
+            with self._pool.page() as page:
+                yield page
+            return
+
+        try:
+            from playwright.sync_api import sync_playwright
+        except Exception as exc:
+            raise RuntimeError("Playwright is required to fetch non-LinkedIn pages.") from exc
+
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=self.headless)
+            if self.archive is None:
+                context = browser.new_context()
+            else:
+                context = browser.new_context(**self.archive.context_options())
+                self.archive.install(context)
+            try:
+                yield context.new_page()
+            finally:
+                context.close()
+                browser.close()
+
+    def _fetch_linkedin_scraper(self, url: str) -> str:
+        """Fetch LinkedIn pages through the shared, logged-in LinkedIn session."""
+
+        session = self.linkedin_session or _shared_linkedin_session(self.headless)
+        self.rate_limiter.acquire(url)
+        try:
+            html = session.scrape_job(url)
+        except Exception as exc:
+            self.rate_limiter.record_failure(url, exc)
+            raise
+        self.rate_limiter.record_success(url)
+        return html
+
+
+async def scrape_linkedin_job(url: str, headless: bool = True) -> str:
+    """Scrape a LinkedIn job page using joeyism/linkedin_scraper (Playwright).
+
+    Runs on the process-wide `LinkedInSession`, which logs in once and keeps
+    warm pages; see `integrations.linkedin_session` for the env vars used
+    for login and session reuse.
+    """
+
+    return await _shared_linkedin_session(headless).scrape_job_async(url)
+
+
+def _is_linkedin(url: str) -> bool:
+    site = detect_site(url)
+    return site is not None and site.extraction == EXTRACT_LINKEDIN
+
+
+def _shared_linkedin_session(headless: bool):
+    from integrations.linkedin_session import get_linkedin_session
+
+    return get_linkedin_session(headless=headless)
+
+
+def page_cache_options(wait_for: Optional[str], wait_jobposting: bool) -> dict:
+    """Cache-key options for a rendered page fetch."""
 
-        async def _scrape() -> str:
-            session_path = Path(get_env("LINKEDIN_SESSION_PATH") or "session.json")
-            save_session = (get_env("LINKEDIN_SAVE_SESSION") or "").strip() == "1"
+    return {"kind": "page", "wait_for": wait_for, "wait_jobposting": bool(wait_jobposting)}
 
-            async with BrowserManager(headless=self.headless) as browser:
-                if session_path.exists():
-                    await browser.load_session(str(session_path))
 
-                page = browser.page
-                email, password = load_credentials_from_env()
-                cookie = get_env("LINKEDIN_COOKIE")
+def iframe_cache_options(selector: str) -> dict:
+    """Cache-key options for an iframe-resolved fetch."""
 
-                if cookie:
-                    await login_with_cookie(page, cookie)
-                elif email and password:
-                    await login_with_credentials(page, email, password)
+    return {"kind": "iframe", "selector": selector}
 
-                if save_session:
-                    await browser.save_session(str(session_path))
 
-                scraper = JobScraper(page)
-                job = await scraper.scrape(url)
-                description = getattr(job, "job_description", None)
-                if description:
-                    return description
-                return await page.content()
+def extract_cache_options(
+    mode: str,
+    selector: Optional[str],
+    frame_selector: Optional[str],
+    wait_jobposting: bool,
+) -> dict:
+    """Cache-key options for an in-page extraction."""
 
-        return run_async(_scrape())
+    return {
+        "kind": "extract",
+        "mode": mode,
+        "selector": selector,
+        "frame_selector": frame_selector,
+        "wait_jobposting": bool(wait_jobposting),
+    }
 
 
-def extract_iframe_src(html: str, selector: str, base_url: str) -> Optional[str]:
-    """Extract iframe src from HTML and resolve to absolute URL."""
+def extract_iframe_src(html: Union[str, ParsedPage], selector: str, base_url: str) -> Optional[str]:
+    """Extract iframe src from HTML (or a parsed page) and resolve to absolute URL."""
 
-    soup = BeautifulSoup(html, "html.parser")
-    iframe = soup.select_one(selector)
+    iframe = as_parsed_page(html).document.select_one(selector)
     if not iframe:
         return None
-    src = iframe.get("src")
+    src = iframe.attr("src")
     if not src:
         return None
     return urljoin(base_url, src)
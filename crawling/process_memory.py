@@ -0,0 +1,102 @@
+"""Resident memory of child process trees (browser, driver)."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+
+_PROC = Path("/proc")
+
+
+def child_tree_rss_bytes(root_pid: Optional[int] = None) -> Optional[int]:
+    """Return the summed RSS of every descendant of `root_pid`.
+
+    The root itself is excluded, so for the current process this measures
+    the Playwright driver and the browsers it launched. Uses psutil when
+    installed and /proc otherwise.
+
+    Returns:
+        Optional[int]: Bytes, or None when neither source is available.
+    """
+
+    root_pid = os.getpid() if root_pid is None else root_pid
+    try:
+        import psutil
+    except Exception:
+        psutil = None
+    if psutil is not None:
+        try:
+            children = psutil.Process(root_pid).children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for child in children:
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total
+    if not _PROC.is_dir():
+        return None
+    return sum(_proc_rss(pid) for pid in _proc_descendants(root_pid))
+
+
+def child_pids(pid: Optional[int] = None) -> Optional[Set[int]]:
+    """Return the PIDs of the direct children of `pid` (default: this process).
+
+    Returns:
+        Optional[Set[int]]: PIDs, or None when no process information is
+        available.
+    """
+
+    pid = os.getpid() if pid is None else pid
+    try:
+        import psutil
+    except Exception:
+        psutil = None
+    if psutil is not None:
+        try:
+            return {child.pid for child in psutil.Process(pid).children()}
+        except psutil.Error:
+            return None
+    if not _PROC.is_dir():
+        return None
+    return set(_proc_children().get(pid, ()))
+
+
+def _proc_children() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in _PROC.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces; fields resume after ")".
+        fields = stat[stat.rfind(")") + 2 :].split()
+        children.setdefault(int(fields[1]), []).append(int(entry.name))
+    return children
+
+
+def _proc_descendants(root_pid: int) -> List[int]:
+    children = _proc_children()
+    found: List[int] = []
+    stack = list(children.get(root_pid, ()))
+    while stack:
+        pid = stack.pop()
+        found.append(pid)
+        stack.extend(children.get(pid, ()))
+    return found
+
+
+def _proc_rss(pid: int) -> int:
+    try:
+        for line in (_PROC / str(pid) / "status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
@@ -0,0 +1,159 @@
+"""Per-host adaptive rate limiting with token buckets and backoff."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from .site_registry import detect_site
+
+
+THROTTLE_STATUSES = frozenset({403, 429, 503})
+
+
+@dataclass
+class _HostState:
+    """Token bucket plus adaptive state for one host."""
+
+    max_rate: float
+    burst: float
+    rate: float
+    tokens: float
+    updated: float
+    blocked_until: float = 0.0
+    backoff_s: float = 0.0
+    throttled: int = 0
+    requests: int = 0
+
+
+@dataclass
+class RateLimiter:
+    """Throttle requests per host and adapt to server pushback.
+
+    Each host gets a token bucket sized from its `SiteConfig`
+    (`requests_per_second`, `burst`), or the defaults for unknown hosts.
+    A 403/429/503 or a timeout halves the host's rate (down to
+    `min_rate_fraction` of its maximum) and pauses the host with exponential
+    backoff; every success ramps the rate back up by `recovery_factor`.
+    `rate_scale` multiplies every host's rate, e.g. 1/N for one of N
+    worker processes sharing the site limits. With `enabled` off (e.g. when
+    replaying an archive) requests are only counted, never delayed.
+    """
+
+    default_rate: float = 1.0
+    default_burst: int = 2
+    min_rate_fraction: float = 0.1
+    slowdown_factor: float = 0.5
+    recovery_factor: float = 1.05
+    initial_backoff_s: float = 2.0
+    max_backoff_s: float = 60.0
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+    enabled: bool = True
+    rate_scale: float = 1.0
+    _hosts: Dict[str, _HostState] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def acquire(self, url: str) -> float:
+        """Block until a request to the URL's host is allowed.
+
+        Returns:
+            float: Seconds waited.
+        """
+
+        wait = self._reserve(url)
+        if wait > 0:
+            self.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Async variant of `acquire`."""
+
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_response(self, url: str, status: Optional[int]) -> None:
+        """Feed a response status back; throttling statuses slow the host."""
+
+        if status in THROTTLE_STATUSES:
+            self.record_throttled(url)
+        else:
+            self.record_success(url)
+
+    def record_failure(self, url: str, exc: BaseException) -> None:
+        """Feed a failed request back; only timeouts count as throttling."""
+
+        if isinstance(exc, TimeoutError) or "timeout" in type(exc).__name__.lower():
+            self.record_throttled(url)
+
+    def record_success(self, url: str) -> None:
+        with self._lock:
+            state = self._state(url)
+            state.rate = min(state.max_rate, state.rate * self.recovery_factor)
+            state.backoff_s = 0.0
+
+    def record_throttled(self, url: str) -> None:
+        with self._lock:
+            state = self._state(url)
+            state.throttled += 1
+            floor = state.max_rate * self.min_rate_fraction
+            state.rate = max(floor, state.rate * self.slowdown_factor)
+            state.backoff_s = min(
+                self.max_backoff_s,
+                state.backoff_s * 2 if state.backoff_s else self.initial_backoff_s,
+            )
+            state.blocked_until = max(state.blocked_until, self.clock() + state.backoff_s)
+
+    def current_rates(self) -> Dict[str, float]:
+        """Return the current allowed requests/second per host."""
+
+        with self._lock:
+            return {host: state.rate for host, state in self._hosts.items()}
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return rate, limits, and counters per host."""
+
+        with self._lock:
+            return {
+                host: {
+                    "rate": state.rate,
+                    "max_rate": state.max_rate,
+                    "burst": state.burst,
+                    "backoff_s": state.backoff_s,
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def _reserve(self, url: str) -> float:
+        """Take a token (possibly on credit) and return the wait before using it."""
+
+        with self._lock:
+            state = self._state(url)
+            now = self.clock()
+            state.tokens = min(state.burst, state.tokens + (now - state.updated) * state.rate)
+            state.updated = now
+            state.requests += 1
+            if not self.enabled:
+                return 0.0
+            state.tokens -= 1.0
+            wait = 0.0 if state.tokens >= 0 else -state.tokens / state.rate
+            return max(wait, state.blocked_until - now)
+
+    def _state(self, url: str) -> _HostState:
+        host = (urlparse(url).hostname or "").lower()
+        state = self._hosts.get(host)
+        if state is None:
+            site = detect_site(url)
+            rate = (site.requests_per_second if site else self.default_rate) * self.rate_scale
+            burst = float(site.burst if site else self.default_burst)
+            state = _HostState(max_rate=rate, burst=burst, rate=rate, tokens=burst, updated=self.clock())
+            self._hosts[host] = state
+        return state
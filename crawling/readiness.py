@@ -0,0 +1,160 @@
+"""Event-driven page readiness with per-site adaptive deadlines."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict
+
+
+# Resolves true as soon as a JobPosting JSON-LD block exists, false at the
+# deadline. Script mutations are observed instead of polled, and the type is
+# matched on the parsed JSON (arrays, @graph, prefixed IRIs, any spacing).
+JOBPOSTING_READY_JS = """(deadlineMs) => new Promise((resolve) => {
+    const isJobPostingType = (value) =>
+        typeof value === "string" && /(^|[/:#])JobPosting$/.test(value.trim());
+    const hasJobPosting = (node, depth = 0) => {
+        if (!node || typeof node !== "object" || depth > 8) return false;
+        if (Array.isArray(node)) return node.some((item) => hasJobPosting(item, depth + 1));
+        const types = [].concat(node["@type"] || []);
+        if (types.some(isJobPostingType)) return true;
+        return hasJobPosting(node["@graph"], depth + 1);
+    };
+    const found = () => {
+        for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+            try {
+                if (hasJobPosting(JSON.parse(script.textContent))) return true;
+            } catch (err) {
+                if (/"@type"\\s*:\\s*(\\[[^\\]]*)?"JobPosting"/.test(script.textContent)) return true;
+            }
+        }
+        return false;
+    };
+    const touchesScript = (records) => records.some((record) => {
+        const target = record.target;
+        if (target.nodeName === "SCRIPT" || (target.parentNode && target.parentNode.nodeName === "SCRIPT")) {
+            return true;
+        }
+        return Array.from(record.addedNodes).some(
+            (node) => node.nodeName === "SCRIPT" || (node.querySelector && node.querySelector("script"))
+        );
+    });
+    if (found()) return resolve(true);
+    let timer = null;
+    const observer = new MutationObserver((records) => {
+        if (touchesScript(records) && found()) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document, { childList: true, subtree: true, characterData: true });
+    timer = setTimeout(() => {
+        observer.disconnect();
+        resolve(found());
+    }, deadlineMs);
+})"""
+
+
+@dataclass
+class ReadinessTracker:
+    """Learn how long each site takes to expose its JobPosting JSON-LD.
+
+    Until a site has `min_samples` observed ready times its deadline is
+    `initial_deadline_ms`; afterwards it is the 95th percentile of the recent
+    ready times times `margin`. Each miss multiplies the deadline by
+    `miss_backoff` and every ready page eases it back by `recovery_factor`,
+    so pages that render their JSON-LD late (e.g. via XHR) widen a deadline
+    learned from fast server-rendered pages. The result is clamped to
+    [`min_deadline_ms`, `max_deadline_ms`].
+    """
+
+    initial_deadline_ms: int = 8000
+    min_deadline_ms: int = 1000
+    max_deadline_ms: int = 20000
+    margin: float = 1.5
+    min_samples: int = 3
+    window: int = 50
+    miss_backoff: float = 2.0
+    recovery_factor: float = 0.95
+    _samples: Dict[str, Deque[float]] = field(default_factory=dict, init=False, repr=False)
+    _misses: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _backoff: Dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def deadline_ms(self, site_name: str) -> int:
+        """Return how long to wait for readiness on a site."""
+
+        with self._lock:
+            samples = sorted(self._samples.get(site_name, ()))
+            backoff = self._backoff.get(site_name, 1.0)
+        if len(samples) < self.min_samples:
+            deadline = float(self.initial_deadline_ms)
+        else:
+            p95 = samples[max(0, math.ceil(0.95 * len(samples)) - 1)]
+            deadline = p95 * self.margin
+        # Widen from the floor, or fast sites would absorb the backoff.
+        deadline = max(self.min_deadline_ms, deadline) * backoff
+        return int(min(self.max_deadline_ms, deadline))
+
+    def record(self, site_name: str, elapsed_ms: float, ready: bool) -> None:
+        """Record one wait: its duration if the page became ready, else a miss."""
+
+        with self._lock:
+            backoff = self._backoff.get(site_name, 1.0)
+            if ready:
+                samples = self._samples.setdefault(site_name, deque(maxlen=self.window))
+                samples.append(elapsed_ms)
+                self._backoff[site_name] = max(1.0, backoff * self.recovery_factor)
+            else:
+                self._misses[site_name] = self._misses.get(site_name, 0) + 1
+                # Beyond this factor the clamp to max_deadline_ms always applies.
+                limit = self.max_deadline_ms / self.min_deadline_ms
+                self._backoff[site_name] = min(limit, backoff * self.miss_backoff)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return samples, misses, and the current deadline per site."""
+
+        with self._lock:
+            names = set(self._samples) | set(self._misses)
+            counts = {
+                name: (len(self._samples.get(name, ())), self._misses.get(name, 0)) for name in names
+            }
+        return {
+            name: {"ready": ready, "misses": misses, "deadline_ms": self.deadline_ms(name)}
+            for name, (ready, misses) in counts.items()
+        }
+
+
+def wait_for_jobposting(page, tracker: ReadinessTracker, site_name: str, timeout_ms: int) -> bool:
+    """Wait until the page exposes JobPosting JSON-LD or its deadline passes.
+
+    Returns:
+        bool: True if the JSON-LD appeared in time.
+    """
+
+    deadline = min(tracker.deadline_ms(site_name), timeout_ms)
+    started = time.perf_counter()
+    try:
+        ready = bool(page.evaluate(JOBPOSTING_READY_JS, deadline))
+    except Exception:
+        # e.g. the page navigated away; the caller reads whatever is there.
+        ready = False
+    tracker.record(site_name, (time.perf_counter() - started) * 1000, ready)
+    return ready
+
+
+async def wait_for_jobposting_async(page, tracker: ReadinessTracker, site_name: str, timeout_ms: int) -> bool:
+    """Async variant of `wait_for_jobposting`."""
+
+    deadline = min(tracker.deadline_ms(site_name), timeout_ms)
+    started = time.perf_counter()
+    try:
+        ready = bool(await page.evaluate(JOBPOSTING_READY_JS, deadline))
+    except Exception:
+        ready = False
+    tracker.record(site_name, (time.perf_counter() - started) * 1000, ready)
+    return ready
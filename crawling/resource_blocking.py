@@ -0,0 +1,156 @@
+"""Route-interception policy that drops resources we never parse."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+
+# Rough transfer sizes used to estimate savings for aborted requests, whose
+# real size is never known because they are not downloaded.
+ESTIMATED_BYTES_BY_TYPE = {
+    "image": 60_000,
+    "media": 400_000,
+    "font": 40_000,
+    "stylesheet": 25_000,
+    "script": 40_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+}
+DEFAULT_ESTIMATED_BYTES = 10_000
+
+MEDIA_RESOURCE_TYPES = ("image", "media", "font")
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "criteo.com",
+    "criteo.net",
+    "adnxs.com",
+    "scorecardresearch.com",
+    "taboola.com",
+    "outbrain.com",
+)
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """Decide which sub-resources to abort during a page fetch.
+
+    `allowed_hosts` always wins; otherwise a request is blocked when its
+    resource type is listed or its host matches `blocked_hosts`. The main
+    document request is never blocked.
+    """
+
+    blocked_resource_types: Tuple[str, ...] = ()
+    blocked_hosts: Tuple[str, ...] = ()
+    allowed_hosts: Tuple[str, ...] = ()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.blocked_resource_types or self.blocked_hosts)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Return True if a request should be aborted."""
+
+        if resource_type == "document":
+            return False
+        host = (urlparse(url).hostname or "").lower()
+        if _host_matches(host, self.allowed_hosts):
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        return _host_matches(host, self.blocked_hosts)
+
+
+@dataclass
+class BlockingStats:
+    """Counters for blocked requests and (estimated) bytes saved."""
+
+    requests_allowed: int = 0
+    requests_blocked: int = 0
+    bytes_loaded: int = 0
+    bytes_saved_estimate: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+
+    def record_allowed(self) -> None:
+        self.requests_allowed += 1
+
+    def record_blocked(self, resource_type: str) -> None:
+        self.requests_blocked += 1
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        self.bytes_saved_estimate += ESTIMATED_BYTES_BY_TYPE.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+
+    def record_response(self, response) -> None:
+        """Add a response's declared Content-Length to `bytes_loaded`."""
+
+        try:
+            length = int((response.headers or {}).get("content-length") or 0)
+        except (TypeError, ValueError):
+            length = 0
+        self.bytes_loaded += max(0, length)
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "requests_allowed": self.requests_allowed,
+            "requests_blocked": self.requests_blocked,
+            "bytes_loaded": self.bytes_loaded,
+            "bytes_saved_estimate": self.bytes_saved_estimate,
+            "blocked_by_type": dict(self.blocked_by_type),
+        }
+
+
+def policy_for_site(site) -> Optional[ResourcePolicy]:
+    """Build the ResourcePolicy configured on a SiteConfig, if any."""
+
+    if site is None:
+        return None
+    policy = ResourcePolicy(
+        blocked_resource_types=tuple(site.blocked_resource_types),
+        blocked_hosts=tuple(site.blocked_hosts),
+        allowed_hosts=tuple(site.allowed_hosts),
+    )
+    return policy if policy.enabled else None
+
+
+def make_route_handler(policy: ResourcePolicy, stats: BlockingStats):
+    """Return a sync Playwright route handler enforcing `policy`."""
+
+    def _handle(route) -> None:
+        request = route.request
+        if policy.should_block(request.url, request.resource_type):
+            stats.record_blocked(request.resource_type)
+            route.abort()
+        else:
+            stats.record_allowed()
+            route.fallback()
+
+    return _handle
+
+
+def make_async_route_handler(policy: ResourcePolicy, stats: BlockingStats):
+    """Return an async Playwright route handler enforcing `policy`."""
+
+    async def _handle(route) -> None:
+        request = route.request
+        if policy.should_block(request.url, request.resource_type):
+            stats.record_blocked(request.resource_type)
+            await route.abort()
+        else:
+            stats.record_allowed()
+            await route.fallback()
+
+    return _handle
+
+
+def _host_matches(host: str, patterns: Tuple[str, ...]) -> bool:
+    for pattern in patterns:
+        pattern = pattern.lower().lstrip(".")
+        if host == pattern or host.endswith("." + pattern):
+            return True
+    return False
@@ -1,17 +1,56 @@
 ﻿"""Site registry and per-site crawl settings."""
 
+import re
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Pattern, Tuple
+
+import soupsieve
+
+from .resource_blocking import MEDIA_RESOURCE_TYPES, TRACKER_HOSTS
+
+
+EXTRACT_JSON_LD = "json-ld"
+EXTRACT_GENERIC = "generic"
+EXTRACT_LINKEDIN = "linkedin"
 
 
 @dataclass(frozen=True)
 class SiteConfig:
-    """Configuration for a supported job site."""
+    """Configuration for a supported job site.
+
+    `fetch_strategy` applies to job detail pages: "browser" always renders,
+    "http-first" tries a plain GET and renders only if the static HTML lacks
+    the JobPosting JSON-LD or `ready_selector`. Search results page `n`
+    (zero-based) sets `page_param` to `page_start + n * page_step`. Job
+    detail URLs contain `job_url_host` in their host and `job_url_path` in
+    their path. `extraction` names how detail pages are parsed ("json-ld",
+    "generic" with `description_selector`, or "linkedin").
+
+    A site is detected when the label of its registrable domain equals its
+    `name` (www.stepstone.de -> "stepstone"; xing.example.com -> none).
+    """
 
     name: str
     follow_iframe: bool = False
     iframe_selector: str = "iframe"
     wait_jobposting: bool = False
+    max_concurrency: int = 2
+    requests_per_second: float = 1.0
+    burst: int = 2
+    blocked_resource_types: Tuple[str, ...] = ()
+    blocked_hosts: Tuple[str, ...] = ()
+    allowed_hosts: Tuple[str, ...] = ()
+    fetch_strategy: str = "browser"
+    ready_selector: Optional[str] = None
+    page_param: Optional[str] = None
+    page_start: int = 1
+    page_step: int = 1
+    max_pages: int = 5
+    job_url_host: str = ""
+    job_url_path: str = "/jobs/"
+    extraction: str = EXTRACT_GENERIC
+    description_selector: Optional[str] = None
 
 
 SITE_CONFIGS = {
@@ -20,43 +59,149 @@ SITE_CONFIGS = {
         follow_iframe=True,
         iframe_selector="iframe#jobFrame",
         wait_jobposting=False,
+        blocked_resource_types=MEDIA_RESOURCE_TYPES,
+        blocked_hosts=TRACKER_HOSTS,
+        requests_per_second=0.5,
+        job_url_host="accso.de",
+        job_url_path="/dabei-sein/jobs/",
+        description_selector=".step-stone-job-ad",
     ),
     "xing": SiteConfig(
         name="xing",
         follow_iframe=False,
         iframe_selector="iframe",
         wait_jobposting=True,
+        blocked_resource_types=MEDIA_RESOURCE_TYPES,
+        blocked_hosts=TRACKER_HOSTS,
+        fetch_strategy="http-first",
+        page_param="offset",
+        page_start=0,
+        page_step=20,
+        job_url_host="xing.com",
+        extraction=EXTRACT_JSON_LD,
     ),
     "stepstone": SiteConfig(
         name="stepstone",
         follow_iframe=False,
         iframe_selector="iframe",
         wait_jobposting=True,
+        blocked_resource_types=MEDIA_RESOURCE_TYPES,
+        blocked_hosts=TRACKER_HOSTS,
+        fetch_strategy="http-first",
+        page_param="page",
+        page_start=1,
+        page_step=1,
+        job_url_host="stepstone.de",
+        extraction=EXTRACT_JSON_LD,
     ),
     "linkedin": SiteConfig(
         name="linkedin",
         follow_iframe=False,
         iframe_selector="iframe",
         wait_jobposting=False,
+        max_concurrency=1,
+        requests_per_second=0.3,
+        page_param="start",
+        page_start=0,
+        page_step=25,
+        job_url_host="linkedin.com",
+        job_url_path="/jobs/view/",
+        extraction=EXTRACT_LINKEDIN,
     ),
 }
 
 
+@dataclass(frozen=True)
+class SiteProfile:
+    """A SiteConfig with its URL rule and selectors compiled once.
+
+    `job_url` matches absolute job detail URLs (see `is_job_detail_url`);
+    `ready_selector` is the compiled soupsieve form of the config's
+    selector, for BeautifulSoup trees.
+    """
+
+    config: SiteConfig
+    job_url: Pattern[str]
+    ready_selector: Optional[soupsieve.SoupSieve] = None
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def fetch_strategy(self) -> str:
+        return self.config.fetch_strategy
+
+    @property
+    def extraction(self) -> str:
+        return self.config.extraction
+
+
+@lru_cache(maxsize=None)
+def site_profile(site: Optional[SiteConfig]) -> SiteProfile:
+    """Return the compiled profile of `site` (None: the generic profile).
+
+    Compiled once per distinct config; registered sites are compiled at
+    import time.
+    """
+
+    if site is None:
+        return SiteProfile(config=SiteConfig(name=""), job_url=_job_url_pattern("", "/jobs/"))
+    ready = soupsieve.compile(site.ready_selector) if site.ready_selector else None
+    return SiteProfile(config=site, job_url=_job_url_pattern(site.job_url_host, site.job_url_path), ready_selector=ready)
+
+
+def _job_url_pattern(host: str, path: str) -> Pattern[str]:
+    # scheme://[userinfo@]host-containing-`host`[:port] then a path containing `path`.
+    return re.compile(
+        rf"[^:/?#]+://[^/?#]*{re.escape(host)}[^/?#]*(?=/)[^?#]*{re.escape(path)}",
+        re.IGNORECASE,
+    )
+
+
+SITE_PROFILES: Dict[str, SiteProfile] = {name: site_profile(config) for name, config in SITE_CONFIGS.items()}
+_PROFILES_BY_LABEL: Dict[str, SiteProfile] = {profile.name: profile for profile in SITE_PROFILES.values()}
+# Second-level labels that ccTLDs register under (jobs.stepstone.co.uk).
+_CC_SECOND_LEVEL = frozenset({"ac", "co", "com", "gov", "net", "or", "org"})
+_HOST = re.compile(r"^(?:[^:/?#]+:)?//(?:[^/?#@]*@)?([^/?#:]*)")
+
+
 def detect_site(url: str) -> Optional[SiteConfig]:
     """Identify site configuration by URL.
 
     Returns None if the URL does not match a supported site.
     """
 
+    profile = profile_for_url(url)
+    return profile.config if profile else None
+
+
+def profile_for_url(url: str) -> Optional[SiteProfile]:
+    """Return the compiled profile for a URL's host, or None if unsupported.
+
+    Scheme-less URLs ("www.xing.com/jobs") are read as host-first.
+    """
+
     if not url:
         return None
-    lowered = url.lower()
-    if "accso" in lowered:
-        return SITE_CONFIGS["accso"]
-    if "xing.com" in lowered:
-        return SITE_CONFIGS["xing"]
-    if "stepstone" in lowered:
-        return SITE_CONFIGS["stepstone"]
-    if "linkedin.com" in lowered:
-        return SITE_CONFIGS["linkedin"]
-    return None
+    match = _HOST.match(url if "//" in url else "//" + url)
+    return _profile_for_host(match.group(1).lower()) if match else None
+
+
+@lru_cache(maxsize=1024)
+def _profile_for_host(host: str) -> Optional[SiteProfile]:
+    labels = host.rstrip(".").split(".")
+    if len(labels) < 2:
+        return None
+    # The registrable domain is the label just left of the public suffix.
+    cc_suffix = len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _CC_SECOND_LEVEL
+    return _PROFILES_BY_LABEL.get(labels[-3] if cc_suffix else labels[-2])
+
+
+def is_job_detail_url(url: str, site: Optional[SiteConfig]) -> bool:
+    """Return True if an absolute URL looks like a job detail page of `site`.
+
+    Without a site only the generic "/jobs/" path rule applies.
+    """
+
+    return site_profile(site).job_url.match(url) is not None
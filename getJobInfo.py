@@ -5,30 +5,7 @@ from typing import Optional
 
 import job_detail_parser as jdp
 import playwright_fetch_html as pfh
-
-
-SITE_CONFIG = {
-    "accso": {
-        "follow_iframe": True,
-        "iframe_selector": "iframe#jobFrame",
-        "wait_jobposting": False,
-    },
-    "xing": {
-        "follow_iframe": False,
-        "iframe_selector": "iframe",
-        "wait_jobposting": True,
-    },
-    "stepstone": {
-        "follow_iframe": False,
-        "iframe_selector": "iframe",
-        "wait_jobposting": True,
-    },
-    "linkedin": {
-        "follow_iframe": False,
-        "iframe_selector": "iframe",
-        "wait_jobposting": False,
-    },
-}
+from crawling.site_registry import EXTRACT_JSON_LD, EXTRACT_LINKEDIN, SITE_CONFIGS
 
 
 def parse_args() -> argparse.Namespace:
@@ -62,18 +39,18 @@ def resolve_output(site: str, override: Optional[str]) -> Path:
 
 
 def fetch_html(url: str, site: str) -> str:
-    config = SITE_CONFIG[site]
+    config = SITE_CONFIGS[site]
     html = pfh.fetch_rendered_html(
         url=url,
         wait_for=None,
         timeout_ms=20000,
         headless=True,
-        wait_jobposting=config["wait_jobposting"],
+        wait_jobposting=config.wait_jobposting,
     )
-    if config["follow_iframe"]:
+    if config.follow_iframe:
         iframe_url = pfh.extract_iframe_src(
             html,
-            config["iframe_selector"],
+            config.iframe_selector,
             url,
         )
         if iframe_url:
@@ -82,21 +59,24 @@ def fetch_html(url: str, site: str) -> str:
                 wait_for=None,
                 timeout_ms=20000,
                 headless=True,
-                wait_jobposting=config["wait_jobposting"],
+                wait_jobposting=config.wait_jobposting,
             )
     return html
 
 
 def parse_result(html: str, site: str) -> str:
-    if site in {"xing", "stepstone"}:
+    config = SITE_CONFIGS.get(site)
+    if config is None:
+        raise ValueError(f"Unsupported site: {site}")
+    if config.extraction == EXTRACT_JSON_LD:
         posting = jdp.extract_jobposting_json_ld(html)
         if not posting:
             raise ValueError("No JobPosting JSON-LD found in HTML.")
         return json.dumps(posting, ensure_ascii=True, indent=2)
-    if site == "accso":
-        return jdp.extract_text_by_selector(html, ".step-stone-job-ad")
-    if site == "linkedin":
+    if config.extraction == EXTRACT_LINKEDIN:
         return jdp.extract_description_linkedin(html)
+    if config.description_selector:
+        return jdp.extract_text_by_selector(html, config.description_selector)
     raise ValueError(f"Unsupported site: {site}")
 
 
@@ -1,5 +1,13 @@
 ﻿"""Integrations package exports."""
 
-from .linkedin_scraper import fetch_linkedin_job_urls
+from .linkedin_scraper import LinkedInCollection, collect_linkedin_job_urls, fetch_linkedin_job_urls
+from .linkedin_session import LinkedInSession, close_linkedin_session, get_linkedin_session
 
-__all__ = ["fetch_linkedin_job_urls"]
+__all__ = [
+    "LinkedInCollection",
+    "collect_linkedin_job_urls",
+    "fetch_linkedin_job_urls",
+    "LinkedInSession",
+    "close_linkedin_session",
+    "get_linkedin_session",
+]
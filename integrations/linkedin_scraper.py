@@ -6,33 +6,174 @@ returns an empty list unless `LINKEDIN_SCRAPE=1` is set in the environment.
 
 from __future__ import annotations
 
-from typing import List
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 
-from core.runtime import get_env, run_async
+from core.runtime import get_env
 
+from .linkedin_session import LinkedInSession, get_linkedin_session
 
-def fetch_linkedin_job_urls(query) -> List[str]:
+if TYPE_CHECKING:
+    from crawling.rate_limiter import RateLimiter
+
+
+@dataclass
+class LinkedInCollection:
+    """Job URLs gathered from LinkedIn search pages, with errors and timings.
+
+    `urls` keeps first-seen order by query, then result page. `errors` maps
+    each failed search page URL to its error; pages that succeeded still
+    contribute their URLs.
+    """
+
+    urls: List[str] = field(default_factory=list)
+    errors: Dict[str, str] = field(default_factory=dict)
+    page_times_s: Dict[str, float] = field(default_factory=dict)
+    pages_fetched: int = 0
+    elapsed_s: float = 0.0
+
+
+def fetch_linkedin_job_urls(query, max_pages: Optional[int] = None, concurrency: int = 2) -> List[str]:
     """Collect LinkedIn job URLs based on a search query.
 
     Args:
         query: JobQuery-like object with `keywords` and `location` attributes.
+        max_pages: Result pages per query (default: the site's max_pages).
+        concurrency: Search pages scraped at once over the shared session.
 
     Returns:
         A list of LinkedIn job URLs. Returns an empty list when scraping is
-        disabled or if scraping fails.
+        disabled; pages that fail are skipped.
     """
 
-    search_url = _build_linkedin_search_url(query)
-    if not search_url:
-        return []
-
     if get_env("LINKEDIN_SCRAPE") != "1":
         return []
+    return collect_linkedin_job_urls([query], max_pages=max_pages, concurrency=concurrency).urls
 
-    try:
-        return run_async(_scrape_job_urls(search_url))
-    except Exception:
-        return []
+
+def collect_linkedin_job_urls(
+    queries: Iterable,
+    max_pages: Optional[int] = None,
+    concurrency: int = 2,
+    session: Optional[LinkedInSession] = None,
+    rate_limiter: Optional["RateLimiter"] = None,
+    first_page: int = 0,
+) -> LinkedInCollection:
+    """Scrape paginated LinkedIn search results for several queries at once.
+
+    Args:
+        queries: JobQuery-like objects.
+        max_pages: Result pages per query (default: the site's max_pages).
+        concurrency: Search pages scraped at once; the session gets at least
+            this many warm pages.
+        session: LinkedIn session to use (default: the shared session).
+        rate_limiter: Per-host limiter every page waits on; pass the run's
+            shared limiter so LinkedIn's rate is kept across fetch paths.
+        first_page: Zero-based index of the first result page to scrape.
+
+    The collection runs on the session's own event loop, so this may be
+    called from a thread that has a sync Playwright browser open.
+
+    Returns:
+        LinkedInCollection: Deduplicated URLs plus per-page errors and timings.
+
+    Raises:
+        ValueError: If concurrency is not positive.
+    """
+
+    session = session or get_linkedin_session()
+    return session.run(
+        collect_linkedin_job_urls_async(
+            queries,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            session=session,
+            rate_limiter=rate_limiter,
+            first_page=first_page,
+        )
+    )
+
+
+async def collect_linkedin_job_urls_async(
+    queries: Iterable,
+    max_pages: Optional[int] = None,
+    concurrency: int = 2,
+    session: Optional[LinkedInSession] = None,
+    rate_limiter: Optional["RateLimiter"] = None,
+    first_page: int = 0,
+) -> LinkedInCollection:
+    """Async variant of `collect_linkedin_job_urls`.
+
+    Pages are scheduled page-index first across queries. Once a page of a
+    query yields no new URLs, its later pages that have not started yet are
+    skipped.
+    """
+
+    from crawling.pagination import page_url
+    from crawling.rate_limiter import RateLimiter
+    from crawling.site_registry import SITE_CONFIGS
+
+    if concurrency < 1:
+        raise ValueError("collect_linkedin_job_urls requires concurrency of at least 1.")
+    site = SITE_CONFIGS["linkedin"]
+    pages = site.max_pages if max_pages is None else max_pages
+    search_urls = list(dict.fromkeys(url for url in map(_build_linkedin_search_url, queries) if url))
+    collection = LinkedInCollection()
+    if not search_urls or pages < 1:
+        return collection
+
+    session = session or get_linkedin_session()
+    rate_limiter = rate_limiter or RateLimiter()
+    last_page = first_page + pages
+    await session.reserve_pages_async(concurrency)
+    limit = asyncio.Semaphore(concurrency)
+    results: Dict[Tuple[int, int], List[str]] = {}
+    exhausted: Dict[int, int] = {}
+    started = time.perf_counter()
+
+    def _skipped(query_index: int, page_index: int) -> bool:
+        return exhausted.get(query_index, last_page) < page_index
+
+    async def _scrape(query_index: int, page_index: int, url: str) -> None:
+        async with limit:
+            if _skipped(query_index, page_index):
+                return
+            await rate_limiter.acquire_async(url)
+            if _skipped(query_index, page_index):
+                return
+            page_started = time.perf_counter()
+            try:
+                urls = await session.search_job_urls_async(url)
+            except Exception as exc:
+                rate_limiter.record_failure(url, exc)
+                collection.errors[url] = f"{type(exc).__name__}: {exc}"
+                return
+            finally:
+                collection.page_times_s[url] = time.perf_counter() - page_started
+            rate_limiter.record_success(url)
+            collection.pages_fetched += 1
+            results[(query_index, page_index)] = urls
+            if not urls:
+                exhausted[query_index] = min(exhausted.get(query_index, last_page), page_index)
+
+    tasks = []
+    for page_index in range(first_page, last_page):
+        for query_index, search_url in enumerate(search_urls):
+            url = page_url(search_url, site, page_index)
+            if url is not None:
+                tasks.append(_scrape(query_index, page_index, url))
+    await asyncio.gather(*tasks)
+
+    seen: Set[str] = set()
+    for key in sorted(results):
+        for url in results[key]:
+            if url not in seen:
+                seen.add(url)
+                collection.urls.append(url)
+    collection.elapsed_s = time.perf_counter() - started
+    return collection
 
 
 def _build_linkedin_search_url(query) -> str:
@@ -46,11 +187,13 @@ def _build_linkedin_search_url(query) -> str:
     """
 
     try:
+        from crawling.site_registry import EXTRACT_LINKEDIN, detect_site
         from crawling.url_generator import build_search_urls
 
         urls = build_search_urls(query)
         for url in urls:
-            if "linkedin.com/jobs/search" in url:
+            site = detect_site(url)
+            if site is not None and site.extraction == EXTRACT_LINKEDIN and "/jobs/search" in url:
                 return url
     except Exception:
         pass
@@ -68,30 +211,4 @@ async def _scrape_job_urls(search_url: str) -> List[str]:
         A list of job posting URLs, deduplicated.
     """
 
-    from linkedin_scraper import (
-        BrowserManager,
-        JobSearchScraper,
-        load_credentials_from_env,
-        login_with_cookie,
-        login_with_credentials,
-    )
-
-    async with BrowserManager() as browser:
-        page = browser.page
-        email, password = load_credentials_from_env()
-        cookie = get_env("LINKEDIN_COOKIE")
-        if cookie:
-            await login_with_cookie(page, cookie)
-        elif email and password:
-            await login_with_credentials(page, email, password)
-
-        scraper = JobSearchScraper(page)
-        jobs = await scraper.scrape(search_url)
-
-    urls: List[str] = []
-    if jobs:
-        for job in jobs:
-            url = getattr(job, "linkedin_url", None)
-            if url and url not in urls:
-                urls.append(url)
-    return urls
+    return await get_linkedin_session().search_job_urls_async(search_url)
@@ -0,0 +1,289 @@
+"""Shared, long-lived LinkedIn browser session.
+
+One `LinkedInSession` logs in once, keeps a small pool of warm pages and
+serves both job-URL collection and job-detail scraping. The session runs on
+its own event loop in a background thread, so it can be used from sync code
+and from any other event loop alike.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, Awaitable, List, Optional, TypeVar
+
+from core.runtime import get_env
+from crawling.site_registry import EXTRACT_LINKEDIN, detect_site
+
+
+T = TypeVar("T")
+
+LOGIN_WALL_MARKERS = ("/login", "/authwall", "/checkpoint", "/uas/")
+
+
+class LinkedInSession:
+    """Logged-in LinkedIn browser with a pool of reusable pages.
+
+    Credentials and session reuse follow the same env vars as before:
+    LINKEDIN_EMAIL, LINKEDIN_PASSWORD, LINKEDIN_COOKIE,
+    LINKEDIN_SESSION_PATH (default: session.json) and LINKEDIN_SAVE_SESSION=1.
+    A stored session is trusted until a page lands on a login wall; only then
+    does the session log in again (and re-save, if enabled).
+    """
+
+    def __init__(self, headless: bool = True, pages: int = 1) -> None:
+        if pages < 1:
+            raise ValueError("LinkedInSession.pages must be at least 1.")
+        self.headless = headless
+        self.pages = pages
+        self.logins = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._manager: Any = None
+        self._browser: Any = None
+        self._idle_pages: Optional[asyncio.Queue] = None
+        self._ready = False
+        self._loop_lock = threading.Lock()
+        self._start_lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._ready
+
+    def scrape_job(self, url: str) -> str:
+        """Return the job description (or page HTML) for a LinkedIn job URL."""
+
+        return self._call(self._scrape_job(url))
+
+    async def scrape_job_async(self, url: str) -> str:
+        """Async variant of `scrape_job`, usable from any event loop."""
+
+        return await self._call_async(self._scrape_job(url))
+
+    def search_job_urls(self, search_url: str) -> List[str]:
+        """Return job URLs listed on a LinkedIn search page."""
+
+        return self._call(self._search_job_urls(search_url))
+
+    async def search_job_urls_async(self, search_url: str) -> List[str]:
+        """Async variant of `search_job_urls`, usable from any event loop."""
+
+        return await self._call_async(self._search_job_urls(search_url))
+
+    def reserve_pages(self, count: int) -> None:
+        """Make sure at least `count` pages can scrape concurrently."""
+
+        self._call(self._reserve_pages(count))
+
+    async def reserve_pages_async(self, count: int) -> None:
+        """Async variant of `reserve_pages`, usable from any event loop."""
+
+        await self._call_async(self._reserve_pages(count))
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine on the session's event loop and return its result.
+
+        Unlike `asyncio.run`, this works from threads that already have a
+        running loop set, such as one that has made sync Playwright calls.
+        """
+
+        return self._call(coro)
+
+    def close(self) -> None:
+        """Close the browser and stop the session's event loop."""
+
+        loop = self._loop
+        if loop is None:
+            return
+        if self._browser is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result()
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+        loop.close()
+        self._loop = None
+        self._thread = None
+
+    def _call(self, coro: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    async def _call_async(self, coro: Awaitable[T]) -> T:
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        return await asyncio.wrap_future(future)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="linkedin-session", daemon=True)
+                thread.start()
+                self._loop = loop
+                self._thread = thread
+            return self._loop
+
+    async def _scrape_job(self, url: str) -> str:
+        from linkedin_scraper import JobScraper
+
+        async with self._page() as page:
+            job = await self._with_login_retry(page, lambda: JobScraper(page).scrape(url))
+            description = getattr(job, "job_description", None)
+            if description:
+                return description
+            return await page.content()
+
+    async def _search_job_urls(self, search_url: str) -> List[str]:
+        from linkedin_scraper import JobSearchScraper
+
+        async with self._page() as page:
+            jobs = await self._with_login_retry(page, lambda: JobSearchScraper(page).scrape(search_url))
+        urls = [getattr(job, "linkedin_url", None) for job in (jobs or [])]
+        return list(dict.fromkeys(url for url in urls if url))
+
+    async def _reserve_pages(self, count: int) -> None:
+        async with self._start_lock:
+            if count <= self.pages:
+                return
+            if self._ready:
+                context = self._browser.page.context
+                for _ in range(count - self.pages):
+                    self._idle_pages.put_nowait(await context.new_page())
+            self.pages = count
+
+    async def _with_login_retry(self, page, scrape):
+        generation = self.logins
+        try:
+            result = await scrape()
+        except Exception:
+            # Scrapers often fail outright on a login wall; re-auth once then.
+            if not _is_login_wall(page.url):
+                raise
+        else:
+            if not _is_login_wall(page.url):
+                return result
+        await self._login(page, seen_logins=generation)
+        return await scrape()
+
+    @asynccontextmanager
+    async def _page(self):
+        await self._start()
+        page = await self._idle_pages.get()
+        try:
+            yield page
+        finally:
+            self._idle_pages.put_nowait(page)
+
+    async def _start(self) -> None:
+        if self._ready:
+            return
+        async with self._start_lock:
+            if not self._ready:
+                await self._launch()
+
+    async def _launch(self) -> None:
+        try:
+            from linkedin_scraper import BrowserManager
+        except Exception as exc:
+            raise RuntimeError(
+                "LinkedIn crawling requires linkedin_scraper and playwright."
+            ) from exc
+
+        manager = BrowserManager(headless=self.headless)
+        browser = await manager.__aenter__()
+        self._manager = manager
+        self._browser = browser
+        try:
+            session_path = _session_path()
+            if session_path.exists():
+                await browser.load_session(str(session_path))
+
+            first = browser.page
+            pages = [first]
+            for _ in range(self.pages - 1):
+                pages.append(await first.context.new_page())
+            self._idle_pages = asyncio.Queue()
+            for page in pages:
+                self._idle_pages.put_nowait(page)
+
+            if not session_path.exists():
+                await self._login(first, seen_logins=self.logins)
+        except BaseException:
+            # Do not leave the just-started driver and browser running.
+            try:
+                await self._shutdown()
+            except Exception:
+                pass
+            raise
+        self._ready = True
+
+    async def _login(self, page, seen_logins: int) -> None:
+        from linkedin_scraper import load_credentials_from_env, login_with_cookie, login_with_credentials
+
+        async with self._login_lock:
+            if self.logins != seen_logins:
+                return  # Another task already refreshed the session.
+            email, password = load_credentials_from_env()
+            cookie = get_env("LINKEDIN_COOKIE")
+            if cookie:
+                await login_with_cookie(page, cookie)
+            elif email and password:
+                await login_with_credentials(page, email, password)
+            else:
+                return
+            self.logins += 1
+            if get_env("LINKEDIN_SAVE_SESSION") == "1":
+                await self._browser.save_session(str(_session_path()))
+
+    async def _shutdown(self) -> None:
+        manager = self._manager
+        self._ready = False
+        self._manager = None
+        self._browser = None
+        self._idle_pages = None
+        if manager is not None:
+            await manager.__aexit__(None, None, None)
+
+
+_shared_session: Optional[LinkedInSession] = None
+_shared_lock = threading.Lock()
+
+
+def get_linkedin_session(headless: bool = True) -> LinkedInSession:
+    """Return the process-wide LinkedIn session, creating it on first use."""
+
+    global _shared_session
+    with _shared_lock:
+        if _shared_session is None:
+            _shared_session = LinkedInSession(headless=headless)
+        return _shared_session
+
+
+def close_linkedin_session() -> None:
+    """Close the process-wide LinkedIn session, if one was started."""
+
+    global _shared_session
+    with _shared_lock:
+        session, _shared_session = _shared_session, None
+    if session is not None:
+        session.close()
+
+
+atexit.register(close_linkedin_session)
+
+
+def _session_path() -> Path:
+    return Path(get_env("LINKEDIN_SESSION_PATH") or "session.json")
+
+
+def _is_login_wall(url: str) -> bool:
+    site = detect_site(url)
+    if site is None or site.extraction != EXTRACT_LINKEDIN:
+        return False
+    lowered = url.lower()
+    return any(marker in lowered for marker in LOGIN_WALL_MARKERS)
@@ -3,9 +3,15 @@ import json
 from dataclasses import dataclass
 from html import unescape
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Iterator, List, Optional, Union
 
-from bs4 import BeautifulSoup
+from crawling.site_registry import EXTRACT_JSON_LD, EXTRACT_LINKEDIN, SITE_CONFIGS
+from parsing.backends import parse_html
+from parsing.keyword_matcher import compile_keywords
+from parsing.parsed_page import ParsedPage, as_parsed_page
+
+
+LINKEDIN_JOB_POSTING_TYPE = "com.linkedin.voyager.dash.jobs.JobPosting"
 
 
 @dataclass(frozen=True)
@@ -20,7 +26,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("input", help="Path to the saved HTML file")
     parser.add_argument(
         "--site",
-        choices=["linkedin", "json-ld", "generic", "xing", "stepstone", "accso"],
+        choices=["json-ld", "generic", *SITE_CONFIGS],
         default="generic",
         help="Site type to use for parsing",
     )
@@ -42,28 +48,29 @@ def parse_args() -> argparse.Namespace:
 
 
 def parse_job_detail(
-    html: str,
+    html: Union[str, ParsedPage],
     site_type: str,
     keywords: Optional[List[str]],
     selector: Optional[str],
 ) -> JobDetail:
     """Dispatch extraction based on site type."""
+    page = as_parsed_page(html)
     if site_type == "linkedin":
-        description = extract_description_linkedin(html)
+        description = extract_description_linkedin(page)
     elif site_type == "json-ld":
-        description = extract_description_json_ld(html)
+        description = extract_description_json_ld(page)
     elif site_type == "generic":
         if selector:
-            description = extract_text_by_selector(html, selector)
+            description = extract_text_by_selector(page, selector)
         else:
-            description = extract_description_by_keywords(html, keywords or [])
+            description = extract_description_by_keywords(page, keywords or [])
     else:
         raise ValueError(f"Unsupported site type: {site_type}")
 
     return JobDetail(description=description)
 
 
-def extract_description_linkedin(html: str) -> str:
+def extract_description_linkedin(html: Union[str, ParsedPage]) -> str:
     """Extract LinkedIn JobPosting description from embedded JSON in <code>."""
     payload = load_payload_from_html(html)
     job = find_job_posting(payload)
@@ -72,26 +79,60 @@ def extract_description_linkedin(html: str) -> str:
     return (job.get("description") or {}).get("text", "")
 
 
-def load_payload_from_html(html: str) -> dict:
-    """Extract the first JSON payload that contains a JobPosting entity."""
-    soup = BeautifulSoup(html, "html.parser")
-    payloads: List[dict] = []
-    for code in soup.find_all("code"):
-        text = unescape(code.get_text(strip=True))
-        if not text.startswith("{"):
-            continue
-        try:
-            payloads.append(json.loads(text))
-        except json.JSONDecodeError:
-            continue
+def load_payload_from_html(html: Union[str, ParsedPage]) -> dict:
+    """Extract the first JSON payload that contains a JobPosting entity.
 
-    for payload in payloads:
-        if find_job_posting(payload):
+    <code> blocks are first read from the raw markup, and only those whose
+    raw text contains the JobPosting type are unescaped and decoded; the
+    scan stops at the first match. The DOM is parsed only when that finds
+    nothing (e.g. malformed markup), and is then read block by block.
+    """
+    page = as_parsed_page(html)
+    for text in _marked_code_texts(page.html):
+        payload = _decode_code_payload(text)
+        if payload is not None and find_job_posting(payload):
+            return payload
+
+    for code in page.document.select("code"):
+        payload = _decode_code_payload(unescape(code.text("")))
+        if payload is not None and find_job_posting(payload):
             return payload
 
     raise ValueError("No JSON payload with a JobPosting entity found in <code> tags.")
 
 
+def _marked_code_texts(html: str) -> Iterator[str]:
+    """Yield the decoded text of raw <code> blocks containing the JobPosting type.
+
+    Jumps from marker to marker with str.find, so unrelated blocks are never
+    scanned character by character, let alone decoded.
+    """
+    marker = html.find(LINKEDIN_JOB_POSTING_TYPE)
+    while marker >= 0:
+        opening = html.rfind("<code", 0, marker)
+        closing = html.find("</code", marker)
+        body_start = html.find(">", opening) + 1 if opening >= 0 else 0
+        if opening < 0 or closing < 0 or not 0 < body_start <= marker or html.rfind("</code", opening, marker) >= 0:
+            # Marker outside a <code> element (or the tag is unreadable).
+            marker = html.find(LINKEDIN_JOB_POSTING_TYPE, marker + 1)
+            continue
+        body = html[body_start:closing]
+        # Bodies with child tags are left to the DOM fallback.
+        if "<" not in body:
+            # Same text as unescape(code.text("")) on the parsed element.
+            yield unescape(unescape(body).strip())
+        marker = html.find(LINKEDIN_JOB_POSTING_TYPE, closing)
+
+
+def _decode_code_payload(text: str) -> Optional[dict]:
+    if not text.startswith("{"):
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
+
+
 def find_job_posting(payload: dict) -> Optional[dict]:
     """Locate the JobPosting entity by recursively walking the payload."""
     direct = _find_job_posting_in_node(payload.get("included", []))
@@ -103,7 +144,7 @@ def find_job_posting(payload: dict) -> Optional[dict]:
 def _find_job_posting_in_node(node) -> Optional[dict]:
     """Depth-first search for a JobPosting entity in a nested structure."""
     if isinstance(node, dict):
-        if node.get("$type") == "com.linkedin.voyager.dash.jobs.JobPosting":
+        if node.get("$type") == LINKEDIN_JOB_POSTING_TYPE:
             return node
         for value in node.values():
             found = _find_job_posting_in_node(value)
@@ -117,7 +158,7 @@ def _find_job_posting_in_node(node) -> Optional[dict]:
     return None
 
 
-def extract_description_json_ld(html: str) -> str:
+def extract_description_json_ld(html: Union[str, ParsedPage]) -> str:
     """Extract JobPosting description from JSON-LD (schema.org)."""
     posting = extract_jobposting_json_ld(html)
     if posting and posting.get("description"):
@@ -126,17 +167,9 @@ def extract_description_json_ld(html: str) -> str:
     raise ValueError("No JobPosting JSON-LD found in HTML.")
 
 
-def extract_jobposting_json_ld(html: str) -> dict:
+def extract_jobposting_json_ld(html: Union[str, ParsedPage]) -> dict:
     """Return the JobPosting JSON-LD object if present."""
-    soup = BeautifulSoup(html, "html.parser")
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        text = script.get_text(strip=True)
-        if not text:
-            continue
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            continue
+    for payload in as_parsed_page(html).json_ld:
         posting = _find_json_ld_jobposting(payload)
         if posting:
             return posting
@@ -160,51 +193,33 @@ def _find_json_ld_jobposting(payload) -> Optional[dict]:
     return None
 
 
-def extract_description_by_keywords(html: str, keywords: List[str]) -> str:
+def extract_description_by_keywords(html: Union[str, ParsedPage], keywords: List[str]) -> str:
     """Extract description by locating the best text block matching keywords."""
     if not keywords:
         raise ValueError("Keywords are required for generic extraction.")
 
-    normalized_keywords = [kw.strip().lower() for kw in keywords if kw.strip()]
+    normalized_keywords = tuple(kw.strip() for kw in keywords if kw.strip())
     if not normalized_keywords:
         raise ValueError("Keywords are required for generic extraction.")
 
-    soup = BeautifulSoup(html, "html.parser")
-    candidates = soup.find_all(["main", "section", "article", "div"])  # broad scope
-
-    best_text = ""
-    best_score = 0
-    for node in candidates:
-        text = _normalize_whitespace(node.get_text(" ", strip=True))
-        if not text:
-            continue
-        score = _keyword_score(text, normalized_keywords)
-        if score > best_score:
-            best_score = score
-            best_text = text
-
+    # Scores every main/section/article/div block in one pass.
+    best_text = as_parsed_page(html).block_index.best_block(compile_keywords(normalized_keywords))
     if not best_text:
         raise ValueError("No matching content found for the provided keywords.")
 
     return best_text
 
 
-def extract_text_by_selector(html: str, selector: str) -> str:
+def extract_text_by_selector(html: Union[str, ParsedPage], selector: str) -> str:
     """Extract text from the first node matching the selector."""
-    soup = BeautifulSoup(html, "html.parser")
-    node = soup.select_one(selector)
+    node = as_parsed_page(html).document.select_one(selector)
     if not node:
         raise ValueError(f"No element found for selector: {selector}")
-    return _normalize_whitespace(node.get_text(" ", strip=True))
-
-
-def _keyword_score(text: str, keywords: Iterable[str]) -> int:
-    lowered = text.lower()
-    return sum(1 for kw in keywords if kw in lowered)
+    return _normalize_whitespace(node.text(" "))
 
 
 def _strip_html(value: str) -> str:
-    return _normalize_whitespace(BeautifulSoup(value, "html.parser").get_text(" ", strip=True))
+    return _normalize_whitespace(parse_html(value).text(" "))
 
 
 def _normalize_whitespace(text: str) -> str:
@@ -213,9 +228,9 @@ def _normalize_whitespace(text: str) -> str:
 
 def main() -> int:
     args = parse_args()
-    if args.site in {"linkedin", "xing", "stepstone", "accso"}:
+    if args.site in SITE_CONFIGS:
         apply_preset(args)
-    html = Path(args.input).read_text(encoding="utf-8", errors="ignore")
+    html = ParsedPage(Path(args.input).read_text(encoding="utf-8", errors="ignore"))
     keywords = args.keywords.split(",") if args.keywords else None
     if args.output == "json-ld":
         posting = extract_jobposting_json_ld(html)
@@ -230,17 +245,17 @@ def main() -> int:
 
 
 def apply_preset(args: argparse.Namespace) -> None:
-    presets = {
-        "linkedin": {"site": "linkedin", "output": "description"},
-        "xing": {"site": "json-ld", "output": "json-ld"},
-        "stepstone": {"site": "json-ld", "output": "json-ld"},
-        "accso": {"site": "generic", "selector": ".step-stone-job-ad"},
-    }
-    preset = presets.get(args.site)
-    if not preset:
+    """Replace a site name with that site's extraction settings from the registry."""
+    config = SITE_CONFIGS.get(args.site)
+    if not config:
         return
-    for key, value in preset.items():
-        setattr(args, key, value)
+    args.site = config.extraction
+    if config.extraction == EXTRACT_JSON_LD:
+        args.output = "json-ld"
+    elif config.extraction == EXTRACT_LINKEDIN:
+        args.output = "description"
+    if config.description_selector:
+        args.selector = config.description_selector
 
 
 if __name__ == "__main__":
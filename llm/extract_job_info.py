@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
 from core.config import load_config
 from core.runtime import get_env
@@ -14,11 +14,15 @@ from llm.providers import LangChainOpenAIProvider
 
 PROMPT_PATH = Path("llm/prompts/extract_job.md")
 DEFAULT_MODEL = "gpt-4o-mini"
+EXTRACTED_FIELDS = ("futureTasks", "skills", "candidateProfile")
 
 
 def extract_job_fields(job: JobPosting) -> JobPosting:
     """Add tasks, skills, and candidate profile fields using an LLM.
 
+    Fields that are already filled (e.g. mapped from JSON-LD) are kept, and
+    the LLM is not called at all when none are missing.
+
     Args:
         job: JobPosting to enrich.
 
@@ -26,6 +30,9 @@ def extract_job_fields(job: JobPosting) -> JobPosting:
         JobPosting: The same object with fields populated.
     """
 
+    missing = missing_fields(job)
+    if not missing:
+        return job
     load_config()
     if get_env("PYTEST_CURRENT_TEST"):
         return _fallback(job)
@@ -40,20 +47,34 @@ def extract_job_fields(job: JobPosting) -> JobPosting:
         provider = LangChainOpenAIProvider(model=model, temperature=0.0)
         raw = provider.generate(prompt)
         payload = _safe_json(raw)
-        _apply_extract_payload(job, payload)
+        _apply_extract_payload(job, payload, missing)
         return job
     except Exception:
         return _fallback(job)
 
 
-def _apply_extract_payload(job: JobPosting, payload: Dict[str, Any]) -> None:
+def missing_fields(job: JobPosting) -> List[str]:
+    """Return the LLM-extracted fields that `job` does not have yet."""
+
+    return [name for name in EXTRACTED_FIELDS if not getattr(job, name)]
+
+
+def _apply_extract_payload(
+    job: JobPosting,
+    payload: Dict[str, Any],
+    fields: Iterable[str] = EXTRACTED_FIELDS,
+) -> None:
     future_tasks = payload.get("futureTasks") or []
     skills = payload.get("skills") or []
     candidate_profile = payload.get("candidateProfile") or []
 
-    job.futureTasks = list(future_tasks) if isinstance(future_tasks, list) else []
-    job.skills = list(skills) if isinstance(skills, list) else []
+    if "futureTasks" in fields:
+        job.futureTasks = list(future_tasks) if isinstance(future_tasks, list) else []
+    if "skills" in fields:
+        job.skills = list(skills) if isinstance(skills, list) else []
 
+    if "candidateProfile" not in fields:
+        return
     if isinstance(candidate_profile, list):
         job.candidateProfile = "\n".join(str(item) for item in candidate_profile)
     else:
@@ -0,0 +1,394 @@
+"""Pluggable HTML parser backends.
+
+Extractors work on the small `HtmlDocument` / `HtmlNode` interface below, so
+they run on selectolax (lexbor) or lxml (with cssselect) when installed and
+fall back to BeautifulSoup's pure-Python "html.parser" otherwise. Every
+backend returns the same text for a node: text pieces stripped and joined
+with a separator, excluding <script>, <style> and <template> contents.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from abc import ABC, abstractmethod
+from typing import Collection, Dict, List, Optional, Tuple
+
+from core.runtime import get_env
+
+
+SELECTOLAX = "selectolax"
+LXML = "lxml"
+HTML_PARSER = "html.parser"
+
+# Text pieces in document order, and the [start, end) piece range of each
+# selected element in document (pre)order.
+TextSpans = Tuple[List[str], List[Tuple[int, int]]]
+
+# Fastest first; "auto" picks the first one installed.
+BACKEND_PREFERENCE = (SELECTOLAX, LXML, HTML_PARSER)
+
+_NON_TEXT_TAGS = ("script", "style", "template")
+_REQUIRED_MODULES = {
+    SELECTOLAX: ("selectolax.lexbor",),
+    LXML: ("lxml.html", "cssselect"),
+    HTML_PARSER: ("bs4",),
+}
+
+
+class HtmlNode(ABC):
+    """One element of a parsed document."""
+
+    @abstractmethod
+    def text(self, separator: str = " ") -> str:
+        """Return the element's stripped text pieces joined by `separator`."""
+
+    @abstractmethod
+    def attr(self, name: str) -> Optional[str]:
+        """Return an attribute value, or None."""
+
+
+class HtmlDocument(ABC):
+    """A parsed HTML document queried with CSS selectors."""
+
+    backend: str = ""
+
+    @abstractmethod
+    def select(self, selector: str) -> List[HtmlNode]:
+        """Return every element matching `selector`, in document order."""
+
+    def select_one(self, selector: str) -> Optional[HtmlNode]:
+        """Return the first element matching `selector`, or None."""
+
+        matches = self.select(selector)
+        return matches[0] if matches else None
+
+    @abstractmethod
+    def script_texts(self, script_type: str) -> List[str]:
+        """Return the stripped contents of <script type=...> elements."""
+
+    @abstractmethod
+    def text(self, separator: str = " ") -> str:
+        """Return the text of the whole document, like `HtmlNode.text`."""
+
+    @abstractmethod
+    def text_spans(self, tags: Collection[str]) -> TextSpans:
+        """Return the document's text pieces and the piece span of every `tags` element.
+
+        One walk over the tree: an element's `text()` is its span's pieces
+        joined by the separator, so callers can work on element texts
+        without extracting the same subtree text once per ancestor.
+        """
+
+
+def available_backends() -> List[str]:
+    """Return the installed backends, fastest first."""
+
+    return [name for name in BACKEND_PREFERENCE if _is_installed(name)]
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """Return the backend to use for `name` ("auto", a backend name, or None).
+
+    None reads HTML_PARSER_BACKEND from the environment and defaults to
+    "auto".
+
+    Raises:
+        ValueError: If the name is unknown.
+        RuntimeError: If the requested backend is not installed.
+    """
+
+    name = name or get_env("HTML_PARSER_BACKEND") or "auto"
+    if name == "auto":
+        return available_backends()[0]
+    if name not in BACKEND_PREFERENCE:
+        raise ValueError(f"Unsupported parser backend: {name}")
+    if not _is_installed(name):
+        raise RuntimeError(f"The {name} parser backend is required but not installed.")
+    return name
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlDocument:
+    """Parse HTML with the resolved backend."""
+
+    name = resolve_backend(backend)
+    if name == SELECTOLAX:
+        return _SelectolaxDocument(html)
+    if name == LXML:
+        return _LxmlDocument(html)
+    return _SoupDocument(html)
+
+
+_installed: Dict[str, bool] = {}
+
+
+def _is_installed(name: str) -> bool:
+    if name not in _installed:
+        try:
+            _installed[name] = all(importlib.util.find_spec(module) for module in _REQUIRED_MODULES[name])
+        except ModuleNotFoundError:
+            _installed[name] = False
+    return _installed[name]
+
+
+class _SoupNode(HtmlNode):
+    __slots__ = ("_tag",)
+
+    def __init__(self, tag) -> None:
+        self._tag = tag
+
+    def text(self, separator: str = " ") -> str:
+        return self._tag.get_text(separator, strip=True)
+
+    def attr(self, name: str) -> Optional[str]:
+        value = self._tag.get(name)
+        if isinstance(value, list):
+            return " ".join(value)
+        return value
+
+
+class _SoupDocument(HtmlDocument):
+    """BeautifulSoup tree built by the pure-Python "html.parser"."""
+
+    backend = HTML_PARSER
+
+    def __init__(self, html: str) -> None:
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup(html or "", "html.parser")
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        return [_SoupNode(tag) for tag in self._soup.select(selector)]
+
+    def select_one(self, selector: str) -> Optional[HtmlNode]:
+        tag = self._soup.select_one(selector)
+        return _SoupNode(tag) if tag is not None else None
+
+    def script_texts(self, script_type: str) -> List[str]:
+        return [
+            script.get_text(strip=True)
+            for script in self._soup.find_all("script", attrs={"type": script_type})
+        ]
+
+    def text(self, separator: str = " ") -> str:
+        return self._soup.get_text(separator, strip=True)
+
+    def text_spans(self, tags: Collection[str]) -> TextSpans:
+        from bs4 import CData, NavigableString, Tag
+
+        # Exact types, as in get_text(): Script, Stylesheet, TemplateString
+        # and Comment subclasses are not text.
+        text_types = (NavigableString, CData)
+        pieces: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        stack: list = [self._soup]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, int):
+                spans[node] = (spans[node][0], len(pieces))
+            elif type(node) in text_types:
+                piece = node.strip()
+                if piece:
+                    pieces.append(piece)
+            elif isinstance(node, Tag):
+                if node.name in tags:
+                    stack.append(len(spans))
+                    spans.append((len(pieces), len(pieces)))
+                stack.extend(reversed(node.contents))
+        return pieces, spans
+
+
+class _SelectolaxNode(HtmlNode):
+    __slots__ = ("_node",)
+
+    def __init__(self, node) -> None:
+        self._node = node
+
+    def text(self, separator: str = " ") -> str:
+        pieces = (piece.strip() for piece in self._node.text(deep=True, separator="\0").split("\0"))
+        return separator.join(piece for piece in pieces if piece)
+
+    def attr(self, name: str) -> Optional[str]:
+        return self._node.attributes.get(name)
+
+
+class _SelectolaxDocument(HtmlDocument):
+    """lexbor tree; script/style/template are removed before text is read.
+
+    Scripts are therefore only reachable through `script_texts`.
+    """
+
+    backend = SELECTOLAX
+
+    def __init__(self, html: str) -> None:
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._tree = LexborHTMLParser(html or "")
+        self._scripts: Optional[Dict[str, List[str]]] = None
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        self._strip_non_text()
+        return [_SelectolaxNode(node) for node in self._tree.css(selector)]
+
+    def select_one(self, selector: str) -> Optional[HtmlNode]:
+        self._strip_non_text()
+        node = self._tree.css_first(selector)
+        return _SelectolaxNode(node) if node is not None else None
+
+    def script_texts(self, script_type: str) -> List[str]:
+        if self._scripts is None:
+            return [
+                (node.text(deep=True) or "").strip()
+                for node in self._tree.css("script")
+                if node.attributes.get("type") == script_type
+            ]
+        return list(self._scripts.get(script_type, ()))
+
+    def text(self, separator: str = " ") -> str:
+        self._strip_non_text()
+        root = self._tree.root
+        return _SelectolaxNode(root).text(separator) if root is not None else ""
+
+    def text_spans(self, tags: Collection[str]) -> TextSpans:
+        self._strip_non_text()
+        pieces: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        stack: list = [self._tree.root] if self._tree.root is not None else []
+        while stack:
+            node = stack.pop()
+            if isinstance(node, int):
+                spans[node] = (spans[node][0], len(pieces))
+            elif node.is_text_node:
+                piece = (node.text_content or "").strip()
+                if piece:
+                    pieces.append(piece)
+            elif node.is_element_node:
+                if node.tag in tags:
+                    stack.append(len(spans))
+                    spans.append((len(pieces), len(pieces)))
+                children = []
+                child = node.first_child
+                while child is not None:
+                    children.append(child)
+                    child = child.next
+                stack.extend(reversed(children))
+        return pieces, spans
+
+    def _strip_non_text(self) -> None:
+        # Keep script contents for script_texts() before the tags go away.
+        if self._scripts is not None:
+            return
+        scripts: Dict[str, List[str]] = {}
+        for node in self._tree.css("script"):
+            script_type = node.attributes.get("type")
+            if script_type:
+                scripts.setdefault(script_type, []).append((node.text(deep=True) or "").strip())
+        self._scripts = scripts
+        self._tree.strip_tags(list(_NON_TEXT_TAGS))
+
+
+class _LxmlNode(HtmlNode):
+    __slots__ = ("_element",)
+
+    def __init__(self, element) -> None:
+        self._element = element
+
+    def text(self, separator: str = " ") -> str:
+        # Elements inside <template> etc. have no text, as with bs4.
+        if any(ancestor.tag in _NON_TEXT_TAGS for ancestor in self._element.iterancestors()):
+            return ""
+        return separator.join(_lxml_pieces(self._element))
+
+    def attr(self, name: str) -> Optional[str]:
+        return self._element.get(name)
+
+
+class _LxmlDocument(HtmlDocument):
+    """libxml2 tree queried through cssselect-compiled XPath."""
+
+    backend = LXML
+
+    def __init__(self, html: str) -> None:
+        import lxml.html
+
+        # huge_tree lifts libxml2's nesting limit (256), past which deeper
+        # content is dropped silently; SPA pages nest that deep.
+        parser = lxml.html.HTMLParser(huge_tree=True)
+        self._root = lxml.html.document_fromstring(html, parser=parser) if html and html.strip() else None
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        if self._root is None:
+            return []
+        return [_LxmlNode(element) for element in self._root.xpath(_css_to_xpath(selector))]
+
+    def script_texts(self, script_type: str) -> List[str]:
+        if self._root is None:
+            return []
+        return [(script.text or "").strip() for script in self._root.iter("script") if script.get("type") == script_type]
+
+    def text(self, separator: str = " ") -> str:
+        return separator.join(_lxml_pieces(self._root)) if self._root is not None else ""
+
+    def text_spans(self, tags: Collection[str]) -> TextSpans:
+        pieces: List[str] = []
+        spans: List[Tuple[int, int]] = []
+        # Stack items: an element, a tail string, or the index of a span to close.
+        stack: list = [self._root] if self._root is not None else []
+        while stack:
+            item = stack.pop()
+            if isinstance(item, int):
+                spans[item] = (spans[item][0], len(pieces))
+                continue
+            if isinstance(item, str):
+                piece = item.strip()
+                if piece:
+                    pieces.append(piece)
+                continue
+            if not isinstance(item.tag, str) or item.tag in _NON_TEXT_TAGS:
+                continue
+            if item.tag in tags:
+                stack.append(len(spans))
+                spans.append((len(pieces), len(pieces)))
+            for child in reversed(item):
+                if child.tail:
+                    stack.append(child.tail)
+                stack.append(child)
+            if item.text:
+                stack.append(item.text)
+        return pieces, spans
+
+
+_xpath_cache: Dict[str, str] = {}
+
+
+def _css_to_xpath(selector: str) -> str:
+    xpath = _xpath_cache.get(selector)
+    if xpath is None:
+        from cssselect import HTMLTranslator
+
+        xpath = HTMLTranslator().css_to_xpath(selector)
+        _xpath_cache[selector] = xpath
+    return xpath
+
+
+def _lxml_pieces(element) -> List[str]:
+    """Stripped text pieces under `element`, skipping non-text tags and comments."""
+
+    pieces: List[str] = []
+    # Stack items: an element or a tail string; iterative so deep trees
+    # cannot hit the recursion limit.
+    stack: list = [element]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            pieces.append(item)
+            continue
+        is_element = isinstance(item.tag, str)
+        if is_element and item.tag in _NON_TEXT_TAGS:
+            continue
+        for child in reversed(item):
+            if is_element and child.tail and child.tail.strip():
+                stack.append(child.tail.strip())
+            stack.append(child)
+        if is_element and item.text and item.text.strip():
+            pieces.append(item.text.strip())
+    return pieces
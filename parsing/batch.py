@@ -0,0 +1,196 @@
+"""Batch parsing of saved job pages across a process pool.
+
+Usage:
+  python -m parsing.batch archives/pages --output results.jsonl
+  python -m parsing.batch manifest.txt --site generic --keywords python,sql --workers 8
+
+Each input is an HTML file, a directory (searched recursively for
+*.html / *.htm), or a manifest: a .txt file with one path per line, or a
+.jsonl file of {"path": ...} objects. Manifest paths are relative to the
+manifest. One JSON line is written per page; throughput goes to stderr.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .html_extractors import extract_json_ld_jobposting
+from .job_detail_parser import parse_job_detail
+from .parsed_page import ParsedPage
+
+
+SITE_TYPES = ("auto", "json-ld", "generic")
+HTML_SUFFIXES = (".html", ".htm")
+DEFAULT_KEYWORDS = ("job",)
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Picklable extraction settings shared by every worker.
+
+    "auto" uses the JobPosting JSON-LD description when a page has one and
+    keyword/selector extraction otherwise.
+    """
+
+    site_type: str = "auto"
+    keywords: Tuple[str, ...] = DEFAULT_KEYWORDS
+    selector: Optional[str] = None
+    backend: Optional[str] = None
+
+
+@dataclass
+class BatchStats:
+    """Running totals for a batch, updated as results stream in."""
+
+    files: int = 0
+    failed: int = 0
+    bytes_read: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def add(self, result: dict) -> None:
+        self.files += 1
+        self.bytes_read += result.get("bytes", 0)
+        if result.get("error"):
+            self.failed += 1
+
+    def summary(self) -> dict:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        return {
+            "files": self.files,
+            "failed": self.failed,
+            "elapsed_s": round(elapsed, 3),
+            "files_per_s": round(self.files / elapsed, 1),
+            "mb_per_s": round(self.bytes_read / elapsed / 1_000_000, 2),
+        }
+
+
+def collect_inputs(sources: Iterable[str]) -> List[Path]:
+    """Expand files, directories and manifests into a deduplicated path list.
+
+    Raises:
+        FileNotFoundError: If a source does not exist.
+    """
+
+    paths: List[Path] = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.rglob("*") if p.suffix.lower() in HTML_SUFFIXES and p.is_file()))
+        elif path.suffix.lower() in (".txt", ".jsonl"):
+            paths.extend(_read_manifest(path))
+        elif path.is_file():
+            paths.append(path)
+        else:
+            raise FileNotFoundError(f"Batch input not found: {source}")
+    return list(dict.fromkeys(paths))
+
+
+def parse_file(path: Path, options: BatchOptions) -> dict:
+    """Parse one saved page; errors are reported in the result, not raised."""
+
+    result = {"path": str(path), "bytes": 0, "description": None, "json_ld": None, "error": None}
+    started = time.perf_counter()
+    try:
+        data = path.read_bytes()
+        result["bytes"] = len(data)
+        page = ParsedPage(data.decode("utf-8", errors="ignore"), options.backend)
+        posting = extract_json_ld_jobposting(page)
+        if posting:
+            result["json_ld"] = {key: value for key, value in posting.items() if key != "description"}
+        result["description"] = _description(page, posting, options)
+    except Exception as exc:
+        result["error"] = f"{type(exc).__name__}: {exc}"
+    result["parse_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return result
+
+
+def run_batch(
+    paths: Iterable[Path],
+    options: Optional[BatchOptions] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 16,
+) -> Iterator[dict]:
+    """Parse pages across `workers` processes, yielding results as they finish.
+
+    Paths are dispatched in chunks of `chunksize` to keep IPC overhead low,
+    so results arrive in completion order, not input order. With one worker
+    (or one path) everything runs in-process.
+
+    Raises:
+        ValueError: If options.site_type is unsupported or chunksize < 1.
+    """
+
+    options = options or BatchOptions()
+    if options.site_type not in SITE_TYPES:
+        raise ValueError(f"Unsupported site type: {options.site_type}")
+    if chunksize < 1:
+        raise ValueError("run_batch requires a chunksize of at least 1.")
+    batch = list(paths)
+    workers = min(workers or os.cpu_count() or 1, len(batch))
+    parse = partial(parse_file, options=options)
+    if workers <= 1:
+        yield from map(parse, batch)
+        return
+    with multiprocessing.get_context("spawn").Pool(workers) as pool:
+        yield from pool.imap_unordered(parse, batch, chunksize=chunksize)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Parse saved job pages in parallel and write JSONL results.")
+    parser.add_argument("inputs", nargs="+", help="HTML files, directories, or .txt/.jsonl manifests")
+    parser.add_argument("--output", help="JSONL output path (default: stdout)")
+    parser.add_argument("--site", choices=SITE_TYPES, default="auto", help="Extraction mode")
+    parser.add_argument("--keywords", help="Comma-separated keywords for generic extraction")
+    parser.add_argument("--selector", help="CSS selector for generic extraction")
+    parser.add_argument("--backend", help="HTML parser backend (default: auto)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=16, help="Pages sent to a worker at a time")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    keywords = tuple(kw.strip() for kw in (args.keywords or "").split(",") if kw.strip()) or DEFAULT_KEYWORDS
+    options = BatchOptions(site_type=args.site, keywords=keywords, selector=args.selector, backend=args.backend)
+    paths = collect_inputs(args.inputs)
+    stats = BatchStats()
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for result in run_batch(paths, options, workers=args.workers, chunksize=args.chunksize):
+            stats.add(result)
+            output.write(json.dumps(result, ensure_ascii=True) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(json.dumps(stats.summary()), file=sys.stderr)
+    return 0
+
+
+def _read_manifest(path: Path) -> List[Path]:
+    entries: List[Path] = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        entry = json.loads(line)["path"] if path.suffix.lower() == ".jsonl" else line
+        entries.append(path.parent / entry)
+    return entries
+
+
+def _description(page: ParsedPage, posting: dict, options: BatchOptions) -> str:
+    if options.site_type == "json-ld" or (options.site_type == "auto" and posting.get("description")):
+        return parse_job_detail(page, "json-ld", None, None).description
+    return parse_job_detail(page, "generic", list(options.keywords), options.selector).description
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
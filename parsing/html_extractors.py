@@ -2,43 +2,37 @@
 
 from __future__ import annotations
 
-import json
-from typing import Iterable, List, Optional
+from typing import List, Optional, Union
 
-from bs4 import BeautifulSoup
+from .keyword_matcher import compile_keywords
+from .parsed_page import ParsedPage, as_parsed_page
 
 
-def extract_json_ld_jobposting(html: str) -> dict:
+def extract_json_ld_jobposting(html: Union[str, ParsedPage], backend: Optional[str] = None) -> dict:
     """Find JobPosting JSON-LD in HTML.
 
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content or an already parsed page.
+        backend: Parser backend name (see `parsing.backends`); auto by default.
 
     Returns:
         dict: JobPosting JSON-LD object, or empty dict if not found.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    for script in soup.find_all("script", attrs={"type": "application/ld+json"}):
-        text = script.get_text(strip=True)
-        if not text:
-            continue
-        try:
-            payload = json.loads(text)
-        except json.JSONDecodeError:
-            continue
+    for payload in as_parsed_page(html, backend).json_ld:
         posting = _find_json_ld_jobposting(payload)
         if posting:
             return posting
     return {}
 
 
-def extract_text_by_selector(html: str, selector: str) -> str:
+def extract_text_by_selector(html: Union[str, ParsedPage], selector: str, backend: Optional[str] = None) -> str:
     """Extract text from the first node matching a selector.
 
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content or an already parsed page.
         selector: CSS selector.
+        backend: Parser backend name; auto by default.
 
     Returns:
         str: Normalized text content.
@@ -47,19 +41,23 @@ def extract_text_by_selector(html: str, selector: str) -> str:
         ValueError: If selector finds no node.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    node = soup.select_one(selector)
+    node = as_parsed_page(html, backend).document.select_one(selector)
     if not node:
         raise ValueError(f"No element found for selector: {selector}")
-    return _normalize_whitespace(node.get_text(" ", strip=True))
+    return _normalize_whitespace(node.text(" "))
 
 
-def extract_description_by_keywords(html: str, keywords: List[str]) -> str:
+def extract_description_by_keywords(
+    html: Union[str, ParsedPage],
+    keywords: List[str],
+    backend: Optional[str] = None,
+) -> str:
     """Extract description by scoring blocks with keywords.
 
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content or an already parsed page.
         keywords: List of keywords to match.
+        backend: Parser backend name; auto by default.
 
     Returns:
         str: Best matching text block.
@@ -71,21 +69,8 @@ def extract_description_by_keywords(html: str, keywords: List[str]) -> str:
     if not keywords or not any(kw.strip() for kw in keywords):
         raise ValueError("Keywords are required for generic extraction.")
 
-    normalized_keywords = [kw.strip().lower() for kw in keywords if kw.strip()]
-    soup = BeautifulSoup(html, "html.parser")
-    candidates = soup.find_all(["main", "section", "article", "div"])
-
-    best_text = ""
-    best_score = 0
-    for node in candidates:
-        text = _normalize_whitespace(node.get_text(" ", strip=True))
-        if not text:
-            continue
-        score = _keyword_score(text, normalized_keywords)
-        if score > best_score:
-            best_score = score
-            best_text = text
-
+    matcher = compile_keywords(tuple(kw.strip() for kw in keywords if kw.strip()))
+    best_text = as_parsed_page(html, backend).block_index.best_block(matcher)
     if not best_text:
         raise ValueError("No matching content found for the provided keywords.")
     return best_text
@@ -107,10 +92,5 @@ def _find_json_ld_jobposting(payload) -> Optional[dict]:
     return None
 
 
-def _keyword_score(text: str, keywords: Iterable[str]) -> int:
-    lowered = text.lower()
-    return sum(1 for kw in keywords if kw in lowered)
-
-
 def _normalize_whitespace(text: str) -> str:
     return " ".join(text.split())
@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from .html_extractors import (
     extract_description_by_keywords,
     extract_json_ld_jobposting,
     extract_text_by_selector,
 )
+from .parsed_page import ParsedPage, as_parsed_page
 
 
 @dataclass(frozen=True)
@@ -20,18 +21,20 @@ class JobDetail:
 
 
 def parse_job_detail(
-    html: str,
+    html: Union[str, ParsedPage],
     site_type: str,
     keywords: Optional[List[str]],
     selector: Optional[str],
+    backend: Optional[str] = None,
 ) -> JobDetail:
     """Dispatch extraction based on site type.
 
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content, or a ParsedPage shared with other extractors.
         site_type: Site type (e.g., "generic", "json-ld").
         keywords: Optional keywords for generic extraction.
         selector: Optional CSS selector for generic extraction.
+        backend: Optional parser backend name (see `parsing.backends`).
 
     Returns:
         JobDetail: Parsed description wrapper.
@@ -40,13 +43,14 @@ def parse_job_detail(
         ValueError: If site_type is unsupported or content not found.
     """
 
+    page = as_parsed_page(html, backend)
     if site_type == "generic":
         if selector:
-            description = extract_text_by_selector(html, selector)
+            description = extract_text_by_selector(page, selector)
         else:
-            description = extract_description_by_keywords(html, keywords or [])
+            description = extract_description_by_keywords(page, keywords or [])
     elif site_type == "json-ld":
-        posting = extract_json_ld_jobposting(html)
+        posting = extract_json_ld_jobposting(page)
         description = posting.get("description", "") if posting else ""
         if not description:
             raise ValueError("No JobPosting JSON-LD found in HTML.")
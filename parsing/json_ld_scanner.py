@@ -0,0 +1,81 @@
+"""DOM-free lookup of <script type="application/ld+json"> blocks.
+
+JSON-LD pages only need their script bodies, so scanning the raw markup
+with a regex is much cheaper than building a tree. The scanner gives up
+(returns None) on markup it cannot read safely, and callers then fall
+back to a real parser.
+"""
+
+from __future__ import annotations
+
+import re
+from html import unescape
+from typing import List, Optional, Union
+
+
+JSON_LD_TYPE = "application/ld+json"
+
+_ATTRS = r"""((?:\s+[^\s"'>/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s"'=<>`]+))?)*)\s*/?>"""
+_ATTR = r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+)))?"""
+
+# Comments are matched (and skipped) so commented-out scripts are ignored,
+# as an HTML parser would.
+_TOKEN_STR = re.compile(r"<!--.*?-->|<script" + _ATTRS + r"(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+_TOKEN_BYTES = re.compile(_TOKEN_STR.pattern.encode(), re.IGNORECASE | re.DOTALL)
+_ATTR_STR = re.compile(_ATTR)
+_ATTR_BYTES = re.compile(_ATTR.encode())
+_OPENERS_STR = re.compile(r"<!--|<script\b", re.IGNORECASE)
+_OPENERS_BYTES = re.compile(_OPENERS_STR.pattern.encode(), re.IGNORECASE)
+
+
+def scan_json_ld_scripts(html: Union[str, bytes]) -> Optional[List[str]]:
+    """Return the stripped bodies of JSON-LD script blocks in document order.
+
+    Only the matching script bodies are decoded when `html` is UTF-8 bytes.
+
+    Returns:
+        Optional[List[str]]: Script texts, or None when the markup has an
+        unterminated comment or script, or cannot be decoded.
+    """
+
+    if isinstance(html, bytes):
+        token, attr_pattern, openers, marker = _TOKEN_BYTES, _ATTR_BYTES, _OPENERS_BYTES, b"ld+json"
+    else:
+        token, attr_pattern, openers, marker = _TOKEN_STR, _ATTR_STR, _OPENERS_STR, "ld+json"
+    if marker not in html:
+        return []
+
+    texts: List[str] = []
+    position = 0
+    for opener in openers.finditer(html):
+        if opener.start() < position:
+            continue
+        match = token.match(html, opener.start())
+        if match is None:
+            # `<script` without `>` or `</script>`, or `<!--` without `-->`.
+            return None
+        position = match.end()
+        if match.group(1) is None or _script_type(match.group(1), attr_pattern) != JSON_LD_TYPE:
+            continue
+        body = match.group(2)
+        if isinstance(body, bytes):
+            try:
+                body = body.decode("utf-8")
+            except UnicodeDecodeError:
+                return None
+        texts.append(body.strip())
+    return texts
+
+
+def _script_type(attrs, attr_pattern) -> Optional[str]:
+    for match in attr_pattern.finditer(attrs):
+        name = match.group(1)
+        if isinstance(name, bytes):
+            name = name.decode("latin-1")
+        if name.lower() != "type":
+            continue
+        value = next((group for group in match.groups()[1:] if group is not None), "")
+        if isinstance(value, bytes):
+            value = value.decode("latin-1")
+        return unescape(value)
+    return None
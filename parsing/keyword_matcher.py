@@ -0,0 +1,93 @@
+"""Compiled multi-keyword matching for extraction and relevance scoring."""
+
+from __future__ import annotations
+
+import importlib.util
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """Find every occurrence of a fixed keyword set in one pass over a text.
+
+    Uses a pyahocorasick automaton when the package is installed: one scan
+    of the text regardless of how many keywords there are. Without it,
+    each keyword is located with `str.find`, which runs in C and beats a
+    pure-Python automaton for keyword lists of a few dozen entries.
+
+    Args:
+        keywords: Keywords to match; blanks and duplicates are dropped.
+        case_fold: Match case-insensitively (`str.casefold`, so "Straße"
+            matches "STRASSE").
+        word_boundary: Only count matches not embedded in a longer word
+            (neighbours must not be alphanumeric or "_").
+    """
+
+    def __init__(self, keywords: Iterable[str], case_fold: bool = True, word_boundary: bool = False) -> None:
+        self.case_fold = case_fold
+        self.word_boundary = word_boundary
+        folded = (self.fold(kw.strip()) for kw in keywords)
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(kw for kw in folded if kw))
+        self._automaton = _build_automaton(self.keywords)
+
+    def fold(self, text: str) -> str:
+        """Normalize text the way keywords were normalized."""
+
+        return text.casefold() if self.case_fold else text
+
+    def occurrences(self, text: str, folded: bool = False) -> List[List[int]]:
+        """Return the sorted start offsets of each keyword, in keyword order.
+
+        Offsets index the folded text; pass `folded=True` when `text` was
+        already run through `fold`.
+        """
+
+        text = text if folded else self.fold(text)
+        starts: List[List[int]] = [[] for _ in self.keywords]
+        if self._automaton is not None:
+            for end, index in self._automaton.iter(text):
+                starts[index].append(end - len(self.keywords[index]) + 1)
+        else:
+            for index, keyword in enumerate(self.keywords):
+                position = text.find(keyword)
+                while position >= 0:
+                    starts[index].append(position)
+                    position = text.find(keyword, position + 1)
+        if self.word_boundary:
+            starts = [
+                [start for start in found if _at_word_boundary(text, start, start + len(keyword))]
+                for keyword, found in zip(self.keywords, starts)
+            ]
+        return starts
+
+    def score(self, text: str) -> int:
+        """Return how many distinct keywords occur in `text`."""
+
+        return sum(1 for found in self.occurrences(text) if found)
+
+
+@lru_cache(maxsize=64)
+def compile_keywords(keywords: Tuple[str, ...], case_fold: bool = True, word_boundary: bool = False) -> KeywordMatcher:
+    """Return a cached matcher for a keyword tuple, so repeated calls compile once."""
+
+    return KeywordMatcher(keywords, case_fold=case_fold, word_boundary=word_boundary)
+
+
+def _build_automaton(keywords: Tuple[str, ...]):
+    if not keywords or importlib.util.find_spec("ahocorasick") is None:
+        return None
+    import ahocorasick
+
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(keywords):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+def _at_word_boundary(text: str, start: int, end: int) -> bool:
+    return not (start > 0 and _is_word_char(text[start - 1])) and not (end < len(text) and _is_word_char(text[end]))
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
@@ -0,0 +1,95 @@
+"""Parse-once page wrapper shared by the extractors."""
+
+from __future__ import annotations
+
+import json
+from functools import cached_property
+from typing import Any, List, Optional, Union
+
+from .backends import HtmlDocument, parse_html
+from .json_ld_scanner import JSON_LD_TYPE, scan_json_ld_scripts
+from .text_blocks import TextBlockIndex
+
+
+class ParsedPage:
+    """HTML parsed at most once, with derived views cached on first use.
+
+    Pass one instance to several extractors instead of the raw string so
+    the document is not re-parsed per extractor. The parse itself is lazy,
+    so wrapping a page that is never queried costs nothing.
+    """
+
+    def __init__(self, html: str, backend: Optional[str] = None) -> None:
+        self.html = html or ""
+        self.backend = backend
+
+    @cached_property
+    def document(self) -> HtmlDocument:
+        """The parsed document (see `parsing.backends`)."""
+
+        return parse_html(self.html, self.backend)
+
+    @cached_property
+    def json_ld_texts(self) -> List[str]:
+        """Stripped <script type="application/ld+json"> bodies.
+
+        Read with `scan_json_ld_scripts` while the page is still unparsed,
+        so JSON-LD-only callers never build a DOM; malformed markup falls
+        back to the parsed document.
+        """
+
+        if "document" not in self.__dict__:
+            texts = scan_json_ld_scripts(self.html)
+            if texts is not None:
+                return texts
+        return self.document.script_texts(JSON_LD_TYPE)
+
+    @cached_property
+    def json_ld(self) -> List[Any]:
+        """Decoded JSON-LD payloads; invalid JSON is skipped."""
+
+        payloads = []
+        for text in self.json_ld_texts:
+            if not text:
+                continue
+            try:
+                payloads.append(json.loads(text))
+            except json.JSONDecodeError:
+                continue
+        return payloads
+
+    @cached_property
+    def anchors(self) -> List[str]:
+        """Stripped, non-empty href values of <a> elements in document order."""
+
+        hrefs = []
+        for link in self.document.select("a[href]"):
+            href = (link.attr("href") or "").strip()
+            if href:
+                hrefs.append(href)
+        return hrefs
+
+    @cached_property
+    def block_index(self) -> TextBlockIndex:
+        """Token spans of the main/section/article/div blocks, from one tree walk."""
+
+        return TextBlockIndex.from_document(self.document)
+
+    @cached_property
+    def text_blocks(self) -> List[str]:
+        """Whitespace-normalized, non-empty text of every candidate content block."""
+
+        index = self.block_index
+        return [index.block_text(position) for position in range(len(index.spans))]
+
+
+def as_parsed_page(page: Union[str, ParsedPage], backend: Optional[str] = None) -> ParsedPage:
+    """Return `page` itself, or wrap a raw HTML string.
+
+    `backend` only applies when wrapping; an existing ParsedPage keeps the
+    backend it was created with.
+    """
+
+    if isinstance(page, ParsedPage):
+        return page
+    return ParsedPage(page, backend)
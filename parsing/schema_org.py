@@ -0,0 +1,123 @@
+"""Map schema.org JobPosting JSON-LD onto the domain JobPosting."""
+
+from __future__ import annotations
+
+import re
+from html import unescape
+from typing import Any, List, Optional
+
+from domain.models import JobPosting
+
+from .backends import parse_html
+
+
+UNKNOWN = "Unknown"
+
+_BULLET = re.compile(r"^[\s\-•*·]+")
+_SKILL_SEPARATORS = re.compile(r"[,;\n]")
+
+
+def job_posting_from_json_ld(posting: dict, description: Optional[str] = None) -> JobPosting:
+    """Build a JobPosting from a schema.org JobPosting object.
+
+    Maps title, hiringOrganization, jobLocation (or a remote
+    jobLocationType), skills, responsibilities and qualifications. HTML in
+    the JSON-LD values is reduced to text. Missing identity fields become
+    "Unknown"; missing list fields stay empty for LLM extraction.
+
+    Args:
+        posting: JobPosting JSON-LD object (may be empty).
+        description: Description to use instead of `posting["description"]`.
+
+    Returns:
+        JobPosting: Mapped posting.
+
+    Raises:
+        ValueError: If neither source provides a description.
+    """
+
+    qualifications = _items(posting.get("qualifications"))
+    return JobPosting(
+        company_name=_name(posting.get("hiringOrganization")) or UNKNOWN,
+        jobtitle=_html_text(posting.get("title")) or UNKNOWN,
+        location=_location(posting) or UNKNOWN,
+        job_description=description or json_ld_description(posting),
+        futureTasks=_items(posting.get("responsibilities")),
+        candidateProfile="\n".join(qualifications) or None,
+        skills=_items(posting.get("skills"), split=_SKILL_SEPARATORS),
+    )
+
+
+def json_ld_description(posting: dict) -> str:
+    """Return the JobPosting description as plain text ("" if it has none)."""
+
+    return _html_text(posting.get("description"))
+
+
+def _location(posting: dict) -> str:
+    places = posting.get("jobLocation")
+    places = places if isinstance(places, list) else [places]
+    names = list(dict.fromkeys(filter(None, (_place(place) for place in places))))
+    if not names and "TELECOMMUTE" in str(posting.get("jobLocationType") or "").upper():
+        return "Remote"
+    return "; ".join(names)
+
+
+def _place(place: Any) -> str:
+    if isinstance(place, str):
+        return place.strip()
+    if not isinstance(place, dict):
+        return ""
+    address = place.get("address")
+    if isinstance(address, str):
+        return address.strip()
+    if not isinstance(address, dict):
+        return _name(place)
+    parts = [address.get("addressLocality"), address.get("addressRegion"), _name(address.get("addressCountry"))]
+    parts = [str(part).strip() for part in parts if part and str(part).strip()]
+    return ", ".join(dict.fromkeys(parts))
+
+
+def _name(value: Any) -> str:
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("legalName") or ""
+    if isinstance(value, list):
+        return _name(value[0]) if value else ""
+    return _html_text(value)
+
+
+def _items(value: Any, split: Optional[re.Pattern] = None) -> List[str]:
+    """Flatten a text/list/DefinedTerm value into distinct text items."""
+
+    if value is None:
+        return []
+    if isinstance(value, list):
+        items = [item for entry in value for item in _items(entry, split)]
+    elif isinstance(value, dict):
+        items = _items(value.get("name") or value.get("description") or value.get("text"), split)
+    else:
+        text = _unescape_markup(str(value))
+        if "<li" in text.lower():
+            items = [node.text(" ") for node in parse_html(text).select("li")]
+        else:
+            # One item per line, paragraph or <br>-separated piece.
+            items = (parse_html(text).text("\n") if "<" in text else text).split("\n")
+        if split is not None:
+            items = [part for item in items for part in split.split(item)]
+        items = [_BULLET.sub("", " ".join(item.split())) for item in items]
+    return list(dict.fromkeys(item for item in items if item))
+
+
+def _html_text(value: Any) -> str:
+    if value is None:
+        return ""
+    text = _unescape_markup(str(value))
+    if "<" in text:
+        text = parse_html(text).text(" ")
+    return " ".join(text.split())
+
+
+def _unescape_markup(text: str) -> str:
+    # Decode entities unless the value is real markup, which the parser
+    # decodes itself; some sites entity-escape the HTML in JSON-LD strings.
+    return unescape(text) if "&lt;" in text or "<" not in text else text
@@ -0,0 +1,85 @@
+"""Linear-time keyword scoring of nested content blocks."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+from .backends import HtmlDocument
+from .keyword_matcher import KeywordMatcher
+
+
+BLOCK_TAGS = frozenset({"main", "section", "article", "div"})
+
+
+class TextBlockIndex:
+    """Whitespace tokens of a document plus the token span of every block.
+
+    A block's normalized text is `" ".join(tokens[start:end])`, so nested
+    blocks share one token list instead of each re-extracting its subtree.
+    """
+
+    def __init__(self, tokens: List[str], spans: List[Tuple[int, int]]) -> None:
+        self.tokens = tokens
+        # Non-empty blocks only, in document order.
+        self.spans = [span for span in spans if span[0] < span[1]]
+        # Folded document text and token offsets, per case_fold setting.
+        self._folded: Dict[bool, Tuple[str, List[int]]] = {}
+
+    @classmethod
+    def from_document(cls, document: HtmlDocument) -> "TextBlockIndex":
+        pieces, piece_spans = document.text_spans(BLOCK_TAGS)
+        tokens: List[str] = []
+        first_token = []
+        for piece in pieces:
+            first_token.append(len(tokens))
+            tokens.extend(piece.split())
+        first_token.append(len(tokens))
+        spans = [(first_token[start], first_token[end]) for start, end in piece_spans]
+        return cls(tokens, spans)
+
+    def block_text(self, index: int) -> str:
+        start, end = self.spans[index]
+        return " ".join(self.tokens[start:end])
+
+    def best_block(self, matcher: KeywordMatcher) -> str:
+        """Return the first block containing the most distinct keywords.
+
+        The matcher runs once over the whole document text; each block is
+        then scored from the keyword offsets inside its span.
+
+        Returns:
+            str: The block's normalized text, or "" if no block matches.
+        """
+
+        text, offsets = self._folded_text(matcher)
+        occurrences = [
+            (len(keyword), starts)
+            for keyword, starts in zip(matcher.keywords, matcher.occurrences(text, folded=True))
+            if starts
+        ]
+        best_index = -1
+        best_score = 0
+        for index, (start, end) in enumerate(self.spans):
+            low = offsets[start]
+            high = offsets[end] - 1  # drop the separator after the last token
+            score = 0
+            for length, starts in occurrences:
+                position = bisect_left(starts, low)
+                if position < len(starts) and starts[position] + length <= high:
+                    score += 1
+            if score > best_score:
+                best_score = score
+                best_index = index
+        return self.block_text(best_index) if best_index >= 0 else ""
+
+    def _folded_text(self, matcher: KeywordMatcher) -> Tuple[str, List[int]]:
+        if matcher.case_fold not in self._folded:
+            # Folding per token equals folding each block's text: tokens are
+            # whitespace separated, which no case mapping crosses.
+            folded = [matcher.fold(token) for token in self.tokens]
+            offsets = [0]
+            for token in folded:
+                offsets.append(offsets[-1] + len(token) + 1)
+            self._folded[matcher.case_fold] = (" ".join(folded), offsets)
+        return self._folded[matcher.case_fold]
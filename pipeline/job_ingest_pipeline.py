@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
-from urllib.parse import urljoin, urlparse
-
-from bs4 import BeautifulSoup
-
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterator, List, Optional, Set, Union
+
+from core.runtime import iter_async
+from crawling.async_fetcher import AsyncFetchEngine, FetchResult
+from crawling.fetch_archive import FetchArchive
+from crawling.fetch_strategy import StrategyFetcher
+from crawling.html_cache import HtmlCache
+from crawling.page_extraction import EXTRACT_LINKS, extract_from_html
+from crawling.pagination import page_url
 from crawling.playwright_client import PlaywrightClient
-from crawling.site_registry import SiteConfig, detect_site
+from crawling.rate_limiter import RateLimiter
+from crawling.readiness import ReadinessTracker
+from crawling.site_registry import EXTRACT_LINKEDIN, SiteConfig, detect_site
 from crawling.url_generator import build_search_urls
 from domain.models import JobListing, JobPosting
+from integrations.linkedin_scraper import collect_linkedin_job_urls
+from integrations.linkedin_session import get_linkedin_session
+from parsing.html_extractors import extract_json_ld_jobposting
 from parsing.job_detail_parser import parse_job_detail
+from parsing.parsed_page import ParsedPage, as_parsed_page
+from parsing.schema_org import job_posting_from_json_ld, json_ld_description
+from storage.crawl_frontier import OPTIMIZED, CrawlFrontier
+
+
+# LinkedIn search pages scraped concurrently per round of the listing walk.
+LINKEDIN_SEARCH_CONCURRENCY = 2
 
 
 def ingest_jobs(query) -> List[JobListing]:
@@ -33,82 +52,251 @@ def ingest_jobs(query) -> List[JobListing]:
     return listings
 
 
-def collect_job_listings(query, limit: int = 20) -> List[JobListing]:
+def collect_job_listings(
+    query,
+    limit: int = 20,
+    client: Optional[PlaywrightClient] = None,
+    frontier: Optional[CrawlFrontier] = None,
+    target_state: str = OPTIMIZED,
+    max_age_s: Optional[float] = None,
+) -> List[JobListing]:
     """Fetch search pages and extract job detail URLs.
 
     Args:
         query: JobQuery-like object.
         limit: Max number of job listings to return.
+        client: Optional shared client; a pooled one is opened for this call
+            when omitted.
+        frontier: Optional CrawlFrontier. Every URL found is recorded as
+            discovered, and only URLs that still need work to reach
+            `target_state` (new, unfinished, stale, or retryable) count
+            towards `limit`.
+        target_state: Frontier state this run will bring listings to.
+        max_age_s: Reprocess URLs that reached `target_state` longer ago.
 
     Returns:
         List[JobListing]: Job detail page listings.
     """
 
-    client = PlaywrightClient()
-    results: List[JobListing] = []
-    for search in ingest_jobs(query):
-        site = detect_site(search.url)
-        html = client.fetch(
-            search.url,
-            wait_for=None,
-            wait_jobposting=site.wait_jobposting if site else False,
-        )
-        if site and site.follow_iframe:
-            html = client.fetch_iframe(search.url, site.iframe_selector)
-        for link in extract_listing_urls(html, search.url, site):
-            results.append(JobListing(url=link, source=search.source))
-            if len(results) >= limit:
-                return results
-    return results
+    with _client_scope(client) as active:
+        listings = iter_job_listings(query, active)
+        if frontier is not None:
+            listings = _pending_listings(listings, frontier, target_state, max_age_s)
+        return list(islice(listings, max(0, limit)))
+
 
+def iter_job_listings(query, client: PlaywrightClient) -> Iterator[JobListing]:
+    """Lazily walk paginated search results, interleaving sites.
 
-def fetch_job_html(listing: JobListing) -> str:
+    One result page is fetched per site in turn, and a page is only fetched
+    once the consumer has used up the listings from the previous round, so
+    stopping early (e.g. with `islice`) never fetches unused pages. A site
+    stops when its pagination ends or a page yields no new job URLs.
+    LinkedIn search pages go through the logged-in LinkedIn session,
+    `LINKEDIN_SEARCH_CONCURRENCY` pages per round, on the client's rate
+    limiter (unless the client records or replays an archive).
+
+    Args:
+        query: JobQuery-like object.
+        client: Client used to fetch search pages.
+
+    Yields:
+        JobListing: Job detail page listings, deduplicated across pages.
+    """
+
+    seen: Set[str] = set()
+    walkers = deque(_iter_search_pages(search, query, client, seen) for search in ingest_jobs(query))
+    while walkers:
+        walker = walkers.popleft()
+        try:
+            page_listings = next(walker)
+        except StopIteration:
+            continue
+        yield from page_listings
+        walkers.append(walker)
+
+
+def _pending_listings(
+    listings: Iterator[JobListing],
+    frontier: CrawlFrontier,
+    target_state: str,
+    max_age_s: Optional[float],
+) -> Iterator[JobListing]:
+    for listing in listings:
+        # Check before recording: a fresh URL must not already count as
+        # having reached a DISCOVERED target.
+        pending = frontier.should_process(listing.url, target_state, max_age_s)
+        frontier.discover(listing.url, listing.source)
+        if pending:
+            yield listing
+
+
+def _iter_search_pages(
+    search: JobListing,
+    query,
+    client: PlaywrightClient,
+    seen: Set[str],
+) -> Iterator[List[JobListing]]:
+    site = detect_site(search.url)
+    if site is not None and site.extraction == EXTRACT_LINKEDIN and client.archive is None:
+        yield from _iter_linkedin_pages(search, query, client, site, seen)
+        return
+    page_index = 0
+    while True:
+        url = page_url(search.url, site, page_index)
+        if url is None:
+            return
+        links = client.extract(
+            url,
+            EXTRACT_LINKS,
+            frame_selector=site.iframe_selector if site and site.follow_iframe else None,
+            # Search pages carry no JobPosting; waiting for one would burn the
+            # deadline and widen the site's learned detail-page deadline.
+            wait_jobposting=False,
+            # Search results change between runs; a cached page would
+            # return stale listings for the whole TTL.
+            use_cache=False,
+        )
+        fresh = [link for link in links if link not in seen]
+        if not fresh:
+            return
+        seen.update(fresh)
+        yield [JobListing(url=link, source=search.source) for link in fresh]
+        page_index += 1
+
+
+def _iter_linkedin_pages(
+    search: JobListing,
+    query,
+    client: PlaywrightClient,
+    site: SiteConfig,
+    seen: Set[str],
+) -> Iterator[List[JobListing]]:
+    session = client.linkedin_session or get_linkedin_session(client.headless)
+    for first_page in range(0, site.max_pages, LINKEDIN_SEARCH_CONCURRENCY):
+        collection = collect_linkedin_job_urls(
+            [query],
+            max_pages=LINKEDIN_SEARCH_CONCURRENCY,
+            concurrency=LINKEDIN_SEARCH_CONCURRENCY,
+            session=session,
+            rate_limiter=client.rate_limiter,
+            first_page=first_page,
+        )
+        fresh = [link for link in collection.urls if link not in seen]
+        if not fresh:
+            return
+        seen.update(fresh)
+        yield [JobListing(url=link, source=search.source) for link in fresh]
+
+
+def fetch_job_html(
+    listing: JobListing,
+    client: Optional[PlaywrightClient] = None,
+    fetcher: Optional[StrategyFetcher] = None,
+) -> str:
     """Fetch HTML for a job listing URL.
 
+    Sites configured as "http-first" are fetched with a plain GET and only
+    rendered in the browser when the static HTML is insufficient.
+
     Args:
         listing: JobListing with URL.
+        client: Optional shared client, reused across listings when given.
+        fetcher: Optional shared StrategyFetcher; takes precedence over client.
+
+    Returns:
+        str: Job page HTML.
+    """
+
+    if fetcher is not None:
+        return fetcher.fetch(listing.url)
+    owned = StrategyFetcher(client=client or PlaywrightClient())
+    try:
+        return owned.fetch(listing.url)
+    finally:
+        owned.close()
+
+
+def fetch_jobs_html(
+    listings: List[JobListing],
+    max_concurrency: int = 4,
+    timeout_ms: int = 20000,
+    cache: Optional[HtmlCache] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    archive: Optional[FetchArchive] = None,
+    readiness: Optional[ReadinessTracker] = None,
+    block_resources: bool = False,
+) -> Iterator[FetchResult]:
+    """Fetch many job pages concurrently, yielding results as they complete.
+
+    Args:
+        listings: JobListing objects to fetch.
+        max_concurrency: Global cap on in-flight page fetches.
+        timeout_ms: Per-page navigation timeout.
+        cache: Optional HtmlCache shared with the sync client.
+        rate_limiter: Optional RateLimiter shared with the sync client.
+        archive: Optional FetchArchive to record to or replay from.
+        readiness: Optional ReadinessTracker shared with the sync client.
+        block_resources: Apply each site's resource blocking policy.
 
     Returns:
-        str: Rendered HTML.
+        Iterator[FetchResult]: Results in completion order; failed fetches
+        carry an error instead of raising.
     """
 
-    client = PlaywrightClient()
-    site = detect_site(listing.url)
-    html = client.fetch(
-        listing.url,
-        wait_for=None,
-        wait_jobposting=site.wait_jobposting if site else False,
+    engine = AsyncFetchEngine(
+        max_concurrency=max_concurrency,
+        timeout_ms=timeout_ms,
+        cache=cache,
+        rate_limiter=rate_limiter or RateLimiter(),
+        archive=archive,
+        readiness=readiness or ReadinessTracker(),
+        block_resources=block_resources,
     )
-    if site and site.follow_iframe:
-        html = client.fetch_iframe(listing.url, site.iframe_selector)
-    return html
+    return iter_async(lambda: engine.fetch_many(listings))
 
 
-def parse_job(html: str, site: Optional[SiteConfig]) -> JobPosting:
+@contextmanager
+def _client_scope(client: Optional[PlaywrightClient]) -> Iterator[PlaywrightClient]:
+    """Yield the caller's client, or a pooled client closed on exit."""
+
+    if client is not None:
+        yield client
+        return
+    with PlaywrightClient() as owned:
+        yield owned
+
+
+def parse_job(html: Union[str, ParsedPage], site: Optional[SiteConfig]) -> JobPosting:
     """Parse HTML into a JobPosting.
 
+    Fields present in JobPosting JSON-LD (title, company, location, skills,
+    responsibilities, qualifications) are mapped directly. When the JSON-LD
+    has no description text, the description is extracted from the page:
+    with the site's `description_selector`, else by keyword.
+
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content or an already parsed page.
         site: SiteConfig-like object.
 
     Returns:
         JobPosting: Structured job posting.
     """
 
-    detail = parse_job_detail(html, "generic", keywords=["job"], selector=None)
-    return JobPosting(
-        company_name="Unknown",
-        jobtitle="Unknown",
-        location="Unknown",
-        job_description=detail.description,
-    )
+    page = as_parsed_page(html)
+    posting = extract_json_ld_jobposting(page)
+    description = json_ld_description(posting)
+    if not description:
+        selector = site.description_selector if site is not None else None
+        description = parse_job_detail(page, "generic", keywords=["job"], selector=selector).description
+    return job_posting_from_json_ld(posting, description=description)
 
 
-def extract_listing_urls(html: str, base_url: str, site: Optional[SiteConfig]) -> List[str]:
+def extract_listing_urls(html: Union[str, ParsedPage], base_url: str, site: Optional[SiteConfig]) -> List[str]:
     """Extract job detail URLs from a search page.
 
     Args:
-        html: Raw HTML content.
+        html: Raw HTML content or an already parsed page.
         base_url: Search page URL used to resolve relative links.
         site: Detected SiteConfig, used to pick match rules.
 
@@ -116,33 +304,4 @@ def extract_listing_urls(html: str, base_url: str, site: Optional[SiteConfig]) -
         List[str]: Deduplicated list of job detail URLs.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
-    urls: List[str] = []
-
-    for link in soup.find_all("a", href=True):
-        href = link["href"].strip()
-        if not href:
-            continue
-        full = urljoin(base_url, href)
-        if _is_job_detail_url(full, site):
-            if full not in urls:
-                urls.append(full)
-    return urls
-
-
-def _is_job_detail_url(url: str, site: Optional[SiteConfig]) -> bool:
-    parsed = urlparse(url)
-    host = parsed.netloc.lower()
-    path = parsed.path.lower()
-
-    if site and site.name == "linkedin":
-        return "linkedin.com" in host and "/jobs/view/" in path
-    if site and site.name == "stepstone":
-        return "stepstone.de" in host and "/jobs/" in path and "/jobs/" in path
-    if site and site.name == "xing":
-        return "xing.com" in host and "/jobs/" in path
-    if site and site.name == "accso":
-        return "accso.de" in host and "/dabei-sein/jobs/" in path
-
-    # Fallback heuristic
-    return "/jobs/" in path
+    return extract_from_html(html, EXTRACT_LINKS, base_url, site)
@@ -11,6 +11,9 @@ from llm.extract_job_info import extract_job_fields
 def run_llm_extraction(jobs: List[JobPosting]) -> List[JobPosting]:
     """Enrich jobs with tasks, skills, and candidate profile.
 
+    Fields already filled from structured data are kept; jobs with all of
+    them filled skip the LLM call.
+
     Args:
         jobs: List of JobPosting objects.
 
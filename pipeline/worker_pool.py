@@ -0,0 +1,376 @@
+"""Multi-process crawl workers fed from a coordinator-owned job queue."""
+
+from __future__ import annotations
+
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import Callable, ContextManager, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.errors import ParseError
+from crawling.fetch_archive import FetchArchive
+from crawling.fetch_strategy import StrategyFetcher
+from crawling.html_cache import HtmlCache
+from crawling.playwright_client import PlaywrightClient
+from crawling.rate_limiter import RateLimiter
+from crawling.site_registry import detect_site
+from domain.models import JobListing, JobPosting
+from pipeline.job_ingest_pipeline import fetch_job_html, parse_job
+
+
+Processor = Callable[[JobListing], JobPosting]
+ProcessorFactory = Callable[["WorkerOptions"], ContextManager[Processor]]
+
+# Sites whose listings all go to one worker, so its logged-in session is the
+# only one (N workers would otherwise log the same account in N times).
+SESSION_SITES = ("linkedin",)
+
+
+@dataclass(frozen=True)
+class WorkerOptions:
+    """Picklable settings each worker uses to build its own browser client.
+
+    `rate_scale` multiplies every per-host rate so N workers together stay
+    within the site limits a single process would use.
+    """
+
+    headless: bool = True
+    timeout_ms: int = 20000
+    max_page_navigations: int = 25
+    max_context_navigations: int = 200
+    max_rss_mb: Optional[float] = None
+    block_resources: bool = False
+    cache_dir: Optional[str] = None
+    cache_ttl_s: float = 12 * 3600
+    cache_mode: str = "use"
+    archive_dir: Optional[str] = None
+    archive_mode: str = "replay"
+    rate_limiting: bool = True
+    rate_scale: float = 1.0
+
+
+@dataclass(frozen=True)
+class WorkerResult:
+    """Outcome of processing one listing in a worker.
+
+    `fetched` is True once the page was fetched: for every posting, and for
+    errors raised as ParseError after a successful fetch.
+    """
+
+    listing: JobListing
+    posting: Optional[JobPosting] = None
+    error: Optional[str] = None
+    worker_id: int = -1
+    attempts: int = 1
+    fetched: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@contextmanager
+def browser_processor(options: WorkerOptions) -> Iterator[Processor]:
+    """Default worker processor: fetch a listing with a pooled client and parse it.
+
+    Parse failures are raised as ParseError so results report the fetch.
+    """
+
+    cache = None
+    if options.cache_dir:
+        cache = HtmlCache(root=options.cache_dir, ttl_seconds=options.cache_ttl_s, mode=options.cache_mode)
+    archive = FetchArchive(root=options.archive_dir, mode=options.archive_mode) if options.archive_dir else None
+    client = PlaywrightClient(
+        timeout_ms=options.timeout_ms,
+        headless=options.headless,
+        max_page_navigations=options.max_page_navigations,
+        max_context_navigations=options.max_context_navigations,
+        max_rss_mb=options.max_rss_mb,
+        block_resources=options.block_resources,
+        cache=cache,
+        rate_limiter=RateLimiter(enabled=options.rate_limiting, rate_scale=options.rate_scale),
+        archive=archive,
+    )
+    with client:
+        fetcher = StrategyFetcher(client=client)
+
+        def process(listing: JobListing) -> JobPosting:
+            html = fetch_job_html(listing, fetcher=fetcher)
+            try:
+                return parse_job(html, detect_site(listing.url))
+            except Exception as exc:
+                raise ParseError(f"{type(exc).__name__}: {exc}") from exc
+
+        try:
+            yield process
+        finally:
+            fetcher.close()
+
+
+def run_workers(
+    listings: Iterable[JobListing],
+    workers: int = 2,
+    options: Optional[WorkerOptions] = None,
+    max_attempts: int = 2,
+    processor_factory: ProcessorFactory = browser_processor,
+    session_sites: Tuple[str, ...] = SESSION_SITES,
+) -> Iterator[WorkerResult]:
+    """Process listings in `workers` spawned processes, each with its own browser.
+
+    The coordinator keeps the job queue and hands one listing at a time to
+    an idle worker over its pipe, so it always knows what each worker holds.
+    When a worker process dies, its listing is requeued (up to
+    `max_attempts` tries) and a replacement worker is started. Listings of
+    `session_sites` are pinned to the first worker that takes one (until it
+    dies), so only that worker logs in to the site.
+
+    Args:
+        listings: JobListing objects to process.
+        workers: Number of worker processes.
+        options: Settings used by each worker to build its client.
+        max_attempts: Tries per listing across worker crashes.
+        processor_factory: Picklable context manager factory yielding the
+            per-worker `listing -> JobPosting` function.
+        session_sites: Site names whose listings share a single worker.
+
+    Yields:
+        WorkerResult: One result per listing, in completion order. Fetch and
+        parse errors are reported on the result instead of being raised.
+
+    Raises:
+        ValueError: If workers or max_attempts is not positive.
+    """
+
+    batch = list(listings)
+    if workers < 1:
+        raise ValueError("run_workers requires at least one worker.")
+    if max_attempts < 1:
+        raise ValueError("run_workers requires max_attempts of at least 1.")
+    if not batch:
+        return
+
+    pool = _Coordinator(batch, options or WorkerOptions(), max_attempts, processor_factory, session_sites)
+    try:
+        for worker_id in range(min(workers, len(batch))):
+            pool.spawn(worker_id)
+        yield from pool.results()
+    finally:
+        pool.shutdown()
+
+
+@dataclass(eq=False)
+class _Worker:
+    worker_id: int
+    process: multiprocessing.process.BaseProcess
+    conn: object
+    task_id: Optional[int] = None
+
+
+class _Coordinator:
+    """Job queue, dispatch, and crash handling for `run_workers`."""
+
+    def __init__(
+        self,
+        batch: List[JobListing],
+        options: WorkerOptions,
+        max_attempts: int,
+        processor_factory: ProcessorFactory,
+        session_sites: Tuple[str, ...] = (),
+    ) -> None:
+        self.batch = batch
+        self.options = options
+        self.max_attempts = max_attempts
+        self.processor_factory = processor_factory
+        self.context = multiprocessing.get_context("spawn")
+        self.queue = deque(range(len(batch)))
+        self.attempts = [0] * len(batch)
+        self.remaining = set(range(len(batch)))
+        self.workers: Dict[int, _Worker] = {}
+        self.idle: List[_Worker] = []
+        self.next_worker_id = 0
+        self.restarts_left = len(batch) * max_attempts
+        self.fatal_error: Optional[str] = None
+        self.session_site: Dict[int, str] = {}
+        for task_id, listing in enumerate(batch):
+            site = detect_site(listing.url)
+            if site is not None and site.name in session_sites:
+                self.session_site[task_id] = site.name
+        self.session_owner: Dict[str, int] = {}
+
+    def spawn(self, worker_id: int) -> None:
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(worker_id, child_conn, self.options, self.processor_factory),
+            name=f"crawl-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        self.workers[worker_id] = _Worker(worker_id, process, parent_conn)
+        self.next_worker_id = max(self.next_worker_id, worker_id + 1)
+
+    def results(self) -> Iterator[WorkerResult]:
+        while self.remaining:
+            if not self.workers:
+                error = self.fatal_error or "all crawl workers exited"
+                for task_id in sorted(self.remaining):
+                    yield self._result(task_id, error=error)
+                self.remaining.clear()
+                return
+            waitables = {}
+            for worker in self.workers.values():
+                waitables[worker.conn] = worker
+                waitables[worker.process.sentinel] = worker
+            for ready in wait(list(waitables)):
+                worker = waitables[ready]
+                if worker.worker_id not in self.workers:
+                    continue
+                message = self._recv(worker) if ready is worker.conn else None
+                if message is not None:
+                    yield from self._receive(worker, message)
+                else:
+                    worker.process.join(timeout=5)
+                    yield from self._reap(worker)
+
+    def _recv(self, worker: _Worker) -> Optional[tuple]:
+        """Return the next message, or None once the worker's pipe is closed."""
+
+        try:
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            return None
+
+    def _receive(self, worker: _Worker, message: tuple) -> Iterator[WorkerResult]:
+        kind, task_id, payload = message
+        if kind == "fatal":
+            self.fatal_error = payload
+            self._drop(worker)
+            return
+        if kind in ("done", "failed"):
+            worker.task_id = None
+            if task_id in self.remaining:
+                self.remaining.discard(task_id)
+                if kind == "done":
+                    yield self._result(task_id, posting=payload, worker_id=worker.worker_id, fetched=True)
+                else:
+                    error, fetched = payload
+                    yield self._result(task_id, error=error, worker_id=worker.worker_id, fetched=fetched)
+        self._dispatch(worker)
+
+    def _reap(self, worker: _Worker) -> Iterator[WorkerResult]:
+        # Deliver anything the worker managed to send before it exited.
+        while worker.worker_id in self.workers:
+            try:
+                pending = worker.conn.poll()
+            except OSError:
+                break
+            message = self._recv(worker) if pending else None
+            if message is None:
+                break
+            yield from self._receive(worker, message)
+        if worker.worker_id not in self.workers:
+            return
+        task_id = worker.task_id
+        exitcode = worker.process.exitcode
+        self._drop(worker)
+        if task_id is not None and task_id in self.remaining:
+            if self.attempts[task_id] >= self.max_attempts:
+                self.remaining.discard(task_id)
+                yield self._result(task_id, error=f"Crawl worker crashed (exit code {exitcode})")
+            else:
+                self.queue.appendleft(task_id)
+        # Requeued or no longer pinned listings may now suit an idle worker.
+        for idle in list(self.idle):
+            self._dispatch(idle)
+        if self.remaining and self.restarts_left > 0 and self.fatal_error is None:
+            self.restarts_left -= 1
+            self.spawn(self.next_worker_id)
+
+    def _dispatch(self, worker: _Worker) -> None:
+        if worker in self.idle:
+            self.idle.remove(worker)
+        while self.queue and self.queue[0] not in self.remaining:
+            self.queue.popleft()
+        task_id = self._next_task(worker)
+        if task_id is None:
+            self.idle.append(worker)
+            return
+        self.attempts[task_id] += 1
+        worker.task_id = task_id
+        listing = self.batch[task_id]
+        try:
+            worker.conn.send((task_id, listing.url, listing.source))
+        except (BrokenPipeError, OSError):
+            pass  # the process sentinel reports the exit and requeues
+
+    def _next_task(self, worker: _Worker) -> Optional[int]:
+        """Take the first queued task this worker may run (session pinning)."""
+
+        for index, task_id in enumerate(self.queue):
+            if task_id not in self.remaining:
+                continue
+            site = self.session_site.get(task_id)
+            owner = self.session_owner.setdefault(site, worker.worker_id) if site else worker.worker_id
+            if owner == worker.worker_id:
+                del self.queue[index]
+                return task_id
+        return None
+
+    def _drop(self, worker: _Worker) -> None:
+        self.workers.pop(worker.worker_id, None)
+        self.session_owner = {
+            site: owner for site, owner in self.session_owner.items() if owner != worker.worker_id
+        }
+        if worker in self.idle:
+            self.idle.remove(worker)
+        worker.process.join(timeout=5)
+        worker.conn.close()
+
+    def _result(self, task_id: int, **kwargs) -> WorkerResult:
+        return WorkerResult(listing=self.batch[task_id], attempts=self.attempts[task_id], **kwargs)
+
+    def shutdown(self) -> None:
+        for worker in self.workers.values():
+            try:
+                worker.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self.workers.values():
+            worker.process.join(timeout=10)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+        self.workers = {}
+        self.idle = []
+
+
+def _worker_main(worker_id: int, conn, options: WorkerOptions, processor_factory: ProcessorFactory) -> None:
+    try:
+        processor_scope = processor_factory(options)
+        process = processor_scope.__enter__()
+    except Exception as exc:
+        conn.send(("fatal", None, f"{type(exc).__name__}: {exc}"))
+        conn.close()
+        return
+    try:
+        conn.send(("ready", None, None))
+        while True:
+            try:
+                task = conn.recv()
+            except EOFError:
+                break
+            if task is None:
+                break
+            task_id, url, source = task
+            try:
+                message = ("done", task_id, process(JobListing(url=url, source=source)))
+            except Exception as exc:
+                message = ("failed", task_id, (f"{type(exc).__name__}: {exc}", isinstance(exc, ParseError)))
+            conn.send(message)
+    finally:
+        processor_scope.__exit__(None, None, None)
+        conn.close()
@@ -1,14 +1,20 @@
+"""
+Get fully rendered HTML from a webpage using Playwright.
+"""
+
 import argparse
 from pathlib import Path
 from typing import Optional
 
 from bs4 import BeautifulSoup
+from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 from urllib.parse import urljoin
-"""
-Get fully rendered HTML from a webpage using Playwright.
-"""
+
+from crawling.readiness import JOBPOSTING_READY_JS
+from crawling.site_registry import SITE_CONFIGS, detect_site
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -27,7 +33,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--site",
-        choices=["accso", "xing", "stepstone", "linkedin"],
+        choices=list(SITE_CONFIGS),
         help="Use a preset configuration for a known site",
     )
     parser.add_argument(
@@ -80,15 +86,9 @@ def fetch_rendered_html(
                 pass
         if wait_jobposting:
             try:
-                page.wait_for_function(
-                    """() => {
-                        const script = document.querySelector(
-                            'script[type="application/ld+json"]'
-                        );
-                        return script && script.textContent.includes('"@type":"JobPosting"');
-                    }"""
-                )
-            except PlaywrightTimeoutError:
+                page.evaluate(JOBPOSTING_READY_JS, timeout_ms)
+            except PlaywrightError:
+                # Timed out or the page navigated away; keep what rendered.
                 pass
 
         html = page.content()
@@ -140,32 +140,19 @@ def main() -> int:
 
 
 def apply_site_preset(args: argparse.Namespace) -> None:
-    presets = {
-        "accso": {
-            "follow_iframe": True,
-            "iframe_selector": "iframe#jobFrame",
-        },
-        "xing": {"wait_jobposting": True},
-        "stepstone": {"wait_jobposting": True},
-    }
-    preset = presets.get(args.site)
-    if not preset:
+    config = SITE_CONFIGS.get(args.site)
+    if not config:
         return
-    for key, value in preset.items():
-        setattr(args, key, value)
+    if config.follow_iframe:
+        args.follow_iframe = True
+        args.iframe_selector = config.iframe_selector
+    if config.wait_jobposting:
+        args.wait_jobposting = True
 
 
 def detect_site_from_url(url: str) -> Optional[str]:
-    lowered = url.lower()
-    if "accso" in lowered:
-        return "accso"
-    if "xing.com" in lowered:
-        return "xing"
-    if "stepstone" in lowered:
-        return "stepstone"
-    if "linkedin.com" in lowered:
-        return "linkedin"
-    return None
+    config = detect_site(url)
+    return config.name if config else None
 
 
 def default_output_for_site(site: str) -> str:
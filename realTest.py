@@ -35,14 +35,14 @@ def main() -> int:
         client = PlaywrightClient()
         site = detect_site(url)
 
-        html = client.fetch(
-            url,
-            wait_for=None,
-            wait_jobposting=site.wait_jobposting if site else False,
-        )
-
         if site and site.follow_iframe:
             html = client.fetch_iframe(url, site.iframe_selector)
+        else:
+            html = client.fetch(
+                url,
+                wait_for=None,
+                wait_jobposting=site.wait_jobposting if site else False,
+            )
 
         print(html[:2000])
         return 0
@@ -0,0 +1,138 @@
+"""SQLite-backed crawl frontier for incremental runs."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+PARSED = "parsed"
+OPTIMIZED = "optimized"
+FAILED = "failed"
+
+# Progress order of the successful states; FAILED sits outside it.
+STATE_ORDER = (DISCOVERED, FETCHED, PARSED, OPTIMIZED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS frontier_state ON frontier (state);
+"""
+
+
+class CrawlFrontier:
+    """Record the processing state of job URLs across runs.
+
+    Each URL moves through discovered -> fetched -> parsed -> optimized, or
+    lands in failed. `should_process` tells a run whether a URL still needs
+    work for a target state.
+    """
+
+    def __init__(self, path: Path, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def discover(self, url: str, source: str = "") -> bool:
+        """Record a URL as discovered.
+
+        Returns:
+            bool: True if the URL was not known before.
+        """
+
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO frontier (url, source, state, first_seen, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, source, DISCOVERED, now, now),
+            )
+            return cursor.rowcount > 0
+
+    def mark(self, url: str, state: str, error: Optional[str] = None) -> None:
+        """Move a URL to a state; FAILED also counts an attempt and keeps the error."""
+
+        if state != FAILED and state not in STATE_ORDER:
+            raise ValueError(f"Unknown frontier state: {state}")
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO frontier (url, state, first_seen, updated_at) VALUES (?, ?, ?, ?)",
+                (url, state, now, now),
+            )
+            if state == FAILED:
+                self._conn.execute(
+                    "UPDATE frontier SET state = ?, error = ?, attempts = attempts + 1, updated_at = ? "
+                    "WHERE url = ?",
+                    (state, error, now, url),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE frontier SET state = ?, error = NULL, updated_at = ? WHERE url = ?",
+                    (state, now, url),
+                )
+
+    def state(self, url: str) -> Optional[str]:
+        """Return the recorded state of a URL, or None if unknown."""
+
+        with self._lock:
+            row = self._conn.execute("SELECT state FROM frontier WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def should_process(self, url: str, target: str, max_age_s: Optional[float] = None) -> bool:
+        """Return True if a URL still needs work to reach `target`.
+
+        Args:
+            url: Job URL.
+            target: State the caller wants the URL to reach.
+            max_age_s: Treat URLs that reached `target` (or last failed)
+                longer ago than this as stale and process them again, even
+                failed URLs that have used up their attempts.
+
+        Returns:
+            bool: True for new, unfinished, stale, or retryable failed URLs.
+        """
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state, attempts, updated_at FROM frontier WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return True
+        state, attempts, updated_at = row
+        stale = max_age_s is not None and time.time() - updated_at > max_age_s
+        if state == FAILED:
+            return attempts < self.max_attempts or stale
+        return STATE_ORDER.index(state) < STATE_ORDER.index(target) or stale
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of URLs per state."""
+
+        with self._lock:
+            rows = self._conn.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state").fetchall()
+        return {state: count for state, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "CrawlFrontier":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
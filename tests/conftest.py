@@ -1,6 +1,8 @@
 import importlib
 import os
 import sys
+import types
+
 import pytest
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -20,3 +22,13 @@ def require_module(module_name: str):
         return importlib.import_module(module_name)
     except Exception as exc:
         pytest.skip(f"Cannot import {module_name}: {exc}")
+
+
+@pytest.fixture
+def fake_sync_api(monkeypatch):
+    """Install a bare `playwright.sync_api` module for tests that mock pages."""
+    module = types.ModuleType("playwright.sync_api")
+    module.TimeoutError = TimeoutError
+    monkeypatch.setitem(sys.modules, "playwright", types.ModuleType("playwright"))
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", module)
+    return module
@@ -0,0 +1,46 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+from conftest import require_attr
+
+
+def test_fetch_many_respects_site_cap_and_yields_as_completed(monkeypatch):
+    """Method under test: crawling.async_fetcher.AsyncFetchEngine.fetch_many"""
+    AsyncFetchEngine = require_attr("crawling.async_fetcher", "AsyncFetchEngine")
+    JobListing = require_attr("domain.models", "JobListing")
+
+    active = {"linkedin": 0}
+    peak = {"linkedin": 0}
+
+    @asynccontextmanager
+    async def fake_context(self):
+        yield object()
+
+    async def fake_fetch_one(self, context, url, site):
+        if site and site.name == "linkedin":
+            active["linkedin"] += 1
+            peak["linkedin"] = max(peak["linkedin"], active["linkedin"])
+            await asyncio.sleep(0.02)
+            active["linkedin"] -= 1
+        if url.endswith("fail"):
+            raise RuntimeError("boom")
+        return f"<html>{url}</html>"
+
+    monkeypatch.setattr(AsyncFetchEngine, "_browser_context", fake_context)
+    monkeypatch.setattr(AsyncFetchEngine, "_fetch_one", fake_fetch_one)
+
+    listings = [
+        JobListing(url="https://www.linkedin.com/jobs/view/1", source="linkedin"),
+        JobListing(url="https://www.linkedin.com/jobs/view/2", source="linkedin"),
+        JobListing(url="https://www.stepstone.de/jobs/fail", source="stepstone"),
+    ]
+
+    async def collect():
+        engine = AsyncFetchEngine(max_concurrency=4)
+        return [result async for result in engine.fetch_many(listings)]
+
+    results = asyncio.run(collect())
+    assert len(results) == 3
+    assert peak["linkedin"] == 1
+    assert not results[0].ok
+    assert all(r.ok for r in results[1:])
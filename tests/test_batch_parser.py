@@ -0,0 +1,48 @@
+import json
+import shutil
+from pathlib import Path
+
+from conftest import require_attr
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_pages"
+
+
+def test_run_batch_parses_directory_and_manifest(tmp_path):
+    """Method under test: parsing.batch.run_batch"""
+    collect_inputs = require_attr("parsing.batch", "collect_inputs")
+    run_batch = require_attr("parsing.batch", "run_batch")
+    BatchOptions = require_attr("parsing.batch", "BatchOptions")
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    shutil.copy(FIXTURES / "stepstone_job.html", pages / "stepstone.html")
+    shutil.copy(FIXTURES / "accso_iframe.html", pages / "accso.htm")
+    (pages / "empty.html").write_text("<p>nothing</p>", encoding="utf-8")
+    manifest = tmp_path / "manifest.jsonl"
+    manifest.write_text(json.dumps({"path": "pages/stepstone.html"}) + "\n", encoding="utf-8")
+
+    paths = collect_inputs([str(pages), str(manifest)])
+    results = {Path(r["path"]).name: r for r in run_batch(paths, BatchOptions(keywords=("python",)), workers=1)}
+
+    assert len(paths) == 3
+    assert results["stepstone.html"]["json_ld"]["title"]
+    assert "description" not in results["stepstone.html"]["json_ld"]
+    assert results["stepstone.html"]["description"]
+    assert results["accso.htm"]["json_ld"] is None and "Python" in results["accso.htm"]["description"]
+    assert results["empty.html"]["error"].startswith("ValueError")
+    assert all(r["parse_ms"] >= 0 and r["bytes"] > 0 for r in results.values())
+
+
+def test_run_batch_pool_matches_in_process(tmp_path):
+    """Method under test: parsing.batch.run_batch"""
+    run_batch = require_attr("parsing.batch", "run_batch")
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"page{index}.html"
+        shutil.copy(FIXTURES / "stepstone_job.html", path)
+        paths.append(path)
+
+    def _strip(results):
+        return sorted((r["path"], r["description"], r["error"]) for r in results)
+
+    assert _strip(run_batch(paths, workers=2, chunksize=2)) == _strip(run_batch(paths, workers=1))
@@ -0,0 +1,161 @@
+from conftest import require_attr
+
+
+class _FakePage:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class _FakeContext:
+    def new_page(self):
+        return _FakePage()
+
+    def close(self):
+        pass
+
+
+class _FakeBrowser:
+    def new_context(self, **_kwargs):
+        return _FakeContext()
+
+    def close(self):
+        pass
+
+
+class _FakePlaywright:
+    class chromium:
+        @staticmethod
+        def launch(headless=True):
+            return _FakeBrowser()
+
+    def stop(self):
+        pass
+
+
+def test_browser_pool_recycles_page_after_max_navigations(monkeypatch):
+    """Method under test: crawling.browser_pool.BrowserPool.page"""
+    BrowserPool = require_attr("crawling.browser_pool", "BrowserPool")
+    monkeypatch.setattr(BrowserPool, "_start_playwright", lambda self: _FakePlaywright())
+
+    with BrowserPool(size=1, max_page_navigations=2) as pool:
+        with pool.page() as first:
+            pass
+        with pool.page() as second:
+            pass
+        with pool.page() as third:
+            pass
+        stats = pool.stats()
+
+    assert first is second
+    assert third is not first
+    assert first.closed
+    assert stats["browser_launches"] == 1
+    assert stats["navigations"] == 3
+
+
+def test_playwright_client_open_close_uses_pool(monkeypatch):
+    """Methods under test: crawling.playwright_client.PlaywrightClient.open/close"""
+    BrowserPool = require_attr("crawling.browser_pool", "BrowserPool")
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+    monkeypatch.setattr(BrowserPool, "_start_playwright", lambda self: _FakePlaywright())
+
+    client = PlaywrightClient(pool_size=2)
+    with client:
+        assert client.is_open
+    assert not client.is_open
+
+
+def test_browser_pool_recycles_contexts_and_browser_on_rss_ceiling(monkeypatch):
+    """Methods under test: crawling.browser_pool.BrowserPool.page/metrics"""
+    BrowserPool = require_attr("crawling.browser_pool", "BrowserPool")
+    monkeypatch.setattr(BrowserPool, "_start_playwright", lambda self: _FakePlaywright())
+    samples = iter([100 * 1024 * 1024, 900 * 1024 * 1024, 50 * 1024 * 1024])
+
+    pool = BrowserPool(
+        size=1,
+        max_context_navigations=3,
+        max_rss_mb=512,
+        memory_check_interval=2,
+        rss_probe=lambda: next(samples),
+    )
+    with pool:
+        for _ in range(5):
+            with pool.page():
+                pass
+        metrics = pool.metrics()
+
+    assert metrics["context_recycles"] == 1
+    assert metrics["browser_recycles"] == 1
+    assert metrics["browser_launches"] == 2
+    assert metrics["peak_rss_bytes"] == 900 * 1024 * 1024
+    assert metrics["rss_bytes"] == 50 * 1024 * 1024
+    assert metrics["context_navigations"] == [1]
+
+
+def test_browser_pool_measures_only_its_own_driver_tree(monkeypatch, tmp_path):
+    """Method under test: crawling.browser_pool.BrowserPool.sample_rss"""
+    import os
+    import signal
+    import subprocess
+    import sys
+    import time
+
+    BrowserPool = require_attr("crawling.browser_pool", "BrowserPool")
+    child_pids = require_attr("crawling.process_memory", "child_pids")
+    child_tree_rss_bytes = require_attr("crawling.process_memory", "child_tree_rss_bytes")
+    if child_pids() is None:
+        return
+    marker = tmp_path / "browser-started"
+    # The "browser" touches the marker once started, so its RSS is stable.
+    browser = [sys.executable, "-c", f"import pathlib, time; pathlib.Path({str(marker)!r}).touch(); time.sleep(30)"]
+    driver_code = f"import subprocess, time; subprocess.Popen({browser!r}); time.sleep(30)"
+    other = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    drivers = []
+
+    def _start(self):
+        drivers.append(subprocess.Popen([sys.executable, "-c", driver_code]))
+        return _FakePlaywright()
+
+    monkeypatch.setattr(BrowserPool, "_start_playwright", _start)
+    try:
+        with BrowserPool(size=1) as pool:
+            for _ in range(200):
+                if marker.exists():
+                    break
+                time.sleep(0.05)
+            browser_rss = pool.sample_rss()
+            assert browser_rss == child_tree_rss_bytes(drivers[0].pid) > 0
+            assert child_tree_rss_bytes() > browser_rss
+    finally:
+        for process in [other, *drivers]:
+            for pid in child_pids(process.pid) or ():
+                os.kill(pid, signal.SIGKILL)
+            process.kill()
+            process.wait()
+
+
+def test_browser_pool_relaunch_failure_does_not_mask_caller_error(monkeypatch):
+    """Method under test: crawling.browser_pool.BrowserPool.page"""
+    import pytest
+
+    BrowserPool = require_attr("crawling.browser_pool", "BrowserPool")
+    monkeypatch.setattr(BrowserPool, "_start_playwright", lambda self: _FakePlaywright())
+    pool = BrowserPool(size=1, max_rss_mb=1, memory_check_interval=1, rss_probe=lambda: 2 * 1024 * 1024)
+
+    with pool:
+        def _fail_launch(headless=True):
+            raise RuntimeError("launch failed")
+
+        monkeypatch.setattr(_FakePlaywright.chromium, "launch", staticmethod(_fail_launch))
+        with pytest.raises(ValueError):
+            with pool.page():
+                raise ValueError("navigation failed")
+        with pytest.raises(RuntimeError, match="launch failed"):
+            with pool.page():
+                pass
@@ -24,3 +24,38 @@ def test_cli_run_returns_int(monkeypatch):
         return
     assert isinstance(result, int)
 
+
+def test_crawl_closes_pool_before_worker_fetches(monkeypatch):
+    """Method under test: app.cli._crawl"""
+    import argparse
+
+    _crawl = require_attr("app.cli", "_crawl")
+    JobListing = require_attr("domain.models", "JobListing")
+    JobQuery = require_attr("domain.models", "JobQuery")
+
+    class _Client:
+        is_open = True
+
+        def metrics(self):
+            return {"navigations": 3} if self.is_open else {}
+
+        def close(self):
+            self.is_open = False
+
+    seen_open = []
+
+    def _postings(listings, client, args, frontier):
+        seen_open.append(client.is_open)
+        return iter(())
+
+    listing = JobListing(url="https://www.xing.com/jobs/1", source="xing")
+    monkeypatch.setattr("app.cli.collect_job_listings", lambda *args, **kwargs: [listing])
+    monkeypatch.setattr("app.cli._iter_job_postings", _postings)
+    args = argparse.Namespace(
+        limit=1, optimize=True, refresh_days=None, timings=False, workers=2, concurrency=1,
+        profile_summary=None, profile_skills=None, profile_experiences=None, profile_projects=None,
+        cv_path=None, motivation_path=None,
+    )
+
+    assert _crawl(args, JobQuery(keywords=["python"], location="berlin"), _Client(), None) == 0
+    assert seen_open == [False]
@@ -0,0 +1,85 @@
+from conftest import require_attr
+
+
+def test_crawl_frontier_tracks_state_across_instances(tmp_path):
+    """Methods under test: storage.crawl_frontier.CrawlFrontier.discover/mark/should_process"""
+    CrawlFrontier = require_attr("storage.crawl_frontier", "CrawlFrontier")
+    path = tmp_path / "frontier.sqlite"
+    url = "https://www.xing.com/jobs/1"
+
+    with CrawlFrontier(path) as frontier:
+        assert frontier.discover(url, "xing")
+        assert not frontier.discover(url, "xing")
+        assert frontier.should_process(url, "optimized")
+        frontier.mark(url, "optimized")
+
+    with CrawlFrontier(path) as frontier:
+        assert frontier.state(url) == "optimized"
+        assert not frontier.should_process(url, "optimized")
+        assert frontier.should_process(url, "optimized", max_age_s=-1)
+        assert frontier.counts() == {"optimized": 1}
+
+
+def test_crawl_frontier_retries_failed_until_max_attempts(tmp_path):
+    """Method under test: storage.crawl_frontier.CrawlFrontier.should_process"""
+    CrawlFrontier = require_attr("storage.crawl_frontier", "CrawlFrontier")
+    url = "https://www.stepstone.de/jobs/2"
+    with CrawlFrontier(tmp_path / "f.sqlite", max_attempts=2) as frontier:
+        frontier.mark(url, "failed", "timeout")
+        assert frontier.should_process(url, "optimized")
+        frontier.mark(url, "failed", "timeout")
+        assert not frontier.should_process(url, "optimized")
+
+
+def test_crawl_frontier_retries_exhausted_failures_once_stale(tmp_path):
+    """Method under test: storage.crawl_frontier.CrawlFrontier.should_process"""
+    CrawlFrontier = require_attr("storage.crawl_frontier", "CrawlFrontier")
+    url = "https://www.xing.com/jobs/3"
+    with CrawlFrontier(tmp_path / "f.sqlite", max_attempts=1) as frontier:
+        frontier.mark(url, "failed", "timeout")
+        assert not frontier.should_process(url, "optimized", max_age_s=3600)
+        assert frontier.should_process(url, "optimized", max_age_s=-1)
+
+
+def test_collect_job_listings_with_discovered_target_lists_new_urls_once(tmp_path):
+    """Method under test: pipeline.job_ingest_pipeline.collect_job_listings"""
+    import asyncio
+
+    collect_job_listings = require_attr("pipeline.job_ingest_pipeline", "collect_job_listings")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+    CrawlFrontier = require_attr("storage.crawl_frontier", "CrawlFrontier")
+    JobQuery = require_attr("domain.models", "JobQuery")
+
+    class _LinkedInSession:
+        def run(self, coro):
+            return asyncio.run(coro)
+
+        async def reserve_pages_async(self, count):
+            pass
+
+        async def search_job_urls_async(self, url):
+            return []
+
+    class _Client:
+        archive = None
+        linkedin_session = _LinkedInSession()
+        rate_limiter = RateLimiter(enabled=False)
+
+        def __init__(self):
+            self.fetched = []
+
+        def extract(self, url, mode, selector=None, frame_selector=None, wait_jobposting=False, use_cache=True):
+            self.fetched.append(url)
+            if "stepstone" in url and len(self.fetched) < 20:
+                return [f"https://www.stepstone.de/jobs/{len(self.fetched)}-{i}" for i in range(3)]
+            return []
+
+    query = JobQuery(keywords=["python"], location="berlin")
+    with CrawlFrontier(tmp_path / "f.sqlite") as frontier:
+        client = _Client()
+        first = collect_job_listings(query, limit=3, client=client, frontier=frontier, target_state="discovered")
+        assert len(first) == 3
+        assert len([url for url in client.fetched if "stepstone" in url]) == 1
+
+        again = collect_job_listings(query, limit=3, client=_Client(), frontier=frontier, target_state="discovered")
+        assert again and not {item.url for item in again} & {item.url for item in first}
@@ -0,0 +1,46 @@
+import pytest
+
+from conftest import require_attr
+
+
+def test_fetch_archive_records_one_har_per_context(tmp_path):
+    """Method under test: crawling.fetch_archive.FetchArchive.context_options"""
+    FetchArchive = require_attr("crawling.fetch_archive", "FetchArchive")
+    archive = FetchArchive(root=tmp_path / "run", mode="record")
+
+    first = archive.context_options()
+    second = archive.context_options()
+
+    assert first["record_har_path"] != second["record_har_path"]
+    assert first["record_har_path"].endswith(".har.zip")
+    assert first["record_har_content"] == "attach"
+
+
+def test_fetch_archive_replay_aborts_unarchived_requests(tmp_path):
+    """Methods under test: crawling.fetch_archive.FetchArchive.install"""
+    FetchArchive = require_attr("crawling.fetch_archive", "FetchArchive")
+    with pytest.raises(FileNotFoundError):
+        FetchArchive(root=tmp_path, mode="replay")
+
+    (tmp_path / "context-1.har.zip").write_bytes(b"")
+    (tmp_path / "context-2.har.zip").write_bytes(b"")
+
+    class _Context:
+        def __init__(self):
+            self.calls = []
+
+        def route(self, pattern, handler):
+            self.calls.append(("route", pattern))
+
+        def route_from_har(self, path, not_found):
+            self.calls.append(("har", path.rsplit("/", 1)[-1], not_found))
+
+    context = _Context()
+    FetchArchive(root=tmp_path, mode="replay").install(context)
+
+    # The catch-all abort is registered first, so the archives take precedence.
+    assert context.calls == [
+        ("route", "**/*"),
+        ("har", "context-1.har.zip", "fallback"),
+        ("har", "context-2.har.zip", "fallback"),
+    ]
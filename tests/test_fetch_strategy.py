@@ -0,0 +1,92 @@
+from conftest import require_attr
+
+
+def test_static_html_is_sufficient_for_json_ld_sites():
+    """Method under test: crawling.fetch_strategy.static_html_is_sufficient"""
+    static_html_is_sufficient = require_attr("crawling.fetch_strategy", "static_html_is_sufficient")
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+    site = detect_site("https://www.stepstone.de/stellenangebote--x.html")
+    html = '<script type="application/ld+json">{"@type": "JobPosting", "title": "Dev"}</script>'
+    assert static_html_is_sufficient(html, site)
+    assert not static_html_is_sufficient("<html><body>loading</body></html>", site)
+
+
+def test_strategy_fetcher_falls_back_to_browser():
+    """Method under test: crawling.fetch_strategy.StrategyFetcher.fetch"""
+    StrategyFetcher = require_attr("crawling.fetch_strategy", "StrategyFetcher")
+    HttpResponse = require_attr("crawling.http_fetcher", "HttpResponse")
+
+    class _Http:
+        def __init__(self, text):
+            self.text = text
+
+        def get(self, url):
+            return HttpResponse(url=url, status=200, headers={}, text=self.text)
+
+    class _Client:
+        cache = None
+        rate_limiter = None
+        archive = None
+
+        def fetch(self, url, wait_for=None, wait_jobposting=False):
+            return "<html>rendered</html>"
+
+    url = "https://www.xing.com/jobs/berlin-dev-1"
+    static = '<script type="application/ld+json">{"@type":"JobPosting"}</script>'
+    hit = StrategyFetcher(client=_Client(), http=_Http(static))
+    assert hit.fetch(url) == static
+    assert hit.stats.snapshot()["xing"] == {"http_hit": 1}
+
+    miss = StrategyFetcher(client=_Client(), http=_Http("<html></html>"))
+    assert miss.fetch(url) == "<html>rendered</html>"
+    assert miss.stats.snapshot()["xing"] == {"http_insufficient": 1, "browser": 1}
+
+
+def test_http_fetcher_closes_connections_on_failure(monkeypatch):
+    """Method under test: crawling.http_fetcher.HttpFetcher.get"""
+    import pytest
+
+    HttpFetcher = require_attr("crawling.http_fetcher", "HttpFetcher")
+
+    class _Response:
+        status = 200
+        will_close = False
+
+        def read(self):
+            raise ConnectionResetError("reset while reading")
+
+        def getheaders(self):
+            return []
+
+    class _Conn:
+        def __init__(self):
+            self.closed = False
+
+        def request(self, method, target, headers=None):
+            pass
+
+        def getresponse(self):
+            return _Response()
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+
+    def _new_connection(self, key):
+        opened.append(_Conn())
+        return opened[-1]
+
+    monkeypatch.setattr(HttpFetcher, "_new_connection", _new_connection)
+    fetcher = HttpFetcher()
+    stale = _Conn()
+    fetcher._idle[("https", "www.xing.com", 443)] = [stale]
+
+    with pytest.raises(ConnectionResetError):
+        fetcher.get("https://www.xing.com/jobs/1")
+    with pytest.raises(ConnectionResetError):
+        fetcher.get("https://www.xing.com/jobs/2")
+
+    assert stale.closed and len(opened) == 2
+    assert all(conn.closed for conn in opened)
+    assert fetcher._idle[("https", "www.xing.com", 443)] == []
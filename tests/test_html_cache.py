@@ -0,0 +1,39 @@
+import os
+import time
+
+from conftest import require_attr
+
+
+def test_html_cache_roundtrip_and_ttl(tmp_path):
+    """Methods under test: crawling.html_cache.HtmlCache.get/put"""
+    HtmlCache = require_attr("crawling.html_cache", "HtmlCache")
+    cache = HtmlCache(root=tmp_path, ttl_seconds=60)
+    options = {"kind": "page"}
+
+    assert cache.get("https://www.xing.com/jobs/1", options) is None
+    cache.put("https://WWW.xing.com/jobs/1#top", options, "<html>x</html>")
+    assert cache.get("https://www.xing.com/jobs/1", options) == "<html>x</html>"
+    assert cache.get("https://www.xing.com/jobs/1", {"kind": "iframe"}) is None
+
+    entry = next(tmp_path.glob("*/*.html.gz"))
+    old = time.time() - 120
+    os.utime(entry, (old, old))
+    assert cache.get("https://www.xing.com/jobs/1", options) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.expired == 1
+
+
+def test_html_cache_evicts_least_recently_used(tmp_path):
+    """Method under test: crawling.html_cache.HtmlCache.put"""
+    HtmlCache = require_attr("crawling.html_cache", "HtmlCache")
+    cache = HtmlCache(root=tmp_path, max_bytes=1)
+    cache.put("https://a.de/1", None, "first")
+    cache.put("https://a.de/2", None, "second")
+    assert cache.stats.evictions >= 1
+    assert len(list(tmp_path.glob("*/*.html.gz"))) <= 1
+
+
+def test_normalize_url_sorts_query_and_drops_fragment():
+    """Method under test: crawling.html_cache.normalize_url"""
+    normalize_url = require_attr("crawling.html_cache", "normalize_url")
+    assert normalize_url("HTTPS://Example.com:443/a?b=2&a=1#x") == "https://example.com/a?a=1&b=2"
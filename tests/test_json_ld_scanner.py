@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+
+from conftest import require_attr
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_pages"
+
+_TRICKY = (
+    "<html><head>"
+    '<!-- <script type="application/ld+json">{"@type": "Commented"}</script> -->'
+    "<script>var s = '<script type=\"application/ld+json\">';</script>"
+    "<SCRIPT Type='application/ld+json' data-x=\"a>b\">\n {\"@type\": \"JobPosting\", \"title\": \"ü\"} </SCRIPT>"
+    '<script type="application/json">{"@type": "Other"}</script>'
+    '<script type=application/ld+json>{"@type": "Organization"}</script >'
+    "</head><body><p>x</p></body></html>"
+)
+
+
+@pytest.mark.parametrize("html", [_TRICKY] + [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.html"))])
+def test_scan_json_ld_scripts_matches_dom(html):
+    """Method under test: parsing.json_ld_scanner.scan_json_ld_scripts"""
+    scan_json_ld_scripts = require_attr("parsing.json_ld_scanner", "scan_json_ld_scripts")
+    parse_html = require_attr("parsing.backends", "parse_html")
+
+    expected = parse_html(html, "html.parser").script_texts("application/ld+json")
+    assert scan_json_ld_scripts(html) == expected
+    assert scan_json_ld_scripts(html.encode("utf-8")) == expected
+
+
+def test_malformed_markup_falls_back_to_dom():
+    """Method under test: parsing.parsed_page.ParsedPage.json_ld_texts"""
+    scan_json_ld_scripts = require_attr("parsing.json_ld_scanner", "scan_json_ld_scripts")
+    ParsedPage = require_attr("parsing.parsed_page", "ParsedPage")
+    html = '<script type="application/ld+json">{"@type": "JobPosting"}</script><!-- unterminated'
+
+    assert scan_json_ld_scripts(html) is None
+    page = ParsedPage(html, backend="html.parser")
+    assert page.json_ld == [{"@type": "JobPosting"}]
+    assert "document" in page.__dict__
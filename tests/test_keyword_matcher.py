@@ -0,0 +1,24 @@
+from conftest import require_attr
+
+
+def test_keyword_matcher_finds_overlapping_folded_matches():
+    """Method under test: parsing.keyword_matcher.KeywordMatcher.occurrences"""
+    KeywordMatcher = require_attr("parsing.keyword_matcher", "KeywordMatcher")
+    matcher = KeywordMatcher(["Python", "py", " python ", "", "STRASSE"])
+    text = "PyPython, Straße und python_3"
+
+    assert matcher.keywords == ("python", "py", "strasse")
+    assert matcher.occurrences(text) == [[2, 22], [0, 2, 22], [10]]
+    assert matcher.score("nothing here") == 0
+
+    exact = KeywordMatcher(["Python", "py"], case_fold=False, word_boundary=True)
+    assert exact.occurrences(text) == [[], []]
+    assert exact.occurrences("py, Python.") == [[4], [0]]
+
+
+def test_compile_keywords_is_cached():
+    """Method under test: parsing.keyword_matcher.compile_keywords"""
+    compile_keywords = require_attr("parsing.keyword_matcher", "compile_keywords")
+
+    assert compile_keywords(("python", "sql")) is compile_keywords(("python", "sql"))
+    assert compile_keywords(("python",), word_boundary=True) is not compile_keywords(("python",))
@@ -0,0 +1,36 @@
+import json
+from html import escape
+
+from conftest import require_attr
+
+
+_JOB = {"included": [{"$type": "com.linkedin.voyager.dash.jobs.JobPosting", "description": {"text": "Data role"}}]}
+
+
+def _code(payload, attrs=""):
+    return f"<code{attrs}>{escape(json.dumps(payload))}</code>"
+
+
+def test_load_payload_skips_unmarked_and_broken_blocks():
+    """Method under test: job_detail_parser.load_payload_from_html"""
+    load_payload_from_html = require_attr("job_detail_parser", "load_payload_from_html")
+    mention = {"note": "com.linkedin.voyager.dash.jobs.JobPosting", "included": []}
+    html = (
+        "<html><body>"
+        + _code({"included": [{"$type": "com.linkedin.voyager.dash.feed.Update"}]}, ' style="display: none"')
+        + _code(mention)
+        + "<code>{com.linkedin.voyager.dash.jobs.JobPosting</code>"
+        + "<p>com.linkedin.voyager.dash.jobs.JobPosting</p>"
+        + _code(_JOB, ' id="bpr-guid-3"')
+        + "</body></html>"
+    )
+
+    assert load_payload_from_html(html) == _JOB
+
+
+def test_load_payload_falls_back_to_dom_for_nested_markup():
+    """Method under test: job_detail_parser.extract_description_linkedin"""
+    extract_description_linkedin = require_attr("job_detail_parser", "extract_description_linkedin")
+    body = escape(json.dumps(_JOB)).replace("Data", "<span></span>Data")
+
+    assert extract_description_linkedin(f"<code>{body}</code>") == "Data role"
@@ -9,3 +9,53 @@ def test_fetch_linkedin_job_urls_empty_result():
     urls = fetch_linkedin_job_urls(query)
     assert isinstance(urls, list)
 
+
+def test_collect_linkedin_job_urls_paginates_dedups_and_keeps_partial_results():
+    """Method under test: integrations.linkedin_scraper.collect_linkedin_job_urls"""
+    import asyncio
+
+    collect_linkedin_job_urls = require_attr("integrations.linkedin_scraper", "collect_linkedin_job_urls")
+    JobQuery = require_attr("domain.models", "JobQuery")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+
+    class _Session:
+        def __init__(self):
+            self.reserved = 0
+            self.in_flight = 0
+            self.peak = 0
+            self.visited = []
+
+        def run(self, coro):
+            return asyncio.run(coro)
+
+        async def reserve_pages_async(self, count):
+            self.reserved = count
+
+        async def search_job_urls_async(self, url):
+            self.visited.append(url)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            start = int(url.split("start=")[1]) if "start=" in url else 0
+            if "java" in url:
+                raise RuntimeError("login wall")
+            if start >= 50:
+                return []
+            return [f"https://www.linkedin.com/jobs/view/{start}", "https://www.linkedin.com/jobs/view/shared"]
+
+    session = _Session()
+    limiter = RateLimiter(enabled=False)
+    queries = [JobQuery(keywords=["python"], location="berlin"), JobQuery(keywords=["java"], location="berlin")]
+    result = collect_linkedin_job_urls(queries, max_pages=5, concurrency=2, session=session, rate_limiter=limiter)
+
+    assert result.urls == [
+        "https://www.linkedin.com/jobs/view/0",
+        "https://www.linkedin.com/jobs/view/shared",
+        "https://www.linkedin.com/jobs/view/25",
+    ]
+    assert session.reserved == 2 and session.peak <= 2
+    assert len(result.errors) == 5
+    assert 3 <= result.pages_fetched <= 4
+    assert set(result.page_times_s) == set(session.visited)
+    assert limiter.snapshot()["www.linkedin.com"]["requests"] == len(session.visited)
@@ -0,0 +1,132 @@
+import sys
+import types
+
+from conftest import require_attr
+
+
+def _install_fake_linkedin_scraper(monkeypatch, tmp_path, events):
+    module = types.ModuleType("linkedin_scraper")
+
+    class _Page:
+        def __init__(self):
+            self.url = "https://www.linkedin.com/feed/"
+            self.context = self
+
+        async def new_page(self):
+            return _Page()
+
+        async def content(self):
+            return "<html></html>"
+
+    class BrowserManager:
+        def __init__(self, headless=True):
+            self.page = _Page()
+
+        async def __aenter__(self):
+            events.append("launch")
+            return self
+
+        async def __aexit__(self, *exc):
+            events.append("shutdown")
+
+        async def load_session(self, path):
+            events.append("load_session")
+
+        async def save_session(self, path):
+            events.append("save_session")
+
+    class JobScraper:
+        def __init__(self, page):
+            self.page = page
+
+        async def scrape(self, url):
+            if url.endswith("expired") and events.count("login") < 2:
+                self.page.url = "https://www.linkedin.com/authwall?x=1"
+            elif url.endswith("walled") and events.count("login") < 2:
+                self.page.url = "https://www.linkedin.com/login"
+                raise RuntimeError("job description not found")
+            else:
+                self.page.url = url
+            return types.SimpleNamespace(job_description=f"desc {url}")
+
+    async def login_with_cookie(page, cookie):
+        events.append("login")
+
+    module.BrowserManager = BrowserManager
+    module.JobScraper = JobScraper
+    module.login_with_cookie = login_with_cookie
+    module.login_with_credentials = login_with_cookie
+    module.load_credentials_from_env = lambda: (None, None)
+    monkeypatch.setitem(sys.modules, "linkedin_scraper", module)
+    monkeypatch.setenv("LINKEDIN_COOKIE", "li_at=abc")
+    monkeypatch.setenv("LINKEDIN_SESSION_PATH", str(tmp_path / "session.json"))
+
+
+def test_linkedin_session_logs_in_once_and_refreshes_on_login_wall(monkeypatch, tmp_path):
+    """Method under test: integrations.linkedin_session.LinkedInSession.scrape_job"""
+    LinkedInSession = require_attr("integrations.linkedin_session", "LinkedInSession")
+    events = []
+    _install_fake_linkedin_scraper(monkeypatch, tmp_path, events)
+
+    session = LinkedInSession(pages=2)
+    try:
+        first = session.scrape_job("https://www.linkedin.com/jobs/view/1")
+        second = session.scrape_job("https://www.linkedin.com/jobs/view/2")
+        assert events.count("launch") == 1
+        assert events.count("login") == 1
+
+        refreshed = session.scrape_job("https://www.linkedin.com/jobs/view/expired")
+    finally:
+        session.close()
+
+    assert first == "desc https://www.linkedin.com/jobs/view/1"
+    assert second.endswith("/2")
+    assert refreshed.endswith("expired")
+    assert events.count("login") == 2
+    assert events[-1] == "shutdown"
+
+
+def test_linkedin_session_logs_in_again_when_scraper_fails_on_login_wall(monkeypatch, tmp_path):
+    """Method under test: integrations.linkedin_session.LinkedInSession.scrape_job"""
+    LinkedInSession = require_attr("integrations.linkedin_session", "LinkedInSession")
+    events = []
+    _install_fake_linkedin_scraper(monkeypatch, tmp_path, events)
+
+    session = LinkedInSession()
+    try:
+        assert session.scrape_job("https://www.linkedin.com/jobs/view/walled").endswith("walled")
+    finally:
+        session.close()
+
+    assert events.count("login") == 2
+
+
+def test_linkedin_session_shuts_down_browser_when_login_fails(monkeypatch, tmp_path):
+    """Method under test: integrations.linkedin_session.LinkedInSession.scrape_job"""
+    import pytest
+
+    LinkedInSession = require_attr("integrations.linkedin_session", "LinkedInSession")
+    events = []
+    _install_fake_linkedin_scraper(monkeypatch, tmp_path, events)
+
+    async def _failing_login(page, cookie):
+        raise RuntimeError("cookie rejected")
+
+    monkeypatch.setattr(sys.modules["linkedin_scraper"], "login_with_cookie", _failing_login)
+    session = LinkedInSession()
+    try:
+        with pytest.raises(RuntimeError, match="cookie rejected"):
+            session.scrape_job("https://www.linkedin.com/jobs/view/1")
+        assert events == ["launch", "shutdown"]
+        assert not session.is_open
+    finally:
+        session.close()
+
+
+def test_login_wall_requires_a_linkedin_host():
+    """Method under test: integrations.linkedin_session._is_login_wall"""
+    _is_login_wall = require_attr("integrations.linkedin_session", "_is_login_wall")
+
+    assert _is_login_wall("https://www.linkedin.com/authwall?trk=x")
+    assert not _is_login_wall("https://www.linkedin.com/jobs/view/1")
+    assert not _is_login_wall("https://www.stepstone.de/login?ref=linkedin.com")
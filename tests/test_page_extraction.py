@@ -0,0 +1,49 @@
+import pytest
+
+from conftest import require_attr
+
+
+def test_extract_from_html_modes():
+    """Method under test: crawling.page_extraction.extract_from_html"""
+    extract_from_html = require_attr("crawling.page_extraction", "extract_from_html")
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+    base = "https://www.stepstone.de/jobs/python"
+    html = (
+        '<script type="application/ld+json">{"@type": "JobPosting"}</script>'
+        '<a href="/stellenangebote--x/jobs/1">a</a><a href="/jobs/1#top">b</a>'
+        '<a href="https://other.de/jobs/2">c</a><a href="/about">d</a>'
+        '<iframe id="f" src="/frame"></iframe><h1>  Senior\n  Engineer </h1>'
+    )
+    site = detect_site(base)
+
+    assert extract_from_html(html, "json-ld", base, site) == ['{"@type": "JobPosting"}']
+    assert extract_from_html(html, "links", base, site) == [
+        "https://www.stepstone.de/stellenangebote--x/jobs/1",
+        "https://www.stepstone.de/jobs/1#top",
+    ]
+    assert extract_from_html(html, "iframe-src", base, site, "iframe#f") == "https://www.stepstone.de/frame"
+    assert extract_from_html(html, "text", base, site, "h1") == "Senior Engineer"
+    with pytest.raises(ValueError):
+        extract_from_html(html, "text", base, site, "h2")
+
+
+def test_extract_in_page_passes_site_job_rule():
+    """Method under test: crawling.page_extraction.extract_in_page"""
+    extract_in_page = require_attr("crawling.page_extraction", "extract_in_page")
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+
+    class _Frame:
+        def __init__(self):
+            self.args = []
+
+        def evaluate(self, script, arg=None):
+            self.args.append(arg)
+            return ["https://accso.de/dabei-sein/jobs/1"]
+
+    frame = _Frame()
+    urls = extract_in_page(frame, "links", detect_site("https://accso.de/dabei-sein/jobs"))
+
+    assert urls == ["https://accso.de/dabei-sein/jobs/1"]
+    assert frame.args == [["accso.de", "/dabei-sein/jobs/"]]
+    with pytest.raises(ValueError):
+        extract_in_page(frame, "text", None)
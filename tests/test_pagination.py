@@ -0,0 +1,184 @@
+from itertools import islice
+
+from conftest import require_attr
+
+
+def _linkedin_session(pages):
+    """Return a real LinkedInSession whose browser work is replaced by `pages`."""
+
+    LinkedInSession = require_attr("integrations.linkedin_session", "LinkedInSession")
+
+    class _LinkedInSession(LinkedInSession):
+        def __init__(self):
+            super().__init__()
+            self.visited = []
+
+        async def _reserve_pages(self, count):
+            pass
+
+        async def _search_job_urls(self, url):
+            self.visited.append(url)
+            start = int(url.split("start=")[1]) if "start=" in url else 0
+            index = start // 25
+            return pages[index] if index < len(pages) else []
+
+    return _LinkedInSession()
+
+
+def test_page_url_per_site_scheme():
+    """Method under test: crawling.pagination.page_url"""
+    page_url = require_attr("crawling.pagination", "page_url")
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+    linkedin = "https://www.linkedin.com/jobs/search/?keywords=python"
+    stepstone = "https://www.stepstone.de/jobs/python/in-berlin?radius=30"
+    accso = "https://accso.de/dabei-sein/jobs"
+
+    assert page_url(linkedin, detect_site(linkedin), 0) == linkedin
+    assert page_url(linkedin, detect_site(linkedin), 2).endswith("start=50")
+    assert page_url(stepstone, detect_site(stepstone), 1).endswith("radius=30&page=2")
+    assert page_url(accso, detect_site(accso), 1) is None
+
+
+def test_iter_job_listings_interleaves_and_stops_lazily():
+    """Method under test: pipeline.job_ingest_pipeline.iter_job_listings"""
+    iter_job_listings = require_attr("pipeline.job_ingest_pipeline", "iter_job_listings")
+    JobQuery = require_attr("domain.models", "JobQuery")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+
+    class _Client:
+        archive = None
+
+        def __init__(self):
+            self.fetched = []
+
+        def extract(self, url, mode, selector=None, frame_selector=None, wait_jobposting=False, use_cache=True):
+            self.fetched.append(url)
+            page = len([u for u in self.fetched if u.split("?")[0] == url.split("?")[0]])
+            if "stepstone" in url:
+                return [f"https://www.stepstone.de/jobs/s{page}-{i}" for i in range(2)]
+            return []
+
+    client = _Client()
+    client.linkedin_session = _linkedin_session([])
+    client.rate_limiter = RateLimiter(enabled=False)
+    query = JobQuery(keywords=["python"], location="berlin")
+    listings = list(islice(iter_job_listings(query, client), 3))
+
+    assert [item.source for item in listings] == ["stepstone"] * 3
+    stepstone_pages = [u for u in client.fetched if "stepstone" in u]
+    assert len(stepstone_pages) == 2
+    client.linkedin_session.close()
+
+
+def test_iter_job_listings_collects_linkedin_through_rate_limited_session():
+    """Method under test: pipeline.job_ingest_pipeline.iter_job_listings"""
+    iter_job_listings = require_attr("pipeline.job_ingest_pipeline", "iter_job_listings")
+    JobQuery = require_attr("domain.models", "JobQuery")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+
+    class _Client:
+        archive = None
+
+        def extract(self, url, mode, selector=None, frame_selector=None, wait_jobposting=False, use_cache=True):
+            assert "linkedin" not in url
+            return []
+
+    view = "https://www.linkedin.com/jobs/view/{}"
+    client = _Client()
+    client.linkedin_session = _linkedin_session([[view.format(1)], [view.format(2), view.format(1)], [view.format(3)]])
+    client.rate_limiter = RateLimiter(enabled=False)
+    query = JobQuery(keywords=["python"], location="berlin")
+
+    listings = list(islice(iter_job_listings(query, client), 2))
+
+    assert [item.url for item in listings] == [view.format(1), view.format(2)]
+    assert len(client.linkedin_session.visited) == 2
+    assert client.rate_limiter.snapshot()["www.linkedin.com"]["requests"] == 2
+    client.linkedin_session.close()
+
+
+def test_iter_job_listings_collects_linkedin_while_a_loop_is_running():
+    """Method under test: pipeline.job_ingest_pipeline.iter_job_listings"""
+    import asyncio
+
+    iter_job_listings = require_attr("pipeline.job_ingest_pipeline", "iter_job_listings")
+    JobQuery = require_attr("domain.models", "JobQuery")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+
+    class _Client:
+        archive = None
+
+        def extract(self, url, mode, selector=None, frame_selector=None, wait_jobposting=False, use_cache=True):
+            return []
+
+    view = "https://www.linkedin.com/jobs/view/{}"
+    client = _Client()
+    client.linkedin_session = _linkedin_session([[view.format(1)]])
+    client.rate_limiter = RateLimiter(enabled=False)
+    query = JobQuery(keywords=["python"], location="berlin")
+
+    # Sync Playwright leaves its dispatcher loop set as the thread's running loop.
+    loop = asyncio.new_event_loop()
+    asyncio._set_running_loop(loop)
+    try:
+        listings = list(islice(iter_job_listings(query, client), 1))
+    finally:
+        asyncio._set_running_loop(None)
+        loop.close()
+        client.linkedin_session.close()
+
+    assert [item.url for item in listings] == [view.format(1)]
+
+
+def test_search_pages_do_not_wait_for_jobposting(monkeypatch, fake_sync_api):
+    """Method under test: pipeline.job_ingest_pipeline.iter_job_listings"""
+    from contextlib import contextmanager
+
+    iter_job_listings = require_attr("pipeline.job_ingest_pipeline", "iter_job_listings")
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+    JobQuery = require_attr("domain.models", "JobQuery")
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+
+    class _Frame:
+        url = "https://jobs.accso.de/list"
+
+        def wait_for_load_state(self, state):
+            pass
+
+        def evaluate(self, script, arg=None):
+            return []
+
+    class _Element:
+        def content_frame(self):
+            return _Frame()
+
+    class _Page(_Frame):
+        def __init__(self):
+            self.visited = []
+
+        def set_default_timeout(self, timeout):
+            pass
+
+        def goto(self, url, wait_until=None):
+            self.visited.append(url)
+
+        def wait_for_selector(self, selector, state=None):
+            return _Element()
+
+    page = _Page()
+
+    @contextmanager
+    def fake_page(self):
+        yield page
+
+    waits = []
+    monkeypatch.setattr(PlaywrightClient, "_page", fake_page)
+    monkeypatch.setattr("crawling.playwright_client.wait_for_jobposting", lambda *args: waits.append(args))
+    client = PlaywrightClient(rate_limiter=RateLimiter(enabled=False), linkedin_session=_linkedin_session([]))
+    try:
+        assert list(iter_job_listings(JobQuery(keywords=["python"], location="berlin"), client)) == []
+    finally:
+        client.linkedin_session.close()
+
+    assert any("xing" in url for url in page.visited) and any("stepstone" in url for url in page.visited)
+    assert waits == []
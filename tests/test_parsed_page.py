@@ -0,0 +1,41 @@
+from conftest import require_attr, require_module
+
+
+def test_parsed_page_is_parsed_once_across_extractors(monkeypatch):
+    """Method under test: parsing.parsed_page.ParsedPage"""
+    ParsedPage = require_attr("parsing.parsed_page", "ParsedPage")
+    parsed_page = require_module("parsing.parsed_page")
+    extractors = require_module("parsing.html_extractors")
+    extract_from_html = require_attr("crawling.page_extraction", "extract_from_html")
+    extract_iframe_src = require_attr("crawling.playwright_client", "extract_iframe_src")
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+
+    calls = []
+    original = parsed_page.parse_html
+    monkeypatch.setattr(parsed_page, "parse_html", lambda html, backend=None: calls.append(1) or original(html, backend))
+
+    base = "https://www.stepstone.de/jobs/python"
+    page = ParsedPage(
+        '<script type="application/ld+json">{"@type": "JobPosting", "title": "Dev"}</script>'
+        '<div id="d">Python developer role</div><a href=" /jobs/1 ">a</a><a href="">b</a>'
+        '<iframe id="f" src="/frame"></iframe>'
+    )
+
+    assert calls == []
+    assert extractors.extract_json_ld_jobposting(page)["title"] == "Dev"
+    assert extractors.extract_text_by_selector(page, "#d") == "Python developer role"
+    assert extractors.extract_description_by_keywords(page, ["python"]) == "Python developer role"
+    assert extract_from_html(page, "links", base, detect_site(base)) == ["https://www.stepstone.de/jobs/1"]
+    assert extract_iframe_src(page, "iframe#f", base) == "https://www.stepstone.de/frame"
+    assert page.anchors == ["/jobs/1"]
+    assert calls == [1]
+
+
+def test_parse_job_detail_accepts_parsed_page():
+    """Method under test: parsing.job_detail_parser.parse_job_detail"""
+    parse_job_detail = require_attr("parsing.job_detail_parser", "parse_job_detail")
+    ParsedPage = require_attr("parsing.parsed_page", "ParsedPage")
+    page = ParsedPage("<main><p>Python role</p></main>", backend="html.parser")
+
+    assert parse_job_detail(page, "generic", ["python"], None).description == "Python role"
+    assert page.document.backend == "html.parser"
@@ -0,0 +1,70 @@
+from pathlib import Path
+
+import pytest
+
+from conftest import require_attr
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_pages"
+
+
+def _other_backends():
+    available_backends = require_attr("parsing.backends", "available_backends")
+    return [name for name in available_backends() if name != "html.parser"]
+
+
+def _extract_all(html, backend):
+    extractors = "parsing.html_extractors"
+    extract_json_ld_jobposting = require_attr(extractors, "extract_json_ld_jobposting")
+    extract_text_by_selector = require_attr(extractors, "extract_text_by_selector")
+    extract_description_by_keywords = require_attr(extractors, "extract_description_by_keywords")
+    parse_html = require_attr("parsing.backends", "parse_html")
+
+    document = parse_html(html, backend)
+    return {
+        "json_ld": extract_json_ld_jobposting(html, backend),
+        "first_div": extract_text_by_selector(html, "body div", backend),
+        "keywords": extract_description_by_keywords(html, ["python", "profil", "aufgaben"], backend),
+        # Extractors skip empty blocks (e.g. <template> content, which lexbor drops).
+        "blocks": [
+            text for text in (node.text() for node in document.select("main, section, article, div")) if text
+        ],
+        "code": [node.text("") for node in document.select("code")],
+        "links": [node.attr("href") for node in document.select("a[href]")],
+        "text": " ".join(document.text().split()),
+    }
+
+
+@pytest.mark.parametrize("page", sorted(path.name for path in FIXTURES.glob("*.html")))
+def test_backends_extract_the_same_as_html_parser(page):
+    """Methods under test: parsing.backends.parse_html, parsing.html_extractors.*"""
+    backends = _other_backends()
+    if not backends:
+        pytest.skip("Only html.parser is installed")
+    html = (FIXTURES / page).read_text(encoding="utf-8")
+    expected = _extract_all(html, "html.parser")
+    for backend in backends:
+        assert _extract_all(html, backend) == expected, backend
+
+
+def test_backends_keep_deeply_nested_content():
+    """Methods under test: parsing.backends.parse_html, parsing.html_extractors.*"""
+    backends = _other_backends()
+    if not backends:
+        pytest.skip("Only html.parser is installed")
+    # Deeper than libxml2's default limit (256) and Python's recursion limit.
+    opening = "".join(f"<div><span>Layer {i}</span>" for i in range(1200))
+    content = "".join(f"<p>Aufgaben {i}: Python und SQL.</p>" for i in range(20))
+    html = f"<html><body>{opening}{content}{'</div>' * 1200}</body></html>"
+    expected = _extract_all(html, "html.parser")
+    assert expected["text"].count("Aufgaben") == 20
+    for backend in backends:
+        assert _extract_all(html, backend) == expected, backend
+
+
+def test_resolve_backend_rejects_unknown_and_honours_env(monkeypatch):
+    """Method under test: parsing.backends.resolve_backend"""
+    resolve_backend = require_attr("parsing.backends", "resolve_backend")
+    monkeypatch.setenv("HTML_PARSER_BACKEND", "html.parser")
+    assert resolve_backend() == "html.parser"
+    with pytest.raises(ValueError):
+        resolve_backend("html5lib")
@@ -9,3 +9,116 @@ def test_playwright_client_fetch_mocked(monkeypatch):
     html = client.fetch("https://example.com")
     assert html.startswith("<")
 
+
+def test_fetch_iframe_uses_single_parent_navigation(monkeypatch, fake_sync_api):
+    """Method under test: crawling.playwright_client.PlaywrightClient.fetch_iframe"""
+    from contextlib import contextmanager
+
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+
+    class _Frame:
+        url = "https://jobs.accso.de/job/1"
+
+        def wait_for_load_state(self, state):
+            pass
+
+        def content(self):
+            return "<html>iframe body</html>"
+
+    class _Element:
+        def content_frame(self):
+            return _Frame()
+
+    class _Page:
+        def __init__(self):
+            self.visited = []
+
+        def set_default_timeout(self, timeout):
+            pass
+
+        def goto(self, url, wait_until=None):
+            self.visited.append(url)
+
+        def wait_for_selector(self, selector, state=None):
+            return _Element()
+
+    page = _Page()
+
+    @contextmanager
+    def fake_page(self):
+        yield page
+
+    monkeypatch.setattr(PlaywrightClient, "_page", fake_page)
+    client = PlaywrightClient(block_resources=False)
+    html = client.fetch_iframe("https://accso.de/dabei-sein/jobs/1", "iframe#jobFrame")
+    assert html == "<html>iframe body</html>"
+    assert page.visited == ["https://accso.de/dabei-sein/jobs/1"]
+
+
+def test_extract_runs_inside_iframe(monkeypatch, fake_sync_api):
+    """Method under test: crawling.playwright_client.PlaywrightClient.extract"""
+    from contextlib import contextmanager
+
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+
+    class _Frame:
+        url = "https://jobs.accso.de/list"
+
+        def wait_for_load_state(self, state):
+            pass
+
+        def evaluate(self, script, arg=None):
+            return ["https://accso.de/dabei-sein/jobs/7"]
+
+    class _Element:
+        def content_frame(self):
+            return _Frame()
+
+    class _Page:
+        def set_default_timeout(self, timeout):
+            pass
+
+        def goto(self, url, wait_until=None):
+            pass
+
+        def wait_for_selector(self, selector, state=None):
+            return _Element()
+
+        def content(self):
+            raise AssertionError("extract must not serialize the page")
+
+    @contextmanager
+    def fake_page(self):
+        yield _Page()
+
+    monkeypatch.setattr(PlaywrightClient, "_page", fake_page)
+    client = PlaywrightClient(block_resources=False)
+    urls = client.extract("https://accso.de/dabei-sein/jobs", "links", frame_selector="iframe#jobFrame")
+    assert urls == ["https://accso.de/dabei-sein/jobs/7"]
+
+
+def test_extract_without_cache_always_refetches(monkeypatch, tmp_path):
+    """Method under test: crawling.playwright_client.PlaywrightClient.extract"""
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+    HtmlCache = require_attr("crawling.html_cache", "HtmlCache")
+
+    results = iter([["https://example.com/jobs/1"], ["https://example.com/jobs/2"]])
+    monkeypatch.setattr(PlaywrightClient, "_extract_playwright", lambda self, *args: next(results))
+    client = PlaywrightClient(cache=HtmlCache(root=tmp_path, ttl_seconds=3600))
+
+    url = "https://example.com/jobs?page=1"
+    assert client.extract(url, "links", use_cache=False) == ["https://example.com/jobs/1"]
+    assert client.extract(url, "links", use_cache=False) == ["https://example.com/jobs/2"]
+    assert not list(tmp_path.rglob("*.html.gz"))
+
+
+def test_fetch_routes_to_linkedin_by_host_not_substring(monkeypatch):
+    """Method under test: crawling.playwright_client.PlaywrightClient.fetch"""
+    PlaywrightClient = require_attr("crawling.playwright_client", "PlaywrightClient")
+
+    monkeypatch.setattr(PlaywrightClient, "_fetch_linkedin_scraper", lambda self, url: "linkedin")
+    monkeypatch.setattr(PlaywrightClient, "_fetch_playwright", lambda self, url, wait_for, wait_jobposting: "browser")
+    client = PlaywrightClient()
+
+    assert client.fetch("https://www.stepstone.de/stellenangebote--x.html?utm_source=linkedin.com") == "browser"
+    assert client.fetch("https://de.linkedin.com/jobs/view/1") == "linkedin"
@@ -0,0 +1,18 @@
+import subprocess
+import sys
+
+from conftest import require_attr
+
+
+def test_child_tree_rss_counts_child_processes():
+    """Method under test: crawling.process_memory.child_tree_rss_bytes"""
+    child_tree_rss_bytes = require_attr("crawling.process_memory", "child_tree_rss_bytes")
+    before = child_tree_rss_bytes()
+    if before is None:
+        return
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        assert child_tree_rss_bytes() > before
+    finally:
+        child.kill()
+        child.wait()
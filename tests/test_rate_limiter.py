@@ -0,0 +1,52 @@
+from conftest import require_attr
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_rate_limiter_token_bucket_spacing():
+    """Method under test: crawling.rate_limiter.RateLimiter.acquire"""
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+    clock = _Clock()
+    limiter = RateLimiter(default_rate=2.0, default_burst=1, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("https://example.org/a") == 0
+    assert limiter.acquire("https://example.org/b") == 0.5
+    assert limiter.acquire("https://other.org/a") == 0
+
+
+def test_rate_limiter_slows_down_and_recovers():
+    """Methods under test: crawling.rate_limiter.RateLimiter.record_response/current_rates"""
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+    clock = _Clock()
+    limiter = RateLimiter(default_rate=2.0, clock=clock, sleep=clock.sleep)
+    url = "https://example.org/jobs"
+
+    limiter.acquire(url)
+    limiter.record_response(url, 429)
+    assert limiter.current_rates()["example.org"] == 1.0
+    assert limiter.acquire(url) >= 2.0
+
+    for _ in range(50):
+        limiter.record_response(url, 200)
+    assert limiter.current_rates()["example.org"] == 2.0
+
+
+def test_rate_limiter_disabled_never_waits():
+    """Method under test: crawling.rate_limiter.RateLimiter.acquire"""
+    RateLimiter = require_attr("crawling.rate_limiter", "RateLimiter")
+    clock = _Clock()
+    limiter = RateLimiter(default_rate=1.0, default_burst=1, clock=clock, sleep=clock.sleep, enabled=False)
+
+    assert [limiter.acquire("https://example.org/a") for _ in range(5)] == [0.0] * 5
+    assert limiter.snapshot()["example.org"]["requests"] == 5
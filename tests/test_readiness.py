@@ -0,0 +1,60 @@
+from conftest import require_attr
+
+
+def test_readiness_tracker_learns_site_deadline():
+    """Methods under test: crawling.readiness.ReadinessTracker.deadline_ms/record"""
+    ReadinessTracker = require_attr("crawling.readiness", "ReadinessTracker")
+    tracker = ReadinessTracker(initial_deadline_ms=8000, min_deadline_ms=500, max_deadline_ms=20000)
+
+    assert tracker.deadline_ms("xing") == 8000
+    for elapsed in (200, 400, 600):
+        tracker.record("xing", elapsed, ready=True)
+    tracker.record("xing", 8000, ready=False)
+
+    assert tracker.deadline_ms("xing") == 1800
+    assert tracker.deadline_ms("accso") == 8000
+    assert tracker.snapshot()["xing"] == {"ready": 3, "misses": 1, "deadline_ms": 1800}
+
+
+def test_readiness_tracker_widens_floor_deadline_on_misses():
+    """Method under test: crawling.readiness.ReadinessTracker.record"""
+    ReadinessTracker = require_attr("crawling.readiness", "ReadinessTracker")
+    tracker = ReadinessTracker(min_deadline_ms=1000, max_deadline_ms=20000)
+    for _ in range(20):
+        tracker.record("stepstone", 50, ready=True)
+    assert tracker.deadline_ms("stepstone") == 1000
+
+    deadlines = []
+    for _ in range(6):
+        tracker.record("stepstone", tracker.deadline_ms("stepstone"), ready=False)
+        deadlines.append(tracker.deadline_ms("stepstone"))
+    assert deadlines == [2000, 4000, 8000, 16000, 20000, 20000]
+
+    tracker.record("stepstone", 6000, ready=True)
+    assert 1000 < tracker.deadline_ms("stepstone") < 20000
+
+
+def test_wait_for_jobposting_uses_deadline_and_records_outcome():
+    """Method under test: crawling.readiness.wait_for_jobposting"""
+    ReadinessTracker = require_attr("crawling.readiness", "ReadinessTracker")
+    wait_for_jobposting = require_attr("crawling.readiness", "wait_for_jobposting")
+
+    class _Page:
+        def __init__(self, result):
+            self.result = result
+            self.deadlines = []
+
+        def evaluate(self, script, deadline):
+            self.deadlines.append(deadline)
+            if isinstance(self.result, Exception):
+                raise self.result
+            return self.result
+
+    tracker = ReadinessTracker(initial_deadline_ms=8000)
+    ready_page = _Page(True)
+    assert wait_for_jobposting(ready_page, tracker, "xing", timeout_ms=5000) is True
+    assert ready_page.deadlines == [5000]
+
+    broken_page = _Page(RuntimeError("Execution context was destroyed"))
+    assert wait_for_jobposting(broken_page, tracker, "xing", timeout_ms=5000) is False
+    assert tracker.snapshot()["xing"]["misses"] == 1
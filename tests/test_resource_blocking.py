@@ -0,0 +1,51 @@
+from conftest import require_attr
+
+
+def test_resource_policy_blocks_types_and_hosts():
+    """Method under test: crawling.resource_blocking.ResourcePolicy.should_block"""
+    ResourcePolicy = require_attr("crawling.resource_blocking", "ResourcePolicy")
+    policy = ResourcePolicy(
+        blocked_resource_types=("image", "font"),
+        blocked_hosts=("doubleclick.net",),
+        allowed_hosts=("cdn.stepstone.de",),
+    )
+    assert policy.should_block("https://www.stepstone.de/logo.png", "image")
+    assert policy.should_block("https://stats.g.doubleclick.net/collect", "xhr")
+    assert not policy.should_block("https://cdn.stepstone.de/logo.png", "image")
+    assert not policy.should_block("https://www.stepstone.de/jobs/1", "document")
+    assert not policy.should_block("https://www.stepstone.de/app.js", "script")
+
+
+def test_route_handler_counts_blocked_bytes():
+    """Method under test: crawling.resource_blocking.make_route_handler"""
+    ResourcePolicy = require_attr("crawling.resource_blocking", "ResourcePolicy")
+    BlockingStats = require_attr("crawling.resource_blocking", "BlockingStats")
+    make_route_handler = require_attr("crawling.resource_blocking", "make_route_handler")
+
+    class _Request:
+        def __init__(self, url, resource_type):
+            self.url = url
+            self.resource_type = resource_type
+
+    class _Route:
+        def __init__(self, url, resource_type):
+            self.request = _Request(url, resource_type)
+            self.outcome = None
+
+        def abort(self):
+            self.outcome = "abort"
+
+        def fallback(self):
+            self.outcome = "fallback"
+
+    stats = BlockingStats()
+    handler = make_route_handler(ResourcePolicy(blocked_resource_types=("image",)), stats)
+    blocked = _Route("https://x.de/a.png", "image")
+    allowed = _Route("https://x.de/", "document")
+    handler(blocked)
+    handler(allowed)
+
+    assert blocked.outcome == "abort"
+    assert allowed.outcome == "fallback"
+    assert stats.requests_blocked == 1
+    assert stats.bytes_saved_estimate > 0
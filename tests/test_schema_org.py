@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from conftest import require_attr
+
+
+def test_job_posting_from_json_ld_maps_fields():
+    """Method under test: parsing.schema_org.job_posting_from_json_ld"""
+    job_posting_from_json_ld = require_attr("parsing.schema_org", "job_posting_from_json_ld")
+    posting = {
+        "@type": "JobPosting",
+        "title": "Data &amp; ML Engineer",
+        "hiringOrganization": {"@type": "Organization", "name": "ACME GmbH"},
+        "jobLocation": [
+            {"@type": "Place", "address": {"addressLocality": "Berlin", "addressCountry": {"name": "DE"}}},
+            {"@type": "Place", "address": {"addressLocality": "Hamburg", "addressCountry": "DE"}},
+        ],
+        "description": "&lt;p&gt;Build &lt;b&gt;pipelines&lt;/b&gt;&lt;/p&gt;",
+        "skills": ["Python, SQL", {"@type": "DefinedTerm", "name": "Spark"}],
+        "responsibilities": "<ul><li>Design ETL</li><li>Own the lakehouse</li></ul>",
+        "qualifications": "- 3+ years Python\n- German B2",
+    }
+
+    job = job_posting_from_json_ld(posting)
+
+    assert (job.jobtitle, job.company_name, job.location) == ("Data & ML Engineer", "ACME GmbH", "Berlin, DE; Hamburg, DE")
+    assert job.job_description == "Build pipelines"
+    assert job.skills == ["Python", "SQL", "Spark"]
+    assert job.futureTasks == ["Design ETL", "Own the lakehouse"]
+    assert job.candidateProfile == "3+ years Python\nGerman B2"
+    remote = job_posting_from_json_ld({"jobLocationType": "TELECOMMUTE"}, description="desc")
+    assert (remote.company_name, remote.location) == ("Unknown", "Remote")
+
+
+def test_parse_job_uses_json_ld_and_llm_skips_filled_fields():
+    """Methods under test: pipeline.job_ingest_pipeline.parse_job, llm.extract_job_info.missing_fields"""
+    parse_job = require_attr("pipeline.job_ingest_pipeline", "parse_job")
+    missing_fields = require_attr("llm.extract_job_info", "missing_fields")
+    html = (Path(__file__).parent / "fixtures" / "job_pages" / "stepstone_job.html").read_text(encoding="utf-8")
+
+    job = parse_job(html, None)
+
+    assert job.company_name == "Beispiel Software GmbH"
+    assert job.location == "Berlin, DE"
+    assert missing_fields(job) == ["futureTasks", "skills", "candidateProfile"]
+    job.skills = ["Python"]
+    assert missing_fields(job) == ["futureTasks", "candidateProfile"]
+
+
+def test_parse_job_falls_back_when_json_ld_description_is_markup_only():
+    """Method under test: pipeline.job_ingest_pipeline.parse_job"""
+    parse_job = require_attr("pipeline.job_ingest_pipeline", "parse_job")
+    SiteConfig = require_attr("crawling.site_registry", "SiteConfig")
+    posting = {"@type": "JobPosting", "title": "Data Engineer", "description": "<p> </p>"}
+    html = (
+        f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+        '<div class="ad">Build pipelines</div><div>Other job text</div>'
+    )
+
+    assert parse_job(html, None).job_description == "Other job text"
+    job = parse_job(html, SiteConfig(name="demo", description_selector=".ad"))
+    assert (job.jobtitle, job.job_description) == ("Data Engineer", "Build pipelines")
@@ -7,3 +7,34 @@ def test_detect_site_known_url():
     config = detect_site("https://www.xing.com/jobs")
     assert config is not None
 
+
+def test_detect_site_matches_registrable_domain_only():
+    """Method under test: crawling.site_registry.detect_site"""
+    detect_site = require_attr("crawling.site_registry", "detect_site")
+
+    assert detect_site("https://www.stepstone.at/stellenangebote--x.html").name == "stepstone"
+    assert detect_site("de.linkedin.com/jobs/view/1").name == "linkedin"
+    assert detect_site("https://example.com/?ref=xing.com") is None
+    assert detect_site("https://xing.example.com/jobs") is None
+    assert detect_site("https://www.stepstone.co.uk/jobs").name == "stepstone"
+    assert detect_site("localhost") is None
+
+
+def test_site_profile_compiles_url_rule_and_ready_selector_once():
+    """Method under test: crawling.site_registry.site_profile"""
+    site_profile = require_attr("crawling.site_registry", "site_profile")
+    SITE_PROFILES = require_attr("crawling.site_registry", "SITE_PROFILES")
+    SiteConfig = require_attr("crawling.site_registry", "SiteConfig")
+    is_job_detail_url = require_attr("crawling.site_registry", "is_job_detail_url")
+    from bs4 import BeautifulSoup
+
+    xing = SITE_PROFILES["xing"].config
+    assert site_profile(xing) is SITE_PROFILES["xing"]
+    assert is_job_detail_url("https://www.xing.com/jobs/berlin-data-123", xing)
+    assert not is_job_detail_url("https://www.xing.com/search?next=/jobs/", xing)
+    assert is_job_detail_url("https://example.com/jobs/1", None)
+
+    site = SiteConfig(name="demo", ready_selector="div.job-ad")
+    ready = site_profile(site).ready_selector
+    assert ready.select_one(BeautifulSoup("<div class='job-ad'>x</div>", "html.parser")) is not None
+    assert site_profile(site) is site_profile(site)
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from conftest import require_attr
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "job_pages"
+_NESTED = (
+    "<html><body><div>Intro <b>python</b><section>Aufgaben: Python &amp; SQL"
+    "<div><p>Data  Engineer</p><template><div>python sql</div></template></div></section>"
+    "<!-- python sql --><article>SQL</article><div><script>python sql</script>Profil</div>"
+    "</div></body></html>"
+)
+_KEYWORDS = [["python"], ["python", "sql"], ["data engineer", "profil"], ["aufgaben", "sql", "python", "profil"]]
+
+
+def _per_node_best(html, keywords, backend):
+    # The pre-index implementation, used as the reference.
+    parse_html = require_attr("parsing.backends", "parse_html")
+    best_text, best_score = "", 0
+    for node in parse_html(html, backend).select("main, section, article, div"):
+        text = " ".join(node.text(" ").split())
+        score = sum(1 for kw in keywords if kw in text.lower()) if text else 0
+        if score > best_score:
+            best_text, best_score = text, score
+    return best_text
+
+
+@pytest.mark.parametrize("html", [_NESTED] + [path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.html"))])
+def test_best_block_matches_per_node_scoring(html):
+    """Method under test: parsing.text_blocks.TextBlockIndex.best_block"""
+    available_backends = require_attr("parsing.backends", "available_backends")
+    ParsedPage = require_attr("parsing.parsed_page", "ParsedPage")
+    compile_keywords = require_attr("parsing.keyword_matcher", "compile_keywords")
+
+    for backend in available_backends():
+        for keywords in _KEYWORDS:
+            best = ParsedPage(html, backend).block_index.best_block(compile_keywords(tuple(keywords)))
+            assert best == _per_node_best(html, keywords, backend), (backend, keywords)
+
+
+def test_text_blocks_view_lists_non_empty_blocks_in_order():
+    """Method under test: parsing.parsed_page.ParsedPage.text_blocks"""
+    ParsedPage = require_attr("parsing.parsed_page", "ParsedPage")
+    page = ParsedPage("<div>a <section> b </section><div></div></div><main>c</main>", backend="html.parser")
+
+    assert page.text_blocks == ["a b", "b", "c"]
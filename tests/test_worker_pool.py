@@ -0,0 +1,85 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+from conftest import require_attr
+
+
+@contextmanager
+def _echo_processor(options):
+    JobPosting = require_attr("domain.models", "JobPosting")
+
+    def _process(listing):
+        if listing.url.endswith("/bad"):
+            raise ValueError("unparseable")
+        marker = Path(listing.url.split("crash=", 1)[-1]) if "crash=" in listing.url else None
+        if marker is not None and not marker.exists():
+            marker.write_text("crashed once")
+            os._exit(3)
+        return JobPosting(company_name="ACME", jobtitle=listing.url, location="Berlin", job_description="x")
+
+    yield _process
+
+
+@contextmanager
+def _slow_processor(options):
+    import time
+
+    JobPosting = require_attr("domain.models", "JobPosting")
+
+    def _process(listing):
+        time.sleep(0.3)
+        return JobPosting(company_name="ACME", jobtitle=listing.url, location="Berlin", job_description="x")
+
+    yield _process
+
+
+@contextmanager
+def _broken_processor(options):
+    raise RuntimeError("Playwright is required")
+    yield
+
+
+def test_run_workers_merges_results_and_requeues_after_crash(tmp_path):
+    """Method under test: pipeline.worker_pool.run_workers"""
+    run_workers = require_attr("pipeline.worker_pool", "run_workers")
+    JobListing = require_attr("domain.models", "JobListing")
+    listings = [JobListing(url=f"https://example.org/jobs/{i}", source="x") for i in range(4)]
+    listings.append(JobListing(url="https://example.org/jobs/bad", source="x"))
+    listings.append(JobListing(url=f"https://example.org/jobs/5?crash={tmp_path / 'marker'}", source="x"))
+
+    results = list(run_workers(listings, workers=2, processor_factory=_echo_processor))
+
+    by_url = {result.listing.url: result for result in results}
+    assert len(results) == len(listings)
+    assert by_url["https://example.org/jobs/0"].posting.jobtitle == "https://example.org/jobs/0"
+    assert by_url["https://example.org/jobs/bad"].error == "ValueError: unparseable"
+    crashed = by_url[listings[-1].url]
+    assert crashed.ok and crashed.attempts == 2
+
+
+def test_run_workers_reports_worker_startup_failure():
+    """Method under test: pipeline.worker_pool.run_workers"""
+    run_workers = require_attr("pipeline.worker_pool", "run_workers")
+    JobListing = require_attr("domain.models", "JobListing")
+    listings = [JobListing(url="https://example.org/jobs/1", source="x")]
+
+    results = list(run_workers(listings, workers=1, processor_factory=_broken_processor))
+
+    assert [result.error for result in results] == ["RuntimeError: Playwright is required"]
+
+
+def test_run_workers_pins_session_site_listings_to_one_worker():
+    """Method under test: pipeline.worker_pool.run_workers"""
+    run_workers = require_attr("pipeline.worker_pool", "run_workers")
+    JobListing = require_attr("domain.models", "JobListing")
+    listings = []
+    for i in range(4):
+        listings.append(JobListing(url=f"https://www.linkedin.com/jobs/view/{i}", source="linkedin"))
+        listings.append(JobListing(url=f"https://www.xing.com/jobs/{i}", source="xing"))
+
+    results = list(run_workers(listings, workers=3, processor_factory=_slow_processor))
+
+    assert all(result.ok for result in results) and len(results) == len(listings)
+    assert len({result.worker_id for result in results}) > 1
+    assert len({result.worker_id for result in results if result.listing.source == "linkedin"}) == 1